@@ -0,0 +1,197 @@
+"""
+This file holds the shared image, sound and font caches used across the game.
+Each (path, size) image is read from disk, converted and scaled
+one time, and every later request gets the same Surface back.
+Sounds and fonts are cached the same way.
+A BackgroundLoader fills the caches on worker threads during startup.
+Hit and miss counts show whether anything was loaded mid-level.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from common import ROOT_PATH
+
+# Font used for almost all game text
+PIXEL_FONT_PATH = os.path.join(ROOT_PATH, "media", "graphics", "font", "Pixeboy.ttf")
+
+# (path, size, alpha) -> Surface, or None if the file could not be loaded
+_images = {}
+
+# path -> Sound, or None if the file could not be loaded
+_sounds = {}
+
+# (path, size) -> Font
+_fonts = {}
+
+# Cache counters (a miss is one disk read)
+_stats = {"hits": 0, "misses": 0}
+
+
+def load_image(path, size=None, alpha=True):
+    """
+    Return the shared Surface for path, scaled to size (w, h) if given.
+    Use alpha=False for opaque images such as backgrounds (faster blits).
+    Returns None (and warns once) if the image cannot be loaded.
+    The returned Surface is shared, so copy it before drawing on it.
+    """
+    key = (path, tuple(size) if size else None, alpha)
+
+    if key in _images:
+        _stats["hits"] += 1
+        return _images[key]
+
+    _stats["misses"] += 1
+
+    try:
+        image = _convert(_read_image(path, key[1]), alpha)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Warning: Could not load {path} - {e}")
+        image = None
+
+    _images[key] = image
+    return image
+
+
+def _read_image(path, size):
+    # Decode and scale. Safe to run on a worker thread.
+    image = pygame.image.load(path)
+    if size:
+        image = pygame.transform.scale(image, size)
+    return image
+
+
+def _convert(image, alpha):
+    # Convert to the display format when a window exists (faster blits).
+    # Needs the display, so this runs on the main thread.
+    if pygame.display.get_surface() is not None:
+        image = image.convert_alpha() if alpha else image.convert()
+    return image
+
+
+def load_sound(path):
+    """
+    Return the shared Sound for path, or None (and warn once) if it
+    cannot be loaded. Set its volume before each play, since it's shared.
+    """
+    if path in _sounds:
+        return _sounds[path]
+
+    try:
+        sound = pygame.mixer.Sound(path)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Warning: Could not load {path} - {e}")
+        sound = None
+
+    _sounds[path] = sound
+    return sound
+
+
+def load_font(size, path=PIXEL_FONT_PATH):
+    """Return the shared Font for (path, size). path=None is pygame's default font."""
+    key = (path, size)
+
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(path, size)
+        _fonts[key] = font
+
+    return font
+
+
+def preload(entries):
+    """Load a list of (path, size) pairs ahead of time."""
+    for path, size in entries:
+        load_image(path, size)
+
+
+def stats():
+    """Return cache counters: hits, misses and number of cached images."""
+    return {"hits": _stats["hits"], "misses": _stats["misses"], "cached": len(_images)}
+
+
+def reset_stats():
+    """Zero the hit/miss counters (cached images are kept)."""
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+
+
+def clear():
+    """Drop every cached image, e.g. after the display mode changes."""
+    _images.clear()
+
+
+# ---------- BACKGROUND LOADING ----------
+class BackgroundLoader:
+    """
+    Decode images and sounds on a thread pool and add them to the caches.
+    images holds (path, size) or (path, size, alpha) entries, sounds holds
+    paths. Call poll() from the main loop: it finishes whatever the workers
+    have decoded (display conversion must happen on the main thread) and
+    returns the share done, 0.0 to 1.0. Anything already cached is skipped.
+    """
+
+    def __init__(self, images=(), sounds=(), workers=4):
+        self._pending = []  # (kind, cache key, future)
+
+        jobs = []
+        for entry in images:
+            path, size = entry[0], entry[1]
+            alpha = entry[2] if len(entry) > 2 else True
+            key = (path, tuple(size) if size else None, alpha)
+            if key not in _images and all(job[1] != key for job in jobs):
+                jobs.append(("image", key, _read_image, (path, key[1])))
+
+        for path in sounds:
+            if path not in _sounds and all(job[1] != path for job in jobs):
+                jobs.append(("sound", path, pygame.mixer.Sound, (path,)))
+
+        self.total = len(jobs)
+        self.done = 0
+
+        self._pool = None
+        if jobs:
+            self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+            for kind, key, work, args in jobs:
+                self._pending.append((kind, key, self._pool.submit(work, *args)))
+            self._pool.shutdown(wait=False)
+
+    def poll(self):
+        """Store finished loads in the caches and return progress (0..1)."""
+        still_loading = []
+
+        for kind, key, future in self._pending:
+            if not future.done():
+                still_loading.append((kind, key, future))
+                continue
+
+            try:
+                result = future.result()
+                if kind == "image":
+                    result = _convert(result, key[2])
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Warning: Could not load {key[0] if kind == 'image' else key} - {e}")
+                result = None
+
+            if kind == "image":
+                _stats["misses"] += 1
+                _images[key] = result
+            else:
+                _sounds[key] = result
+            self.done += 1
+
+        self._pending = still_loading
+        return self.progress()
+
+    def progress(self):
+        """Share of the work finished, 0.0 to 1.0."""
+        return self.done / self.total if self.total else 1.0
+
+    def finished(self):
+        return self.done >= self.total
+
+    def wait(self):
+        """Block until everything is loaded."""
+        for _, _, future in self._pending:
+            future.exception()
+        self.poll()
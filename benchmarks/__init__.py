@@ -0,0 +1,4 @@
+"""
+Headless benchmark suite for the breakout scene.
+Run it with "python -m benchmarks" or "python -m pytest benchmarks".
+"""
@@ -0,0 +1,47 @@
+"""
+Run every benchmark case and print a table compared to the baseline.
+
+    python -m benchmarks                   run all cases, write results.json
+    python -m benchmarks many_balls        only the named scenario(s)
+    python -m benchmarks --save-baseline   also store the run as baseline.json
+"""
+
+import sys
+
+from benchmarks import baselines
+from benchmarks.scenarios import all_cases, case_id, run_scenario
+
+
+def main(args):
+    save_baseline = "--save-baseline" in args
+    names = [arg for arg in args if not arg.startswith("--")]
+
+    baseline = baselines.load()
+    results = {}
+    failed = 0
+
+    print(f"{'case':<28}{'fps':>8}{'p99 ms':>9}{'worst ms':>10}{'KB/frame':>10}")
+    for name, level in all_cases():
+        if names and name not in names:
+            continue
+
+        key = case_id(name, level)
+        result = results[key] = run_scenario(name, level)
+        problems = baselines.regressions(result, baseline.get(key))
+        failed += bool(problems)
+
+        print(f"{key:<28}{result['fps']:>8}{result['p99_ms']:>9}"
+              f"{result['worst_ms']:>10}{result['alloc_kb_per_frame']:>10}"
+              + ("   REGRESSION: " + "; ".join(problems) if problems else ""))
+
+    baselines.save(results, baselines.RESULTS_PATH)
+    if save_baseline:
+        baseline.update(results)
+        baselines.save(baseline)
+        print(f"Saved baseline to {baselines.BASELINE_PATH}")
+
+    return 1 if failed and not save_baseline else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
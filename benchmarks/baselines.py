@@ -0,0 +1,64 @@
+"""
+This file reads, writes and compares the benchmark baselines.
+A baseline is a JSON file mapping each case ("scenario-level_N") to the
+numbers run_scenario() returned for it on a reference run.
+"""
+
+import json
+import os
+
+BENCH_PATH = os.path.dirname(__file__)
+BASELINE_PATH = os.path.join(BENCH_PATH, "baseline.json")
+RESULTS_PATH = os.path.join(BENCH_PATH, "results.json")
+
+# How much worse than the baseline a number may get before it counts as
+# a regression (0.5 = 50%). BENCH_TOLERANCE overrides it, since timings
+# depend on the machine the baseline was recorded on.
+DEFAULT_TOLERANCE = 0.5
+ALLOC_SLACK_KB = 16  # small absolute allowance for allocation noise
+
+
+def tolerance():
+    try:
+        return float(os.environ.get("BENCH_TOLERANCE", DEFAULT_TOLERANCE))
+    except ValueError:
+        return DEFAULT_TOLERANCE
+
+
+def load(path=BASELINE_PATH):
+    """Return the saved results, or {} if there are none yet."""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save(results, path=BASELINE_PATH):
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+
+
+def regressions(result, baseline, tol=None):
+    """
+    List what got worse than the baseline by more than the tolerance.
+    Frame time spikes (p99, worst) are too noisy to fail on and are only
+    reported.
+    """
+    if not baseline:
+        return []
+    if tol is None:
+        tol = tolerance()
+
+    problems = []
+    if result["fps"] < baseline["fps"] * (1 - tol):
+        problems.append(f"fps {result['fps']} < baseline {baseline['fps']}")
+
+    alloc_limit = baseline["alloc_kb_per_frame"] * (1 + tol) + ALLOC_SLACK_KB
+    if result["alloc_kb_per_frame"] > alloc_limit:
+        problems.append(
+            f"allocations {result['alloc_kb_per_frame']}KB/frame > "
+            f"baseline {baseline['alloc_kb_per_frame']}KB/frame"
+        )
+    return problems
@@ -0,0 +1,187 @@
+"""
+This file holds the benchmark scenarios for the breakout scene.
+Each scenario plays a level headless (SDL dummy video and audio) with the
+bot paddle, running the same per-frame work as game_loop (step, draw and
+present) without waiting on the clock, and adds one kind of stress every
+frame: extra balls, fireballs, blasts or particles.
+
+run_scenario() returns the numbers the suite tracks: frames per second,
+worst and 99th percentile frame time, and bytes allocated per frame,
+plus the object pool counters for sizing the pools.
+"""
+
+import os
+import random
+import time
+import tracemalloc
+
+# Must be set before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+# ---------- RUN SETTINGS ----------
+SEED = 1234
+WARMUP_FRAMES = 60    # not measured: fills caches and pools first
+TIMED_FRAMES = 300    # frame times (fps, p99, worst)
+TRACED_FRAMES = 60    # allocations (tracemalloc slows frames down)
+
+MAX_BALLS = 81
+MAX_FIREBALLS = 12
+BURSTS_PER_FRAME = 1
+
+_screen = None
+
+
+# ---------- STRESSORS ----------
+# Each one is called before every frame with (breakout module, world, rand).
+def no_stress(breakout, world, rand):
+    pass
+
+
+def many_balls(breakout, world, rand):
+    # Keep splitting balls with the triple-ball powerup once launched
+    if breakout.balls and breakout.balls[0].vel.length() != 0 and len(breakout.balls) < MAX_BALLS:
+        breakout.spawn_triple_ball()
+
+
+def fireball_barrage(breakout, world, rand):
+    # The fireball powerup stays on, plus a steady stream of extra shots
+    breakout.fireball_active = True
+    breakout.fireball_timer = max(breakout.fireball_timer, 60)
+
+    if world.blocks and len(world.fireballs) < MAX_FIREBALLS:
+        bar = breakout.get_bar()
+        target = rand.choice(world.blocks.blocks).rect
+        world.fireballs.append(breakout.fireball_pool.acquire(
+            bar.centerx - 20, bar.top - 40, target.centerx, target.centery
+        ))
+
+
+def blaster_spam(breakout, world, rand):
+    # The blast powerup stays on, plus a pair of extra shots every other frame
+    breakout.blast_active = True
+    if breakout.blast_timer < 20:
+        breakout.blast_timer = 300
+
+    if world.frame % 2 == 0:
+        bar = breakout.get_bar()
+        world.blasts.append(breakout.blast_pool.acquire(bar.left + 2, bar.top - 20))
+        world.blasts.append(breakout.blast_pool.acquire(bar.right - 22, bar.top - 20))
+
+
+def particle_storm(breakout, world, rand):
+    # Sparks and explosions all over the playfield
+    for _ in range(BURSTS_PER_FRAME):
+        x = rand.uniform(100, breakout.SCREEN_WIDTH - 100)
+        y = rand.uniform(150, 600)
+        color = rand.choice(breakout.COLORS)
+        world.particles.emit_sparks(x, y, color)
+        world.particles.emit_burst(x, y, color, 10)
+
+    if world.frame % 20 == 0:
+        world.explosion_manager.create_explosion(
+            rand.uniform(100, breakout.SCREEN_WIDTH - 100), rand.uniform(150, 600)
+        )
+
+
+SCENARIOS = {
+    "plain": no_stress,
+    "many_balls": many_balls,
+    "fireball_barrage": fireball_barrage,
+    "blaster_spam": blaster_spam,
+    "particle_storm": particle_storm,
+}
+
+
+# ---------- RUNNING ----------
+def get_screen():
+    """The full-size (dummy) display every scenario draws to."""
+    global _screen
+    from common import SCREEN_WIDTH, SCREEN_HEIGHT
+
+    if _screen is None:
+        pygame.init()
+        _screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    return _screen
+
+
+def run_frame(breakout, screen, world, stress, rand):
+    """One frame of game_loop's work: input, one step, draw, present."""
+    stress(breakout, world, rand)
+    world.scoreboard.lives = 3  # never run out of lives mid-benchmark
+
+    breakout.remember_positions(world)
+    status = breakout.step(world, breakout.bot_inputs(world))
+
+    # Cleared the level: put the bricks back and keep going
+    if status == "level_complete":
+        world.blocks = breakout.define_blocks(None, world.level)
+
+    breakout.draw_frame(screen, world)
+    breakout.playfield.present()
+
+
+def run_scenario(name, level):
+    """Run one scenario on one level and return its numbers."""
+    screen = get_screen()
+
+    from scenes import breakout
+    import rng
+
+    stress = SCENARIOS[name]
+    breakout.init_headless()
+    rng.seed(SEED)
+    rand = random.Random(f"{SEED}:{name}")
+    world = breakout.new_world(level)
+    breakout.reset_pool_peaks()
+
+    for _ in range(WARMUP_FRAMES):
+        run_frame(breakout, screen, world, stress, rand)
+
+    # ----- Frame times -----
+    times = []
+    start = time.perf_counter()
+    for _ in range(TIMED_FRAMES):
+        frame_start = time.perf_counter()
+        run_frame(breakout, screen, world, stress, rand)
+        times.append(time.perf_counter() - frame_start)
+    total = time.perf_counter() - start
+
+    # ----- Allocations -----
+    # Peak memory above the frame's starting point = bytes it allocated
+    allocated = []
+    tracemalloc.start()
+    try:
+        for _ in range(TRACED_FRAMES):
+            before = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            run_frame(breakout, screen, world, stress, rand)
+            allocated.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    times.sort()
+    pools = breakout.pool_stats()
+    breakout.release_pooled(world)
+    return {
+        "fps": round(TIMED_FRAMES / total, 1),
+        "p99_ms": round(times[int(len(times) * 0.99) - 1] * 1000, 3),
+        "worst_ms": round(times[-1] * 1000, 3),
+        "alloc_kb_per_frame": round(sum(allocated) / len(allocated) / 1024, 2),
+        "balls": len(breakout.balls),
+        "particles": len(world.particles) + len(world.explosion_manager.particles),
+        "pools": pools,
+    }
+
+
+def all_cases():
+    """(scenario, level) for every scenario on every level in LEVEL_LAYOUTS."""
+    from scenes.levels import LEVEL_LAYOUTS
+
+    return [(name, level) for name in SCENARIOS for level in range(1, len(LEVEL_LAYOUTS) + 1)]
+
+
+def case_id(name, level):
+    return f"{name}-level_{level}"
@@ -0,0 +1,29 @@
+"""
+Benchmarks for the breakout scene, one case per scenario and level.
+Each case fails if it got slower, or allocates more per frame, than
+benchmarks/baseline.json allows (see baselines.py). Results of the run
+are written to benchmarks/results.json.
+"""
+
+import pytest
+
+from benchmarks import baselines
+from benchmarks.scenarios import all_cases, case_id, run_scenario
+
+RESULTS = {}
+BASELINE = baselines.load()
+
+
+@pytest.fixture(scope="module", autouse=True)
+def write_results():
+    yield
+    baselines.save(RESULTS, baselines.RESULTS_PATH)
+
+
+@pytest.mark.parametrize("name, level", all_cases(), ids=[case_id(*case) for case in all_cases()])
+def test_scenario(name, level):
+    key = case_id(name, level)
+    result = RESULTS[key] = run_scenario(name, level)
+
+    problems = baselines.regressions(result, BASELINE.get(key))
+    assert not problems, f"{key}: " + "; ".join(problems)
@@ -1,13 +1,12 @@
 """
 This file defines global settings used across the game.
-It stores screen size, colors, file paths, music loading,
+It stores screen size, colors, file paths, the music tracks,
 and helper functions for saving config data and drawing
 simple backgrounds.
 """
 
 import pygame
 import os
-import json
 
 # ---------- SCREEN SETTINGS ----------
 SCREEN_WIDTH, SCREEN_HEIGHT = 1200, 900
@@ -29,24 +28,91 @@ COLORS = [RED, ORANGE, YELLOW, GREEN, BLUE, PURPLE, CYAN]
 # Base directory for all game files
 ROOT_PATH = os.path.dirname(__file__)
 
-# ---------- MUSIC LOADING ----------
+# ---------- MUSIC ----------
 pygame.mixer.init()
 
-# Load music tracks used in menus, gameplay, and bosses
-menu_music = pygame.mixer.Sound(os.path.join(ROOT_PATH, "media", "audio", "Music", "Space-main.wav"))
-gameplay_music = pygame.mixer.Sound(os.path.join(ROOT_PATH, "media", "audio", "Music", "Game-main.wav"))
-boss_music = pygame.mixer.Sound(os.path.join(ROOT_PATH, "media", "audio", "Music", "boss-fight-one.wav"))
+MUSIC_PATH = os.path.join(ROOT_PATH, "media", "audio", "Music")
+MUSIC_FADE_MS = 600  # length of each half of a crossfade
+
+
+class MusicPlayer:
+    """
+    Plays the background music, streamed from disk through
+    pygame.mixer.music so only the open track is ever in memory.
+    Switching tracks fades the current one out, then fades the new one
+    in. The fade runs on the mixer and callers never wait; every screen
+    loop calls update() once a frame to start the next track when the
+    old one has faded out.
+    """
+
+    def __init__(self):
+        self.current = None  # path of the track playing (or fading in)
+        self.volume = 1.0    # kept here because loading a file can reset it
+        self._pending = None  # (path, loops, fade_ms, start tick) waiting on a fade out
+
+    def play(self, path, loops=-1, fade_ms=MUSIC_FADE_MS):
+        """Crossfade to the track at path (does nothing if it is already on)."""
+        if path == self.current:
+            return
+        self.current = path
+
+        if pygame.mixer.music.get_busy() and fade_ms > 0:
+            # Fade the old track out; update() starts the new one
+            pygame.mixer.music.fadeout(fade_ms)
+            self._pending = (path, loops, fade_ms, pygame.time.get_ticks() + fade_ms)
+        else:
+            self._pending = None
+            self._start(path, loops, fade_ms)
+
+    def stop(self, fade_ms=MUSIC_FADE_MS):
+        """Fade out whatever is playing."""
+        self.current = None
+        self._pending = None
+        if fade_ms > 0:
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def update(self):
+        """Start the waiting track once the old one has faded out."""
+        if self._pending is None:
+            return
+        path, loops, fade_ms, start_tick = self._pending
+        if pygame.mixer.music.get_busy() and pygame.time.get_ticks() < start_tick:
+            return
+        self._pending = None
+        self._start(path, loops, fade_ms)
+
+    def set_volume(self, volume):
+        """Set the music volume (0.0 - 1.0); applies to fades in progress too."""
+        self.volume = volume
+        pygame.mixer.music.set_volume(volume)
+
+    def _start(self, path, loops, fade_ms):
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(self.volume)
+            pygame.mixer.music.play(loops, fade_ms=fade_ms)
+        except pygame.error as e:
+            print(f"Warning: Could not play {path} - {e}")
+            self.current = None
+
+
+music = MusicPlayer()
+
+# Music tracks used in menus, gameplay, and bosses
+menu_music = os.path.join(MUSIC_PATH, "Space-main.wav")
+gameplay_music = os.path.join(MUSIC_PATH, "Game-main.wav")
+boss_music = os.path.join(MUSIC_PATH, "boss-fight-one.wav")
 
 
 def apply_music_volume(volume_level):
     """
-    Set the music volume for all tracks.
+    Set the music volume.
     volume_level should be between 0 and 5.
     """
     vol = (max(0, min(volume_level, 5)) / 5) * 0.3
-    menu_music.set_volume(vol)
-    gameplay_music.set_volume(vol)
-    boss_music.set_volume(vol)
+    music.set_volume(vol)
 
 
 def draw_gradient_background(screen, top_color, bottom_color):
@@ -64,9 +130,9 @@ def draw_gradient_background(screen, top_color, bottom_color):
 
 
 def save_config(cfg):
-    """Save game settings to config.json."""
-    try:
-        with open("config.json", "w") as f:
-            json.dump(cfg, f, indent=4)
-    except:
-        print("Warning: Could not save config.json")
\ No newline at end of file
+    """Save game settings to config.json (through the settings module)."""
+    import settings
+
+    for key, value in cfg.items():
+        settings.set(key, value)
+    settings.flush()
@@ -0,0 +1,181 @@
+"""
+This file holds the leaderboard, stored in a local SQLite database.
+Every finished game is one row tagged with the day it was played on,
+so each day's table is kept instead of being wiped at midnight.
+The top of any day (or of all time) is read straight from an index,
+which stays fast no matter how many games have been logged.
+"""
+
+import os
+import sqlite3
+import time
+from collections import Counter
+
+from score_store import ScoreStore, ALLTIME_PATH, TODAY_PATH
+
+# ---------- FILE PATHS ----------
+DB_PATH = "leaderboard.db"
+
+# Older score files, imported once when the database is created:
+# the binary stores (score_store.py) if present, otherwise the text files
+LEGACY_ALLTIME_TXT = "records_alltime.txt"
+LEGACY_TODAY_TXT = "today_scores.txt"
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id        INTEGER PRIMARY KEY,
+    initials  TEXT    NOT NULL,
+    score     INTEGER NOT NULL,
+    time      REAL    NOT NULL,
+    day       TEXT,              -- local date played (YYYY-MM-DD), NULL if unknown
+    played_at REAL               -- unix time, NULL for imported scores
+);
+CREATE INDEX IF NOT EXISTS scores_rank ON scores (score DESC, time ASC);
+CREATE INDEX IF NOT EXISTS scores_day_rank ON scores (day, score DESC, time ASC);
+"""
+
+# ---------- STATE ----------
+_conn = None
+
+
+# ---------- CONNECTION ----------
+def connect(path=DB_PATH):
+    """Open (creating and importing old scores if needed) the leaderboard."""
+    global _conn
+
+    if _conn is not None:
+        return _conn
+
+    conn = sqlite3.connect(path)
+    try:
+        # WAL lets the score screen read while a game writes
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+    except sqlite3.DatabaseError as e:
+        print(f"Warning: Could not enable WAL for {path} - {e}")
+
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version < SCHEMA_VERSION:
+        with conn:
+            conn.executescript(SCHEMA)
+            if version == 0:
+                _import_legacy(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    _conn = conn
+    return conn
+
+
+def close():
+    """Close the database (it is reopened on the next call)."""
+    global _conn
+    if _conn is not None:
+        _conn.close()
+        _conn = None
+
+
+def today():
+    """Today's partition key: the local date as YYYY-MM-DD."""
+    return time.strftime("%Y-%m-%d")
+
+
+# ---------- WRITING ----------
+def add_score(initials, score, seconds):
+    """Log one finished game under today's date."""
+    try:
+        with connect() as conn:
+            conn.execute(
+                "INSERT INTO scores (initials, score, time, day, played_at) VALUES (?, ?, ?, ?, ?)",
+                (initials[:3], int(score), float(seconds), today(), time.time())
+            )
+    except sqlite3.Error as e:
+        print(f"Warning: Could not save score - {e}")
+
+
+# ---------- READING ----------
+def top_scores(n=10, day=None):
+    """
+    Return the best n scores as (initials, score, time), highest score
+    first and fastest time breaking ties. day limits it to one date
+    (see today()); None means all time.
+    """
+    try:
+        conn = connect()
+        if day is None:
+            rows = conn.execute(
+                "SELECT initials, score, time FROM scores "
+                "ORDER BY score DESC, time ASC LIMIT ?", (n,)
+            )
+        else:
+            rows = conn.execute(
+                "SELECT initials, score, time FROM scores WHERE day = ? "
+                "ORDER BY score DESC, time ASC LIMIT ?", (day, n)
+            )
+        return rows.fetchall()
+    except sqlite3.Error as e:
+        print(f"Warning: Could not read scores - {e}")
+        return []
+
+
+def best():
+    """Return (high score, its time) of all time, or (0, 0.0) if none."""
+    rows = top_scores(1)
+    if not rows:
+        return 0, 0.0
+    return rows[0][1], rows[0][2]
+
+
+# ---------- MIGRATION ----------
+def _read_store(path):
+    if not os.path.exists(path):
+        return []
+    return list(ScoreStore(path).entries())
+
+
+def _read_txt(path):
+    try:
+        with open(path, "r", encoding="utf8") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+
+    rows = []
+    for line in lines:
+        parts = line.strip().split()
+        if len(parts) == 3:
+            try:
+                rows.append((parts[0].upper()[:3], int(parts[1]), round(float(parts[2]), 2)))
+            except ValueError:
+                continue
+    return rows
+
+
+def _import_legacy(conn):
+    # The binary stores replaced the text files, so they are newer
+    if os.path.exists(ALLTIME_PATH):
+        history = _read_store(ALLTIME_PATH)
+        today_rows = _read_store(TODAY_PATH)
+    else:
+        history = _read_txt(LEGACY_ALLTIME_TXT)
+        today_rows = _read_txt(LEGACY_TODAY_TXT)
+
+    # Every game was written to both files. Today's games are imported
+    # as played today, and each one is taken out of the history once
+    todays = Counter(today_rows)
+    older = []
+    for row in history:
+        if todays[row]:
+            todays[row] -= 1
+        else:
+            older.append(row)
+
+    conn.executemany(
+        "INSERT INTO scores (initials, score, time, day) VALUES (?, ?, ?, NULL)", older
+    )
+    day = today()
+    conn.executemany(
+        "INSERT INTO scores (initials, score, time, day) VALUES (?, ?, ?, ?)",
+        ((i, s, t, day) for i, s, t in today_rows)
+    )
@@ -3,7 +3,7 @@ Main menu and launcher for the Breakout game.
 
 This file:
 1. Initializes pygame and audio.
-2. Loads and saves config settings.
+2. Reads settings (volume, last character) from the settings module.
 3. Shows the main menu, settings, how to play, credits, and test mode.
 4. Starts the main Breakout game with normal and debug options.
 """
@@ -12,83 +12,42 @@ import sys
 import pygame
 import common
 import os
-import json
+import assets
+import settings
 
 from common import RED, WHITE, SCREEN_WIDTH, SCREEN_HEIGHT, ROOT_PATH
-from scenes import breakout, highscores
+from scenes import breakout, highscores, win_lose
 from scenes.loading import show_loading_screen
 
 pygame.init()
 pygame.mixer.init()
 
-config_path = "config.json"
-default_config_path = "config.default.json"
-
-try:
-    menu_click_sound = pygame.mixer.Sound(
-        os.path.join(ROOT_PATH, "media", "audio", "media_audio_selection_click.wav")
-    )
-except:
-    print("Warning: Could not load menu click sound.")
-    menu_click_sound = None
-
-try:
-    menu_background = pygame.image.load(
-        os.path.join(ROOT_PATH, "media", "graphics", "background", "back-landscape-grid.png")
-    )
-except:
-    print("Warning: Could not load background image.")
-    menu_background = None
-
-# FUNCTIONS SECOND
-def save_config():
-    try:
-        with open(config_path, "w") as f:
-            json.dump(config, f, indent=2)
-    except:
-        print("Warning: Could not save config.json")
-
-def current_sfx_volume():
-    try:
-        with open(config_path, "r") as f:
-            cfg_local = json.load(f)
-        level = cfg_local.get("sound_volume", 5)
-        try:
-            level = int(level)
-        except:
-            level = 5
-        level = max(0, min(5, level))
-        return level / 5.0
-    except:
-        return 1.0
-
-# NOW LOAD DEFAULTS / CONFIG
-try:
-    with open(default_config_path, "r") as f:
-        default_config = json.load(f)
-except:
-    default_config = {
-        "tutorial_enabled": True,
-        "show_fps": False,
-        "mouse_enabled": False,
-        "last_character": 0,
-        "sound_volume": 3,
-        "music_volume": 3
-    }
-
-if os.path.exists(config_path):
-    try:
-        with open(config_path, "r") as f:
-            config = json.load(f)
-        # Fill missing keys
-        for key, value in default_config.items():
-            config.setdefault(key, value)
-    except:
-        config = default_config.copy()
-else:
-    config = default_config.copy()
+# Loaded with the other startup assets once the window exists
+MENU_CLICK_SOUND = os.path.join(ROOT_PATH, "media", "audio", "media_audio_selection_click.wav")
+menu_click_sound = None
+
+# Loaded (scaled and converted) through the asset cache once the window exists
+menu_background_path = os.path.join(ROOT_PATH, "media", "graphics", "background", "back-landscape-grid.png")
+
+# Menu images as (path, size) or (path, size, alpha), matching main_menu()
+MENU_IMAGES = [
+    (menu_background_path, (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    ("media/graphics/items/breakout-game-title.png", (400, 100)),
+    ("media/graphics/items/play-button.png", (300, 60)),
+    ("media/graphics/items/highscores-button.png", (300, 60)),
+    ("media/graphics/items/settings-button.png", (300, 60)),
+    ("media/graphics/items/credits-button.png", (300, 60)),
+    ("media/graphics/items/quit-button.png", (300, 60)),
+    ("media/graphics/items/select-player.png", (250, 50)),
+    ("media/graphics/items/left arrow.png", (40, 40)),
+    ("media/graphics/items/left-arrow-dark.png", (40, 40)),
+    ("media/graphics/items/right-arrow.png", (40, 40)),
+    ("media/graphics/items/right-arrow-dark.png", (40, 40)),
+]
 
-save_config()
+# Music follows the music volume setting wherever it is changed
+settings.subscribe("music_volume", common.apply_music_volume)
+common.apply_music_volume(settings.music_level())
 
 # Character selection setup (Global)
 characters = [
@@ -103,52 +62,52 @@ characters = [
 ]
 
 
+# ---------- STARTUP ASSETS ----------
+def startup_assets():
+    """(images, sounds) for the menu, the game and the end screens."""
+    images = MENU_IMAGES + [(char["image"], (60, 60)) for char in characters]
+    sounds = [MENU_CLICK_SOUND] + win_lose.SOUND_FILES
+
+    game_images, game_sounds = breakout.startup_assets()
+    return images + game_images, sounds + game_sounds
+
+
 # ---------- MAIN MENU ----------
 def main_menu():
+    global menu_click_sound
     pygame.mouse.set_visible(True)
 
-    from common import menu_music, gameplay_music, boss_music, apply_music_volume
-    gameplay_music.stop()
-    boss_music.stop()
-    menu_music.play(loops=-1)
-    apply_music_volume(config.get("music_volume", 5))
+    common.music.play(common.menu_music)
 
     # Load title image
-    try:
-        title_image = pygame.image.load("media/graphics/items/breakout-game-title.png")
-        title_image = pygame.transform.scale(title_image, (400, 100))
-    except:
-        print("Warning: Could not load title image.")
-        title_image = None
-
-    # Load button images
-    try:
-        play_button_img = pygame.image.load("media/graphics/items/play-button.png")
-        highscores_button_img = pygame.image.load("media/graphics/items/highscores-button.png")
-        settings_button_img = pygame.image.load("media/graphics/items/settings-button.png")
-        credits_button_img = pygame.image.load("media/graphics/items/credits-button.png")
-        quit_button_img = pygame.image.load("media/graphics/items/quit-button.png")
-
-        # Scale buttons to consistent size (adjust if needed)
-        button_width = 300
-        button_height = 60
-        play_button_img = pygame.transform.scale(play_button_img, (button_width, button_height))
-        highscores_button_img = pygame.transform.scale(highscores_button_img, (button_width, button_height))
-        settings_button_img = pygame.transform.scale(settings_button_img, (button_width, button_height))
-        credits_button_img = pygame.transform.scale(credits_button_img, (button_width, button_height))
-        quit_button_img = pygame.transform.scale(quit_button_img, (button_width, button_height))
-    except Exception as e:
-        print(f"Warning: Could not load button images: {e}")
-        # Fallback to text buttons if images don't load
-        play_button_img = None
-
     # Set up the screen
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Breakout Game - Menu")
     pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
-    font = pygame.font.Font(None, 74)
-    small_font = pygame.font.Font(None, 50)
-    show_loading_screen(screen, font)
+    font = assets.load_font(74, path=None)
+    small_font = assets.load_font(50, path=None)
+
+    # Decode images and sounds on worker threads while the bar shows
+    # real progress (instant once everything is cached)
+    images, sounds = startup_assets()
+    show_loading_screen(screen, font, assets.BackgroundLoader(images, sounds))
+    menu_click_sound = assets.load_sound(MENU_CLICK_SOUND)
+
+    # Images come from the shared cache, so coming back to the menu
+    # after a game doesn't read and scale them again
+    menu_background = assets.load_image(menu_background_path, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+    title_image = assets.load_image("media/graphics/items/breakout-game-title.png", (400, 100))
+
+    # Load button images (scaled to a consistent size)
+    button_size = (300, 60)
+    play_button_img = assets.load_image("media/graphics/items/play-button.png", button_size)
+    highscores_button_img = assets.load_image("media/graphics/items/highscores-button.png", button_size)
+    settings_button_img = assets.load_image("media/graphics/items/settings-button.png", button_size)
+    credits_button_img = assets.load_image("media/graphics/items/credits-button.png", button_size)
+    quit_button_img = assets.load_image("media/graphics/items/quit-button.png", button_size)
+
+    # Hover-scaled copies of the buttons, keyed by (name, width, height)
+    scaled_buttons = {}
 
     # fallback title text if image fails
     title = font.render("Breakout Game", True, WHITE)
@@ -164,44 +123,20 @@ def main_menu():
     credits_rect = pygame.Rect(button_x, button_start_y + button_spacing * 3, 300, 60)
     quit_rect = pygame.Rect(button_x, button_start_y + button_spacing * 4, 300, 60)
 
-    selected_character = config.get("last_character", 0)
-
-    character_images = []
-    for char in characters:
-        try:
-            img = pygame.image.load(char["image"])
-            img = pygame.transform.scale(img, (100, 100))
-            character_images.append(img)
-        except Exception as e:
-            print(f"Warning: Could not load {char['name']}: {e}")
-            character_images.append(None)
-
-    try:
-        select_player_img = pygame.image.load("media/graphics/items/select-player.png")
-        select_player_img = pygame.transform.scale(select_player_img, (300, 60))
-    except:
-        print("Warning: Could not load select-player.png")
-        select_player_img = None
+    selected_character = settings.get("last_character", 0)
+
+    # Character previews, already at the small menu size
+    character_images = [assets.load_image(char["image"], (60, 60)) for char in characters]
+
+    select_player_img = assets.load_image("media/graphics/items/select-player.png", (250, 50))
+    name_font = assets.load_font(36)
 
     # Load arrow images
-    try:
-        left_arrow = pygame.image.load("media/graphics/items/left arrow.png")
-        left_arrow_dark = pygame.image.load("media/graphics/items/left-arrow-dark.png")
-        right_arrow = pygame.image.load("media/graphics/items/right-arrow.png")
-        right_arrow_dark = pygame.image.load("media/graphics/items/right-arrow-dark.png")
-
-        # Scale light arrows
-        arrow_size = (40, 40)
-        left_arrow = pygame.transform.scale(left_arrow, arrow_size)
-        right_arrow = pygame.transform.scale(right_arrow, arrow_size)
-
-        # Scale dark arrows 
-        dark_arrow_size = (40, 40)
-        left_arrow_dark = pygame.transform.scale(left_arrow_dark, dark_arrow_size)
-        right_arrow_dark = pygame.transform.scale(right_arrow_dark, dark_arrow_size)
-    except Exception as e:
-        print(f"Warning: Could not load arrow images: {e}")
-        left_arrow = None
+    arrow_size = (40, 40)
+    left_arrow = assets.load_image("media/graphics/items/left arrow.png", arrow_size)
+    left_arrow_dark = assets.load_image("media/graphics/items/left-arrow-dark.png", arrow_size)
+    right_arrow = assets.load_image("media/graphics/items/right-arrow.png", arrow_size)
+    right_arrow_dark = assets.load_image("media/graphics/items/right-arrow-dark.png", arrow_size)
 
     hover_scale = {
         "play": 1.0,
@@ -216,7 +151,7 @@ def main_menu():
 
         # Background
         if menu_background:
-            screen.blit(pygame.transform.scale(menu_background, (SCREEN_WIDTH, SCREEN_HEIGHT)), (0, 0))
+            screen.blit(menu_background, (0, 0))
         else:
             common.draw_gradient_background(screen, (20, 20, 60), (0, 0, 0))
 
@@ -249,13 +184,19 @@ def main_menu():
                 # Smooth scale animation on hover
                 target = 1.1 if hovered else 1.0
                 hover_scale[name] += (target - hover_scale[name]) * 0.15
+                if abs(target - hover_scale[name]) < 0.002:
+                    hover_scale[name] = target
 
                 scale = hover_scale[name]
                 if scale != 1.0:
-                    # Scale the button
+                    # Scale the button (each size is only scaled once)
                     scaled_w = int(button_img.get_width() * scale)
                     scaled_h = int(button_img.get_height() * scale)
-                    scaled_img = pygame.transform.smoothscale(button_img, (scaled_w, scaled_h))
+                    key = (name, scaled_w, scaled_h)
+                    scaled_img = scaled_buttons.get(key)
+                    if scaled_img is None:
+                        scaled_img = pygame.transform.smoothscale(button_img, (scaled_w, scaled_h))
+                        scaled_buttons[key] = scaled_img
                     scaled_rect = scaled_img.get_rect(center=button_rect.center)
                     screen.blit(scaled_img, scaled_rect)
                 else:
@@ -267,24 +208,18 @@ def main_menu():
         select_y = 350
 
         # Draw "Select Player" image/title (smaller)
+        title_width = 250  # Width of the select player image
         if select_player_img:
-            smaller_select = pygame.transform.scale(select_player_img, (250, 50))
-            screen.blit(smaller_select, (select_x, select_y))
-            title_width = 250  # Width of the select player image
+            screen.blit(select_player_img, (select_x, select_y))
 
         # Draw character NAME centered under "Select Player" title
-        try:
-            name_font = pygame.font.Font("media/graphics/font/Pixeboy.ttf", 36)
-        except:
-            name_font = pygame.font.Font(None, 36)
         character_name = name_font.render(characters[selected_character]["name"], True, (100, 200, 255))
         name_x = select_x + (title_width // 2) - (character_name.get_width() // 2)  # Center it
         screen.blit(character_name, (name_x, select_y + 70))
 
         # Draw character image SMALLER and centered under the name
         if character_images[selected_character]:
-            # Make character smaller
-            small_char = pygame.transform.scale(character_images[selected_character], (60, 60))  # Smaller!
+            small_char = character_images[selected_character]
             char_img_x = select_x + (title_width // 2) - 30  # Center it (half of 60)
             char_img_y = select_y + 130
             screen.blit(small_char, (char_img_x, char_img_y))
@@ -326,34 +261,34 @@ def main_menu():
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if play_rect.collidepoint(event.pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     # Pass the selected character image to the game
                     selected_char_image = characters[selected_character]["image"]
                     play_breakout(screen, selected_char_image)
 
                 elif high_rect.collidepoint(event.pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     highscores.show_high_scores(screen)
 
                 elif settings_rect.collidepoint(event.pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     open_settings_menu(screen)
 
                 elif credits_rect.collidepoint(event.pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     show_credits(screen)
 
                 elif quit_rect.collidepoint(event.pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     pygame.quit()
                     sys.exit()
@@ -363,32 +298,30 @@ def main_menu():
                 elif selected_character > 0:
                     left_arrow_rect = pygame.Rect(select_x - 40, select_y + 120, 40, 40)
                     if left_arrow_rect.collidepoint(event.pos):
-                        if menu_click_sound and current_sfx_volume() > 0:
-                            menu_click_sound.set_volume(current_sfx_volume())
+                        if menu_click_sound and settings.sfx_volume() > 0:
+                            menu_click_sound.set_volume(settings.sfx_volume())
                             menu_click_sound.play()
                         selected_character -= 1
                         # Save to config
-                        config["last_character"] = selected_character
-                        save_config()
+                        settings.set("last_character", selected_character)
 
                 # Right arrow - go to next character
                 if selected_character < len(characters) - 1:
                     right_arrow_rect = pygame.Rect(select_x + 250, select_y + 120, 40, 40)
                     if right_arrow_rect.collidepoint(event.pos):
-                        if menu_click_sound and current_sfx_volume() > 0:
-                            menu_click_sound.set_volume(current_sfx_volume())
+                        if menu_click_sound and settings.sfx_volume() > 0:
+                            menu_click_sound.set_volume(settings.sfx_volume())
                             menu_click_sound.play()
                         selected_character += 1
                         # Save to config
-                        config["last_character"] = selected_character
-                        save_config()
+                        settings.set("last_character", selected_character)
 
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_LCTRL:
                     open_test_menu(screen)
                 elif event.key == pygame.K_SPACE:
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     selected_char_image = characters[selected_character]["image"]
                     play_breakout(screen, selected_char_image)
@@ -396,14 +329,14 @@ def main_menu():
                     pygame.quit()
                     sys.exit()
 
+        common.music.update()
         pygame.display.flip()
         pygame.time.Clock().tick(60)
 
 
 def open_settings_menu(screen):
-    font_path = os.path.join(ROOT_PATH, "media", "graphics", "font", "Pixeboy.ttf")
-    font = pygame.font.Font(font_path, 70)
-    small = pygame.font.Font(font_path, 40)
+    font = assets.load_font(70)
+    small = assets.load_font(40)
 
     label_colors = [
         (0, 255, 255),
@@ -413,32 +346,14 @@ def open_settings_menu(screen):
     ]
 
     # ----- Load Arrow Images -----
-    try:
-        left_arrow = pygame.image.load(os.path.join(ROOT_PATH, "media/graphics/items/left arrow.png"))
-        left_arrow_dark = pygame.image.load(os.path.join(ROOT_PATH, "media/graphics/items/left-arrow-dark.png"))
-        right_arrow = pygame.image.load(os.path.join(ROOT_PATH, "media/graphics/items/right-arrow.png"))
-        right_arrow_dark = pygame.image.load(os.path.join(ROOT_PATH, "media/graphics/items/right-arrow-dark.png"))
-
-        left_arrow = pygame.transform.scale(left_arrow, (40, 40))
-        right_arrow = pygame.transform.scale(right_arrow, (40, 40))
-        left_arrow_dark = pygame.transform.scale(left_arrow_dark, (40, 40))
-        right_arrow_dark = pygame.transform.scale(right_arrow_dark, (40, 40))
-    except:
-        left_arrow = None
-        left_arrow_dark = None
-        right_arrow = None
-        right_arrow_dark = None
-
-        # ----- Load Slider Images -----
-    try:
-        slider_on = pygame.image.load(os.path.join(ROOT_PATH, "media/graphics/items/On-Switch.png"))
-        slider_off = pygame.image.load(os.path.join(ROOT_PATH, "media/graphics/items/Off-Switch.png"))
-
-        slider_on = pygame.transform.scale(slider_on, (200, 70))
-        slider_off = pygame.transform.scale(slider_off, (200, 70))
-    except:
-        slider_on = None
-        slider_off = None
+    left_arrow = assets.load_image(os.path.join(ROOT_PATH, "media/graphics/items/left arrow.png"), (40, 40))
+    left_arrow_dark = assets.load_image(os.path.join(ROOT_PATH, "media/graphics/items/left-arrow-dark.png"), (40, 40))
+    right_arrow = assets.load_image(os.path.join(ROOT_PATH, "media/graphics/items/right-arrow.png"), (40, 40))
+    right_arrow_dark = assets.load_image(os.path.join(ROOT_PATH, "media/graphics/items/right-arrow-dark.png"), (40, 40))
+
+    # ----- Load Slider Images -----
+    slider_on = assets.load_image(os.path.join(ROOT_PATH, "media/graphics/items/On-Switch.png"), (200, 70))
+    slider_off = assets.load_image(os.path.join(ROOT_PATH, "media/graphics/items/Off-Switch.png"), (200, 70))
 
 
     running = True
@@ -455,11 +370,9 @@ def open_settings_menu(screen):
     # Ensure all options exist in config
     for label, key in options:
         if "volume" in key:
-            config.setdefault(key, 5)
+            settings.setdefault(key, 5)
         else:
-            config.setdefault(key, False)
-
-    save_config()
+            settings.setdefault(key, False)
 
     # ---- COLUMN LAYOUT ----
     col_label_x = SCREEN_WIDTH // 2 - 260
@@ -530,7 +443,7 @@ def open_settings_menu(screen):
             screen.blit(txt, (col_label_x, y))
 
             # State ON/OFF color
-            state = "ON" if config.get(key) else "OFF"
+            state = "ON" if settings.get(key) else "OFF"
             # ----- DRAW VOLUME CONTROLS -----
             if label == "Sound Volume":
                 minus = volume_minus_rects["sound_volume"]
@@ -539,19 +452,19 @@ def open_settings_menu(screen):
 
                 # volume number box stays the same
                 pygame.draw.rect(screen, WHITE, value, 3)
-                val = str(config.get("sound_volume", 5))
+                val = str(settings.get("sound_volume", 5))
                 val_surf = small.render(val, True, WHITE)
                 val_rect = val_surf.get_rect(center=value.center)
                 screen.blit(val_surf, val_rect)
 
                 # left arrow (dark at 0)
-                if config.get("sound_volume", 5) == 0:
+                if settings.get("sound_volume", 5) == 0:
                     screen.blit(left_arrow_dark, minus)
                 else:
                     screen.blit(left_arrow, minus)
 
                 # right arrow (dark at 5)
-                if config.get("sound_volume", 5) == 5:
+                if settings.get("sound_volume", 5) == 5:
                     screen.blit(right_arrow_dark, plus)
                 else:
                     screen.blit(right_arrow, plus)
@@ -564,19 +477,19 @@ def open_settings_menu(screen):
 
                 # volume number box
                 pygame.draw.rect(screen, WHITE, value, 3)
-                val = str(config.get("music_volume", 5))
+                val = str(settings.get("music_volume", 5))
                 val_surf = small.render(val, True, WHITE)
                 val_rect = val_surf.get_rect(center=value.center)
                 screen.blit(val_surf, val_rect)
 
                 # left arrow (dark at 0)
-                if config.get("music_volume", 5) == 0:
+                if settings.get("music_volume", 5) == 0:
                     screen.blit(left_arrow_dark, minus)
                 else:
                     screen.blit(left_arrow, minus)
 
                 # right arrow (dark at 5)
-                if config.get("music_volume", 5) == 5:
+                if settings.get("music_volume", 5) == 5:
                     screen.blit(right_arrow_dark, plus)
                 else:
                     screen.blit(right_arrow, plus)
@@ -585,7 +498,7 @@ def open_settings_menu(screen):
             #Slider image
             checkbox, key_ref = checkbox_rects[i]
 
-            if config.get(key):
+            if settings.get(key):
                 screen.blit(slider_on, checkbox)
             else:
                 screen.blit(slider_off, checkbox)
@@ -606,69 +519,53 @@ def open_settings_menu(screen):
                 # ------ Volume Buttons ------
                 if "sound_volume" in volume_minus_rects:
                     if volume_minus_rects["sound_volume"].collidepoint(pos):
-                        config["sound_volume"] = max(0, config.get("sound_volume", 5) - 1)
-                        save_config()
+                        settings.set("sound_volume", max(0, settings.get_int("sound_volume", 5) - 1))
                         if menu_click_sound:
-                            menu_click_sound.set_volume(current_sfx_volume())
-                        try:
-                            breakout.apply_sound_volumes()
-                        except:
-                            pass
+                            menu_click_sound.set_volume(settings.sfx_volume())
 
                     if volume_plus_rects["sound_volume"].collidepoint(pos):
-                        config["sound_volume"] = min(5, config.get("sound_volume", 5) + 1)
-                        save_config()
+                        settings.set("sound_volume", min(5, settings.get_int("sound_volume", 5) + 1))
                         if menu_click_sound:
-                            menu_click_sound.set_volume(current_sfx_volume())
-                        try:
-                            breakout.apply_sound_volumes()
-                        except:
-                            pass
+                            menu_click_sound.set_volume(settings.sfx_volume())
 
                 if "music_volume" in volume_minus_rects:
                     if volume_minus_rects["music_volume"].collidepoint(pos):
-                        config["music_volume"] = max(0, config.get("music_volume", 5) - 1)
-                        save_config()
-                        from common import apply_music_volume
-                        apply_music_volume(config["music_volume"])
+                        settings.set("music_volume", max(0, settings.get_int("music_volume", 5) - 1))
 
                     if volume_plus_rects["music_volume"].collidepoint(pos):
-                        config["music_volume"] = min(5, config.get("music_volume", 5) + 1)
-                        save_config()
-                        from common import apply_music_volume
-                        apply_music_volume(config["music_volume"])
+                        settings.set("music_volume", min(5, settings.get_int("music_volume", 5) + 1))
 
                 for checkbox, key in checkbox_rects:
                     if checkbox and checkbox.collidepoint(pos):
-                        config[key] = not config[key]
-                        save_config()
+                        settings.set(key, not settings.get_bool(key))
 
                 if how_rect.collidepoint(pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     show_how_to_play(screen)
 
                 if back_rect.collidepoint(pos):
-                    if menu_click_sound and current_sfx_volume() > 0:
-                        menu_click_sound.set_volume(current_sfx_volume())
+                    if menu_click_sound and settings.sfx_volume() > 0:
+                        menu_click_sound.set_volume(settings.sfx_volume())
                         menu_click_sound.play()
                     return
 
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if menu_click_sound and current_sfx_volume() > 0:
-                    menu_click_sound.set_volume(current_sfx_volume())
+                if menu_click_sound and settings.sfx_volume() > 0:
+                    menu_click_sound.set_volume(settings.sfx_volume())
                     menu_click_sound.play()
                 return
 
+        common.music.update()
         pygame.display.flip()
         pygame.time.Clock().tick(60)
 
 
 # ---------- HOW TO PLAY ----------
 def show_how_to_play(screen):
-    font = pygame.font.Font(os.path.join(ROOT_PATH, "media/graphics/font/Pixeboy.ttf"), 60)
-    small = pygame.font.Font(os.path.join(ROOT_PATH, "media/graphics/font/Pixeboy.ttf"), 36)
+    font = assets.load_font(60)
+    small = assets.load_font(36)
 
     running = True
     while running:
@@ -715,19 +612,20 @@ def show_how_to_play(screen):
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if menu_click_sound and current_sfx_volume() > 0:
-                    menu_click_sound.set_volume(current_sfx_volume())
+                if menu_click_sound and settings.sfx_volume() > 0:
+                    menu_click_sound.set_volume(settings.sfx_volume())
                     menu_click_sound.play()
                 return
 
+        common.music.update()
         pygame.display.flip()
         pygame.time.Clock().tick(60)
 
 
 # ---------- CREDITS ----------
 def show_credits(screen):
-    font = pygame.font.Font("media/graphics/font/Pixeboy.ttf", 55)
-    small = pygame.font.Font("media/graphics/font/Pixeboy.ttf", 30)
+    font = assets.load_font(55)
+    small = assets.load_font(30)
 
     running = True
     while running:
@@ -782,19 +680,20 @@ def show_credits(screen):
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                if menu_click_sound and current_sfx_volume() > 0:
-                    menu_click_sound.set_volume(current_sfx_volume())
+                if menu_click_sound and settings.sfx_volume() > 0:
+                    menu_click_sound.set_volume(settings.sfx_volume())
                     menu_click_sound.play()
                 return
 
+        common.music.update()
         pygame.display.flip()
         pygame.time.Clock().tick(60)
 
 
 # ---------- DEBUG MENU ----------
 def open_test_menu(screen):
-    font = pygame.font.Font(None, 60)
-    small = pygame.font.Font(None, 36)
+    font = assets.load_font(60, path=None)
+    small = assets.load_font(36, path=None)
 
     running = True
     while running:
@@ -838,18 +737,14 @@ def open_test_menu(screen):
                 if key == pygame.K_7: return play_breakout(screen, characters[0]["image"], debug_mode="level_5")
                 if key == pygame.K_ESCAPE: return
 
+        common.music.update()
         pygame.display.flip()
         pygame.time.Clock().tick(60)
 
 
 # ---------- GAME LAUNCHER ----------
 def play_breakout(screen, character_image=None, debug_mode=False):
-    from common import menu_music, gameplay_music, boss_music, apply_music_volume
-
-    menu_music.stop()
-    boss_music.stop()
-    gameplay_music.play(loops=-1)
-    apply_music_volume(config.get("music_volume", 5))
+    common.music.play(common.gameplay_music)
 
     replay = True
     while replay:
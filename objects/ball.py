@@ -0,0 +1,84 @@
+"""
+This file creates the Ball and the BallList that holds the balls in play.
+Each ball keeps its own position and velocity vectors for its whole life.
+Lost balls go to a free list and are reused by the next spawn, so
+triple-ball chains don't create new objects every time.
+"""
+
+import pygame
+
+
+# ---------- BALL CLASS ---------- #
+# One ball: position, velocity and (for drawing) position before the step.
+class Ball:
+    __slots__ = ("pos", "vel", "prev", "has_prev", "in_play")
+
+    def __init__(self):
+        self.pos = pygame.Vector2()
+        self.vel = pygame.Vector2()
+        self.prev = pygame.Vector2()
+        self.has_prev = False  # False until the first remembered step
+        self.in_play = False   # False while waiting in the free list
+
+    # Store the current position as the one before the next step.
+    def remember(self):
+        self.prev.update(self.pos)
+        self.has_prev = True
+
+
+# ---------- BALL LIST CLASS ---------- #
+# The balls in play, in the order they were spawned.
+class BallList:
+    def __init__(self):
+        self.balls = []
+        self.free = []  # lost balls waiting to be reused
+
+    # ---------- CONTAINER METHODS ---------- #
+    # Behaves like the old list of balls for len(), iteration, indexing
+    # and "in".
+    def __len__(self):
+        return len(self.balls)
+
+    def __iter__(self):
+        return iter(self.balls)
+
+    def __getitem__(self, index):
+        return self.balls[index]
+
+    def __contains__(self, ball):
+        return ball is not None and ball.in_play
+
+    # Put a ball in play at (x, y) moving at (vx, vy). Returns it.
+    def spawn(self, x, y, vx=0, vy=0):
+        ball = self.free.pop() if self.free else Ball()
+        ball.pos.update(x, y)
+        ball.vel.update(vx, vy)
+        ball.has_prev = False
+        ball.in_play = True
+        self.balls.append(ball)
+        return ball
+
+    # Take every ball whose top edge is below y out of play, keeping
+    # the others in order. Returns how many were lost.
+    def remove_below(self, y, radius):
+        balls = self.balls
+        kept = 0
+        for ball in balls:
+            if ball.pos.y - radius > y:
+                ball.in_play = False
+                self.free.append(ball)
+            else:
+                balls[kept] = ball
+                kept += 1
+
+        lost = len(balls) - kept
+        if lost:
+            del balls[kept:]
+        return lost
+
+    # Take every ball out of play.
+    def clear(self):
+        for ball in self.balls:
+            ball.in_play = False
+        self.free.extend(self.balls)
+        self.balls.clear()
@@ -13,6 +13,12 @@ from common import COLORS, ROOT_PATH
 brick_images_1 = {}
 brick_images_2 = {}
 
+# Brick sprite atlas: one scaled Surface per (color, block_type, damaged)
+# variant, shared by every brick that looks like it. Bricks only keep
+# their index into brick_atlas.
+brick_atlas = []         # index -> Surface (None if the image is missing)
+brick_atlas_index = {}   # (color, block_type, damaged) -> index
+
 # Brick sizes
 BRICK1_SIZE = (60, 25)   # Normal rectangle brick
 BRICK2_SIZE = (35, 35)   # Square stronger brick
@@ -64,13 +70,59 @@ def load_all_images():
             brick_images_2[COLORS[i]] = None
 
 
+# ---------- SPRITE ATLAS ---------- #
+# Return how many hits a brick of this color and type takes.
+def brick_hp(color, block_type):
+    load_all_images()
+    if block_type == 2 and brick_images_2[color] is not None:
+        return 2  # Strong brick takes 2 hits
+    return 1
+
+
+# Return the atlas index of a brick variant, building its Surface the
+# first time it is asked for.
+def get_sprite_index(color, block_type, damaged=False):
+    key = (color, block_type, damaged)
+    index = brick_atlas_index.get(key)
+    if index is None:
+        index = len(brick_atlas)
+        brick_atlas.append(build_sprite(color, block_type, damaged))
+        brick_atlas_index[key] = index
+    return index
+
+
+# Make the Surface for one brick variant (None if there is no image).
+def build_sprite(color, block_type, damaged):
+    hp = brick_hp(color, block_type)
+
+    # Cracked version for 2-hit bricks
+    if damaged:
+        image = brick_atlas[get_sprite_index(color, block_type)]
+        if hp != 2 or image is None or not crack_overlay_img:
+            return None
+        cracked = image.copy()
+        cracked.blit(crack_overlay_img, (0, 0))
+        return cracked
+
+    # Select base image
+    if hp == 2:
+        base_image = brick_images_2[color]
+    else:
+        base_image = brick_images_1[color]
+
+    # Scale brick image to match size
+    if base_image is None:
+        return None
+    size = BRICK2_SIZE if block_type == 2 else BRICK1_SIZE
+    return pygame.transform.scale(base_image, size)
+
+
 # ---------- BLOCK CLASS ---------- #
 # Represents a single brick in the game.
 class Block:
     # Set up brick size, image, color, and hit points.
-    def __init__(self, x, y, color, block_type=1):
-        load_all_images()
-
+    # hp is looked up from the brick images if not given.
+    def __init__(self, x, y, color, block_type=1, hp=None):
         # Pick size based on brick strength
         if block_type == 2:
             self.width, self.height = BRICK2_SIZE  # Stronger square brick
@@ -82,31 +134,15 @@ class Block:
         self.color = color
         self.block_type = block_type
 
-        # Select base image and hit points
-        if block_type == 2 and brick_images_2[color] is not None:
-            base_image = brick_images_2[color]
-            self.hp = 2  # Strong brick takes 2 hits
-        else:
-            base_image = brick_images_1[color]
-            self.hp = 1
-
+        # Select hit points and the shared sprite to show
+        self.hp = brick_hp(color, block_type) if hp is None else hp
         self.max_hp = self.hp  # Store original HP
+        self.sprite = get_sprite_index(color, block_type)
 
-        # Scale brick image to match size
-        if base_image is not None:
-            self.image = pygame.transform.scale(
-                base_image, (self.width, self.height)
-            )
-        else:
-            self.image = None
-
-        # Create cracked version for 2-hit bricks
-        if self.hp == 2 and self.image is not None and crack_overlay_img:
-            damaged = self.image.copy()
-            damaged.blit(crack_overlay_img, (0, 0))
-            self.image_damaged = damaged
-        else:
-            self.image_damaged = None
+    # The brick's current image from the atlas (None draws a plain rect).
+    @property
+    def image(self):
+        return brick_atlas[self.sprite]
 
     # Handle brick damage and swap to cracked image.
     def hit(self):
@@ -116,7 +152,8 @@ class Block:
         self.hp -= 1  # Lose one hit point
 
         # Switch to cracked image if available
-        if self.image_damaged:
-            self.image = self.image_damaged
+        cracked = get_sprite_index(self.color, self.block_type, damaged=True)
+        if brick_atlas[cracked] is not None:
+            self.sprite = cracked
 
         return False
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+This file creates the BrickGrid used to hold the bricks of a level.
+Bricks are stored by the layout cell they were placed in, so collision
+checks only look at the few cells around a ball or projectile instead
+of every brick on the screen.
+"""
+
+
+# ---------- BRICK GRID CLASS ---------- #
+# Uniform grid of bricks keyed by (row, col) layout cell.
+class BrickGrid:
+    # Set up an empty grid. Cell (0, 0) starts at (origin_x, origin_y).
+    def __init__(self, origin_x=0, origin_y=0, cell_width=1, cell_height=1):
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+
+        self.cells = {}    # (row, col) -> Block
+        self.blocks = []   # dense list for drawing and random picks
+        self.changed = []  # rects of bricks that broke or cracked (for redraws)
+
+    # ---------- CONTAINER METHODS ---------- #
+    # The grid behaves like the old list of blocks for len(), iteration,
+    # indexing (random.choice) and remove().
+    def __len__(self):
+        return len(self.blocks)
+
+    def __iter__(self):
+        return iter(self.blocks)
+
+    def __getitem__(self, index):
+        return self.blocks[index]
+
+    # Add a brick in the given layout cell.
+    def add(self, block, row, col):
+        block.cell = (row, col)
+        block.grid_index = len(self.blocks)
+        self.cells[block.cell] = block
+        self.blocks.append(block)
+
+    # Remove a brick in O(1) by swapping the last brick into its slot.
+    def remove(self, block):
+        if self.cells.get(block.cell) is not block:
+            return  # already removed this frame
+
+        del self.cells[block.cell]
+        self.changed.append(block.rect)
+
+        last = self.blocks.pop()
+        if last is not block:
+            self.blocks[block.grid_index] = last
+            last.grid_index = block.grid_index
+
+    # Damage a brick. Returns True if it should break (like Block.hit).
+    def hit(self, block):
+        destroyed = block.hit()
+        if not destroyed:
+            self.changed.append(block.rect)  # now shows the cracked image
+        return destroyed
+
+    # Return and clear the rects of bricks that changed since the last call.
+    def take_changes(self):
+        changed = self.changed
+        self.changed = []
+        return changed
+
+    # ---------- LOOKUPS ---------- #
+    # Return bricks touching rect, in row-major (layout) order.
+    # Searches the cells under rect plus one neighbouring cell on each
+    # side, since square bricks overhang their cell slightly.
+    def query(self, rect):
+        if not self.cells:
+            return []
+
+        first_col = int((rect.left - self.origin_x) // self.cell_width) - 1
+        last_col = int((rect.right - self.origin_x) // self.cell_width) + 1
+        first_row = int((rect.top - self.origin_y) // self.cell_height) - 1
+        last_row = int((rect.bottom - self.origin_y) // self.cell_height) + 1
+
+        hits = []
+        cells = self.cells
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                block = cells.get((row, col))
+                if block is not None and block.rect.colliderect(rect):
+                    hits.append(block)
+        return hits
+
+    # Return the first brick touching rect, or None.
+    def first_hit(self, rect):
+        hits = self.query(rect)
+        return hits[0] if hits else None
@@ -1,58 +1,58 @@
 """
 This file creates the Coin object for the game.
-It loads the coin image, moves the coin downward,
+It gets the coin image from the shared cache, moves the coin downward,
 and checks when the coin goes off the screen.
 """
 
 import os
 import pygame
+import assets
 from common import ROOT_PATH, SCREEN_HEIGHT
 
+COIN_IMAGE = os.path.join(ROOT_PATH, "media", "graphics", "Particles", "coin.png")
+COIN_SIZE = (20, 20)
+
+
+# ---------- IMAGE LOADING ---------- #
+# Load the coin image into the shared cache ahead of time.
+def preload_images():
+    assets.preload([(COIN_IMAGE, COIN_SIZE)])
+
 
 # ---------- COIN CLASS ---------- #
 # Represents one falling coin used for item drops.
 class Coin:
     # Set up the coin position, size, and image.
     def __init__(self, x, y):
-        self.x = x
-        self.y = y
-
-        self.width = 20
-        self.height = 20
+        self.width, self.height = COIN_SIZE
         self.velocity_y = 4
 
         # Rectangle used for collision checks
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect = pygame.Rect(x, y, self.width, self.height)
 
-        # Load and scale the coin image
-        try:
-            img_path = os.path.join(
-                ROOT_PATH,
-                "media",
-                "graphics",
-                "Particles",
-                "coin.png"
-            )
-            self.image = pygame.image.load(img_path).convert_alpha()
-            self.image = pygame.transform.scale(
-                self.image,
-                (self.width, self.height)
-            )
-        except Exception:
-            self.image = None
-            print("Warning: Could not load coin.png")
+        # Shared coin image
+        self.image = assets.load_image(COIN_IMAGE, COIN_SIZE)
+
+        self.reset(x, y)
+
+    # Place the coin at (x, y). Pooled coins are reused through this.
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.prev_pos = None  # no old position: drawn where it spawns
+        self.rect.update(x, y, self.width, self.height)
 
     # Move the coin downward each frame.
     def update(self):
         self.y += self.velocity_y
         self.rect.y = self.y
 
-    # Draw the coin on the screen.
+    # Draw the coin on the screen and return the area it covers.
     def draw(self, screen):
         if self.image:
-            screen.blit(self.image, (self.x, self.y))
+            return screen.blit(self.image, (self.x, self.y))
         else:
-            pygame.draw.circle(
+            return pygame.draw.circle(
                 screen,
                 (255, 215, 0),
                 (int(self.x + self.width // 2),
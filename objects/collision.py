@@ -0,0 +1,138 @@
+"""
+This file holds the swept (continuous) collision test used for balls.
+Instead of checking where a ball ends up after a frame, it finds the
+exact moment during the frame that the ball first touches a rectangle,
+so fast balls can't pass through thin bricks or the paddle.
+"""
+
+import math
+
+
+# ---------- SWEEP HELPERS ---------- #
+# Time (0..1) the point p + d*t enters the box, and the box side it enters
+# through as a normal. None if it doesn't enter during this move.
+def _sweep_box(px, py, dx, dy, left, top, right, bottom):
+    t_near = -math.inf
+    t_far = math.inf
+    normal = (0.0, 0.0)
+
+    if dx == 0:
+        if px <= left or px >= right:
+            return None
+    else:
+        t1 = (left - px) / dx
+        t2 = (right - px) / dx
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_near:
+            t_near = t1
+            normal = (-1.0 if dx > 0 else 1.0, 0.0)
+        t_far = min(t_far, t2)
+
+    if dy == 0:
+        if py <= top or py >= bottom:
+            return None
+    else:
+        t1 = (top - py) / dy
+        t2 = (bottom - py) / dy
+        if t1 > t2:
+            t1, t2 = t2, t1
+        if t1 > t_near:
+            t_near = t1
+            normal = (0.0, -1.0 if dy > 0 else 1.0)
+        t_far = min(t_far, t2)
+
+    if t_near > t_far or t_near < 0 or t_near > 1:
+        return None
+    return t_near, normal
+
+
+# Time (0..1) the point p + d*t reaches distance radius from (cx, cy).
+def _sweep_point(px, py, dx, dy, cx, cy, radius):
+    fx = px - cx
+    fy = py - cy
+    a = dx * dx + dy * dy
+    b = 2 * (fx * dx + fy * dy)
+    c = fx * fx + fy * fy - radius * radius
+
+    if a == 0 or b >= 0:
+        return None  # not moving, or moving away from the corner
+
+    disc = b * b - 4 * a * c
+    if disc < 0:
+        return None
+
+    t = (-b - math.sqrt(disc)) / (2 * a)
+    if t < 0 or t > 1:
+        return None
+
+    nx = (fx + dx * t) / radius
+    ny = (fy + dy * t) / radius
+    return t, (nx, ny)
+
+
+# If the circle already overlaps rect, the direction to push it out.
+def _overlap_normal(px, py, radius, rect):
+    qx = min(max(px, rect.left), rect.right)
+    qy = min(max(py, rect.top), rect.bottom)
+    ox = px - qx
+    oy = py - qy
+    dist_sq = ox * ox + oy * oy
+
+    if dist_sq >= radius * radius:
+        return None
+
+    if dist_sq > 0:
+        dist = math.sqrt(dist_sq)
+        return ox / dist, oy / dist
+
+    # Center is inside the rect: leave through the nearest side
+    gaps = (
+        (px - rect.left, (-1.0, 0.0)),
+        (rect.right - px, (1.0, 0.0)),
+        (py - rect.top, (0.0, -1.0)),
+        (rect.bottom - py, (0.0, 1.0)),
+    )
+    return min(gaps)[1]
+
+
+# ---------- SWEPT CIRCLE VS RECT ---------- #
+# Moving a circle at (px, py) by (dx, dy) this frame, return (t, (nx, ny))
+# for the first touch with rect, where t is the fraction of the move
+# (0..1) and (nx, ny) is the surface normal. None if it never touches.
+# A circle that already overlaps rect and moves further in hits at t=0.
+def sweep_circle_rect(px, py, dx, dy, radius, rect):
+    # Quick reject: the whole move stays clear of rect
+    if (min(px, px + dx) - radius > rect.right or max(px, px + dx) + radius < rect.left
+            or min(py, py + dy) - radius > rect.bottom or max(py, py + dy) + radius < rect.top):
+        return None
+
+    pushed = _overlap_normal(px, py, radius, rect)
+    if pushed is not None:
+        if dx * pushed[0] + dy * pushed[1] < 0:
+            return 0.0, pushed
+        return None
+
+    best = None
+
+    # The rect grown by radius is two boxes (wide and tall) plus
+    # four rounded corners
+    for box in (
+        (rect.left - radius, rect.top, rect.right + radius, rect.bottom),
+        (rect.left, rect.top - radius, rect.right, rect.bottom + radius),
+    ):
+        hit = _sweep_box(px, py, dx, dy, *box)
+        if hit and (best is None or hit[0] < best[0]):
+            best = hit
+
+    for cx, cy in (
+        (rect.left, rect.top),
+        (rect.right, rect.top),
+        (rect.left, rect.bottom),
+        (rect.right, rect.bottom),
+    ):
+        hit = _sweep_point(px, py, dx, dy, cx, cy, radius)
+        if hit and (best is None or hit[0] < best[0]):
+            best = hit
+
+    return best
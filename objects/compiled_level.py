@@ -0,0 +1,107 @@
+"""
+This file creates the CompiledLevel used to build the bricks of a level.
+A layout from scenes/levels.py (or a level file) is read once into a few
+packed arrays: layout cell, position, type, color and hit points of every
+brick.
+Starting the level again only walks those arrays, and every brick of the
+same color and type shares one set of scaled images.
+"""
+
+import json
+from array import array
+
+from common import COLORS
+from objects.block import Block, BRICK1_SIZE, BRICK2_SIZE, brick_hp
+from objects.brick_grid import BrickGrid
+
+# Space between layout cells
+BRICK_SPACE = 10
+
+
+# ---------- COMPILED LEVEL CLASS ---------- #
+# One brick layout, placed for a screen of the given width.
+class CompiledLevel:
+    # Read the layout rows. Bricks are centered on screen_width and the
+    # first row starts at top.
+    def __init__(self, layout, screen_width, top):
+        block_width, block_height = BRICK1_SIZE
+        self.cell_width = block_width + BRICK_SPACE
+        self.cell_height = block_height + BRICK_SPACE
+
+        cols = len(layout[0]) if layout else 0
+        total_blocks_width = cols * block_width + (cols - 1) * BRICK_SPACE
+        self.left = (screen_width - total_blocks_width) // 2
+        self.top = top
+
+        # One entry per brick, in layout (row-major) order
+        self.rows = array("H")
+        self.cols = array("H")
+        self.xs = array("h")
+        self.ys = array("h")
+        self.types = array("B")
+        self.colors = array("B")  # index into COLORS
+        self.hps = array("B")     # hit points at the start of the level
+
+        # Square bricks are centered in their cell
+        square_shift_x = (block_width - BRICK2_SIZE[0]) // 2
+        square_shift_y = (block_height - BRICK2_SIZE[1]) // 2
+
+        for row_index, row in enumerate(layout):
+            for col_index, cell in enumerate(row):
+
+                if cell == 0:
+                    continue
+
+                # normal number mode
+                if isinstance(cell, int):
+                    block_type = cell
+                    color_index = row_index % len(COLORS)
+
+                # tuple mode (type, color)
+                elif isinstance(cell, (tuple, list)):
+                    block_type = cell[0]
+                    color_index = cell[1] % len(COLORS)
+                else:
+                    continue
+
+                x = self.left + col_index * self.cell_width
+                y = top + row_index * self.cell_height
+                if block_type == 2:
+                    x += square_shift_x
+                    y += square_shift_y
+
+                self.rows.append(row_index)
+                self.cols.append(col_index)
+                self.xs.append(x)
+                self.ys.append(y)
+                self.types.append(block_type)
+                self.colors.append(color_index)
+                self.hps.append(brick_hp(COLORS[color_index], block_type))
+
+    def __len__(self):
+        return len(self.types)
+
+    # Return a fresh BrickGrid holding the bricks of this level.
+    def build_grid(self):
+        blocks = BrickGrid(self.left, self.top, self.cell_width, self.cell_height)
+
+        for row, col, x, y, block_type, color_index, hp in zip(
+            self.rows, self.cols, self.xs, self.ys, self.types, self.colors, self.hps
+        ):
+            blocks.add(Block(x, y, COLORS[color_index], block_type, hp), row, col)
+
+        return blocks
+
+    # ---------- FILES ---------- #
+    # Compile a level file: a JSON list of rows written like the layouts
+    # in scenes/levels.py, with [type, color] lists in place of tuples.
+    # Raises ValueError if the file is not a list of rows.
+    @classmethod
+    def from_file(cls, path, screen_width, top):
+        with open(path, "r", encoding="utf8") as f:
+            layout = json.load(f)
+
+        if not isinstance(layout, list) or not all(isinstance(row, list) for row in layout):
+            raise ValueError(f"{path} is not a list of brick rows")
+
+        return cls(layout, screen_width, top)
@@ -0,0 +1,79 @@
+"""
+This file creates the DropSampler used to pick what a broken brick drops.
+A drop table (item -> chance) is compiled once into Walker alias tables,
+so every pick costs one random number and one lookup, however many items
+the table has. sample(n) picks many drops at once with NumPy, for
+headless balance runs that break millions of bricks.
+"""
+
+import numpy as np
+
+
+# ---------- DROP SAMPLER CLASS ---------- #
+# One compiled drop table. Chances are relative, so they don't have to
+# add up to 1, and items with a chance of 0 are left out. Raises
+# ValueError if a chance is negative or none is above 0.
+class DropSampler:
+    def __init__(self, table):
+        if any(chance < 0 for chance in table.values()):
+            raise ValueError("drop table chances can't be negative")
+
+        self.items = [item for item, chance in table.items() if chance > 0]
+        if not self.items:
+            raise ValueError("drop table needs at least one chance above 0")
+
+        weights = [float(table[item]) for item in self.items]
+        total = sum(weights)
+
+        # Vose's alias method: split the chances into len(items) columns of
+        # height 1. Column i keeps item i with chance prob[i] and hands the
+        # rest of the column to item alias[i].
+        count = len(self.items)
+        scaled = [weight * count / total for weight in weights]
+        self.prob = [1.0] * count
+        self.alias = list(range(count))
+
+        underfull = [i for i, p in enumerate(scaled) if p < 1.0]
+        overfull = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while underfull and overfull:
+            small = underfull.pop()
+            large = overfull.pop()
+            self.prob[small] = scaled[small]
+            self.alias[small] = large
+            scaled[large] += scaled[small] - 1.0
+            (underfull if scaled[large] < 1.0 else overfull).append(large)
+        # Anything left over is 1 up to rounding error and keeps its column
+
+        # Same tables as arrays for sample()
+        self._names = np.array(self.items)
+        self._prob = np.array(self.prob)
+        self._alias = np.array(self.alias, dtype=np.intp)
+
+        # Normalized chances, for checking and for balance reports
+        self.chances = {item: weight / total for item, weight in zip(self.items, weights)}
+
+    def __len__(self):
+        return len(self.items)
+
+    # ---------- SAMPLING ---------- #
+    # Pick one item using rand (a random.Random). Uses exactly one
+    # rand.random() call, so seeded runs stay in step.
+    def pick(self, rand):
+        count = len(self.items)
+        roll = rand.random() * count
+        column = min(int(roll), count - 1)  # guard against rounding up to count
+        if roll - column < self.prob[column]:
+            return self.items[column]
+        return self.items[self.alias[column]]
+
+    # Pick n items at once and return them as a NumPy array of names.
+    # generator is a NumPy Generator (a fresh unseeded one if None).
+    def sample(self, n, generator=None):
+        if generator is None:
+            generator = np.random.default_rng()
+
+        count = len(self.items)
+        roll = generator.random(n) * count
+        column = np.minimum(roll.astype(np.intp), count - 1)
+        keep = (roll - column) < self._prob[column]
+        return self._names[np.where(keep, column, self._alias[column])]
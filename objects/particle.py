@@ -1,128 +1,272 @@
 """
-This file creates the Particle object for the game.
-It controls how each particle moves, shrinks, and disappears.
+This file creates the particle effects for the game.
+All particles live in a ParticleSystem, which stores every field
+(position, velocity, size, life, color) in NumPy arrays so the whole
+pool moves in a few array operations each frame.
+Glows are pre-rendered once by the GlowCache and reused.
 """
 
+import os
 import pygame
-import random
 import math
+from collections import OrderedDict
+import numpy as np
+import assets
+from common import ROOT_PATH
+from rng import stream, np_stream
 
+# Random sources for particle spawns and fireball trails (seeded per session)
+rng = np_stream("particles")
+trail_rng = stream("trails")
 
-# ---------- PARTICLE CLASS ---------- #
-# Particle object used for small visual effects.
-class Particle:
-    # Setup the particle with position, color, and movement.
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(3, 6)
-        self.velocity_x = random.uniform(-3, 3)
-        self.velocity_y = random.uniform(-5, -2)
-        self.gravity = 0.3
-        self.lifetime = 30
-        self.age = 0
-
-    # Update the particle movement and shrink it over time.
-    def update(self):
-        self.x += self.velocity_x
-        self.y += self.velocity_y
-        self.velocity_y += self.gravity
-        self.age += 1
-        self.size = max(1, self.size - 0.1)
+# Colors used by explosions and fireball trails
+WHITE_HOT = (255, 255, 255)
+ORANGE_GLOW = (255, 150, 0)
+TRAIL_COLORS = [(255, 150, 0), (255, 200, 50), (255, 100, 0)]
 
-    # Draw the particle on the screen.
-    def draw(self, screen):
-        if self.age < self.lifetime:
-            pygame.draw.circle(
-                screen,
-                self.color,
-                (int(self.x), int(self.y)),
-                int(self.size)
-            )
-
-    # Check if the particle should be removed.
-    def is_dead(self):
-        return self.age >= self.lifetime or self.size <= 1
-
-# Particle specifically for explosion effects with glow
-class ExplosionParticle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        angle = random.uniform(0, 2 * math.pi)
-        speed = random.uniform(2, 8)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        self.color = color
-        self.size = random.randint(4, 10)
-        self.life = random.randint(25, 45)
-        self.max_life = self.life
-        self.glow_size = random.randint(15, 30)
-    
+FIREBALL_IMAGE = os.path.join(ROOT_PATH, "media", "graphics", "Particles", "moving_fireball.png")
+FIREBALL_SIZE = (30, 30)
+
+
+# ---------- IMAGE LOADING ---------- #
+# Load the fireball image into the shared cache ahead of time.
+def preload_images():
+    assets.preload([(FIREBALL_IMAGE, FIREBALL_SIZE)])
+
+
+# ---------- GLOW CACHE CLASS ---------- #
+# Pre-rendered glow circles keyed by (radius, alpha, color).
+# Alpha is quantized so nearby values share one sprite, and the least
+# recently used sprites are dropped once max_size is reached.
+class GlowCache:
+    def __init__(self, max_size=512, alpha_step=16):
+        self.max_size = max_size
+        self.alpha_step = alpha_step
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # Get (or render once) the glow sprite for these values.
+    def get(self, radius, alpha, color):
+        alpha = min(255, alpha - alpha % self.alpha_step)
+        key = (radius, alpha, color)
+
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+
+        self.misses += 1
+
+        # Additive blending: black adds nothing, so alpha is baked into the color
+        sprite = pygame.Surface((radius * 2, radius * 2))
+        scale = alpha / 255
+        glow_color = (int(color[0] * scale), int(color[1] * scale), int(color[2] * scale))
+        pygame.draw.circle(sprite, glow_color, (radius, radius), radius)
+        if pygame.display.get_surface() is not None:
+            sprite = sprite.convert()
+
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_size:
+            self.sprites.popitem(last=False)
+
+        return sprite
+
+    # Add a glow centered on (x, y) onto the screen.
+    def blit(self, screen, x, y, radius, alpha, color):
+        if radius <= 0 or alpha < self.alpha_step:
+            return
+        sprite = self.get(radius, alpha, color)
+        screen.blit(sprite, (x - radius, y - radius), special_flags=pygame.BLEND_RGB_ADD)
+
+    def clear(self):
+        self.sprites.clear()
+
+
+# Shared by every particle system and fireball
+glow_cache = GlowCache()
+
+
+# ---------- PARTICLE SYSTEM CLASS ---------- #
+# Fixed-capacity particle pool, one NumPy array per field.
+# Live particles are always packed at the front (indices 0..count-1).
+class ParticleSystem:
+    def __init__(self, capacity=2048):
+        self.capacity = capacity
+        self.count = 0
+
+        self.pos = np.zeros((capacity, 2))
+        self.vel = np.zeros((capacity, 2))
+        self.gravity = np.zeros(capacity)
+        self.size = np.zeros(capacity)
+        self.shrink = np.zeros(capacity)
+        self.life = np.zeros(capacity, dtype=np.int32)
+        self.max_life = np.ones(capacity, dtype=np.int32)
+        self.glow = np.zeros(capacity, dtype=np.int32)  # glow radius, 0 = plain spark
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+        self._fields = (
+            self.pos, self.vel, self.gravity, self.size, self.shrink,
+            self.life, self.max_life, self.glow, self.color
+        )
+
+    def __len__(self):
+        return self.count
+
+    # Remove every particle.
+    def clear(self):
+        self.count = 0
+
+    # Claim up to n free slots. New particles are dropped when the pool is full.
+    def _reserve(self, n):
+        start = self.count
+        end = min(self.capacity, start + n)
+        self.count = end
+        return slice(start, end), end - start
+
+    # ---------- SPAWNING ---------- #
+    # Small sparks thrown up when a brick breaks.
+    def emit_sparks(self, x, y, color, count=15):
+        self.emit_sparks_many([(x, y)], [color], count)
+
+    # Sparks for several bricks in one go: count sparks at each (x, y)
+    # point, in the matching color.
+    def emit_sparks_many(self, points, colors, count=15):
+        s, n = self._reserve(len(points) * count)
+        if n <= 0:
+            return
+
+        self.pos[s] = np.repeat(np.asarray(points, dtype=float), count, axis=0)[:n]
+        self.vel[s, 0] = rng.uniform(-3, 3, n)
+        self.vel[s, 1] = rng.uniform(-5, -2, n)
+        self.gravity[s] = 0.3
+        self.size[s] = rng.integers(3, 7, n)
+        self.shrink[s] = 0.1
+        self.life[s] = 30
+        self.max_life[s] = 30
+        self.glow[s] = 0
+        self.color[s] = np.repeat(np.asarray(colors, dtype=np.uint8), count, axis=0)[:n]
+
+    # Glowing particles flying out in every direction (explosions, trails).
+    def emit_burst(self, x, y, color, count):
+        s, n = self._reserve(count)
+        if n <= 0:
+            return
+
+        angle = rng.uniform(0, 2 * math.pi, n)
+        speed = rng.uniform(2, 8, n)
+
+        self.pos[s] = (x, y)
+        self.vel[s, 0] = np.cos(angle) * speed
+        self.vel[s, 1] = np.sin(angle) * speed
+        self.gravity[s] = 0.2
+        self.size[s] = rng.integers(4, 11, n)
+        self.shrink[s] = 0.15
+        self.life[s] = rng.integers(25, 46, n)
+        self.max_life[s] = self.life[s]
+        self.glow[s] = rng.integers(15, 31, n)
+        self.color[s] = color
+
+    # ---------- UPDATE ---------- #
+    # Move, fall and shrink every particle, then pack out the dead ones.
     def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.vy += 0.2  # Gravity
-        self.life -= 1
-        self.size = max(1, self.size - 0.15)
-        return self.life > 0
-    
+        n = self.count
+        if n == 0:
+            return
+
+        self.pos[:n] += self.vel[:n]
+        self.vel[:n, 1] += self.gravity[:n]
+        self.life[:n] -= 1
+        np.maximum(self.size[:n] - self.shrink[:n], 1, out=self.size[:n])
+
+        # Sparks also die once they have shrunk away
+        alive = (self.life[:n] > 0) & ((self.glow[:n] > 0) | (self.size[:n] > 1))
+
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            k = len(keep)
+            for field in self._fields:
+                field[:k] = field[keep]
+            self.count = k
+
+    # ---------- DRAW ---------- #
+    # Draw every live particle. Returns the area each one covers (the
+    # renderer merges the ones close together), empty if none are alive.
     def draw(self, screen):
-        if self.life > 0:
-            alpha = int(255 * (self.life / self.max_life))
-            
+        n = self.count
+        if n == 0:
+            return []
+
+        xs = self.pos[:n, 0].astype(int).tolist()
+        ys = self.pos[:n, 1].astype(int).tolist()
+        sizes = self.size[:n].astype(int).tolist()
+        glows = self.glow[:n].tolist()
+        alphas = (255 * self.life[:n] // self.max_life[:n]).tolist()
+        colors = [tuple(c) for c in self.color[:n].tolist()]
+
+        drawn = []
+        for x, y, size, glow, alpha, color in zip(xs, ys, sizes, glows, alphas, colors):
             # Draw glow effect (multiple layers for better glow)
-            for i in range(3):
-                glow_size = int(self.glow_size - (i * 5))
-                if glow_size > 0:
-                    glow_alpha = max(0, alpha // (i + 2))
-                    glow_surf = pygame.Surface((glow_size * 2, glow_size * 2), pygame.SRCALPHA)
-                    glow_color = (*self.color, glow_alpha)
-                    pygame.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-                    screen.blit(glow_surf, (int(self.x - glow_size), int(self.y - glow_size)))
-            
+            if glow:
+                for i in range(3):
+                    glow_cache.blit(screen, x, y, glow - (i * 5), alpha // (i + 2), color)
+
             # Draw core particle
-            pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), int(self.size))
+            pygame.draw.circle(screen, color, (x, y), size)
+
+            # Square around the glow and core
+            reach = max(glow, size) + 2
+            drawn.append(pygame.Rect(x - reach, y - reach, reach * 2, reach * 2))
+
+        return drawn
 
 
 class ExplosionManager:
     """Manages all explosion particle effects"""
-    def __init__(self):
-        self.particles = []
-    
+    def __init__(self, capacity=4096):
+        self.particles = ParticleSystem(capacity)
+
     def create_explosion(self, x, y, color=(255, 200, 50), num_particles=40):
         """Create an explosion at x, y position"""
-        # Main colored particles (reduced from 50 to 20)
-        for _ in range(num_particles):
-            self.particles.append(ExplosionParticle(x, y, color))
-        
-        # White-hot core particles (reduced from 20 to 8)
-        for _ in range(8):
-            self.particles.append(ExplosionParticle(x, y, (255, 255, 255)))
-        
-        # Orange outer particles (reduced from 15 to 6)
-        for _ in range(6):
-            self.particles.append(ExplosionParticle(x, y, (255, 150, 0)))
-    
+        # Main colored particles
+        self.particles.emit_burst(x, y, color, num_particles)
+
+        # White-hot core particles
+        self.particles.emit_burst(x, y, WHITE_HOT, 8)
+
+        # Orange outer particles
+        self.particles.emit_burst(x, y, ORANGE_GLOW, 6)
+
     def update(self):
         """Update all particles, remove dead ones"""
-        self.particles = [p for p in self.particles if p.update()]
-    
+        self.particles.update()
+
     def draw(self, screen):
-        """Draw all particles"""
-        for particle in self.particles:
-            particle.draw(screen)
+        """Draw all particles and return the areas they cover"""
+        return self.particles.draw(screen)
 
 
 class Fireball:
     """Fireball projectile that shoots toward a target"""
     def __init__(self, x, y, target_x, target_y):
-        self.width = 30
-        self.height = 30
+        self.width, self.height = FIREBALL_SIZE
+
+        # Trail holds at most 15 particles to prevent lag
+        self.trail_particles = ParticleSystem(capacity=15)
+
+        # Shared fireball image
+        self.image = assets.load_image(FIREBALL_IMAGE, (self.width, self.height))
+
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.reset(x, y, target_x, target_y)
+
+    def reset(self, x, y, target_x, target_y):
+        """Aim the fireball from (x, y) at the target (pooled fireballs reuse this)"""
         self.x = x
         self.y = y
-        
+        self.prev_pos = None  # drawn where it was fired until it has moved once
+
         # Calculate direction toward target
         dx = target_x - x
         dy = target_y - y
@@ -136,20 +280,9 @@ class Fireball:
         else:
             self.velocity_x = 0
             self.velocity_y = -10
-        
-        self.trail_particles = []
-        
-        # Load fireball image
-        self.image = None
-        try:
-            import os
-            from common import ROOT_PATH
-            img = pygame.image.load(os.path.join(ROOT_PATH, "media", "graphics", "Particles", "moving_fireball.png"))
-            self.image = pygame.transform.scale(img, (self.width, self.height))
-        except Exception as e:
-            print(f"Warning: Could not load moving_fireball.png - {e}")
-        
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+
+        self.trail_particles.clear()
+        self.rect.update(x, y, self.width, self.height)
         self.active = True
 
     def update(self):
@@ -159,25 +292,24 @@ class Fireball:
         self.rect.y = int(self.y)
         
         # Add trail particles occasionally (reduced rate for better performance)
-        if random.random() < 0.2:
-            trail_color = random.choice([(255, 150, 0), (255, 200, 50), (255, 100, 0)])
-            self.trail_particles.append(ExplosionParticle(self.x + self.width//2, self.y + self.height//2, trail_color))
+        if trail_rng.random() < 0.2:
+            trail_color = trail_rng.choice(TRAIL_COLORS)
+            self.trail_particles.emit_burst(self.x + self.width//2, self.y + self.height//2, trail_color, 1)
         
-        # Update trail (keep only first 15 particles to prevent lag)
-        self.trail_particles = [p for p in self.trail_particles if p.update()][:15]
+        self.trail_particles.update()
         
         # Deactivate if off screen (any edge)
         if self.y < -50 or self.y > 800 or self.x < -50 or self.x > 1050:
             self.active = False
         
+    # Returns the areas covered by the fireball and its trail
     def draw(self, screen):
         # Draw trail first (behind fireball)
-        for particle in self.trail_particles:
-            particle.draw(screen)
+        drawn = self.trail_particles.draw(screen)
         
         # Draw fireball (convert to int for smooth rendering)
         if self.image:
-            screen.blit(self.image, (int(self.x), int(self.y)))
+            drawn.append(screen.blit(self.image, (int(self.x), int(self.y))))
         else:
             # Fallback: draw orange/red circle with glow
             center_x = int(self.x + self.width // 2)
@@ -188,14 +320,17 @@ class Fireball:
             for i in range(3):
                 glow_radius = radius + (8 - i * 2)
                 alpha = 80 - (i * 25)
-                glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                glow_color = (255, 150, 0, alpha)
-                pygame.draw.circle(glow_surf, glow_color, (glow_radius, glow_radius), glow_radius)
-                screen.blit(glow_surf, (center_x - glow_radius, center_y - glow_radius))
+                glow_cache.blit(screen, center_x, center_y, glow_radius, alpha, ORANGE_GLOW)
             
             # Core fireball
             pygame.draw.circle(screen, (255, 200, 50), (center_x, center_y), radius)
             pygame.draw.circle(screen, (255, 255, 200), (center_x, center_y), radius - 4)
+
+            glow_reach = radius + 8
+            drawn.append(pygame.Rect(center_x - glow_reach, center_y - glow_reach,
+                                     glow_reach * 2, glow_reach * 2))
+
+        return drawn
             
     def is_off_screen(self):
         return self.y < 120 or self.y > 800 or self.x < -50 or self.x > 1050
\ No newline at end of file
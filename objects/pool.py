@@ -0,0 +1,82 @@
+"""
+This file creates the ObjectPool used to reuse short-lived game objects.
+Coins, power ups, blasts and fireballs come and go many times a second.
+Instead of building a new object (with its Rect) for each one, a pool
+hands back an old one set up again through its reset() method.
+Each pool counts how many objects are live, the most that were live at
+once, and how many it ever built, so pool sizes can be tuned.
+"""
+
+
+# ---------- OBJECT POOL CLASS ---------- #
+# Hands out objects of one class. The class must take the same arguments
+# in __init__ and reset(), so a reused object ends up like a new one.
+class ObjectPool:
+    def __init__(self, cls):
+        self.cls = cls
+        self.free = []
+
+        # Counters
+        self.live = 0       # handed out and not released yet
+        self.peak = 0       # most live at the same time
+        self.allocated = 0  # objects ever built
+
+    def __len__(self):
+        return self.live
+
+    # ---------- SIZING ---------- #
+    # Build objects ahead of time until the pool holds at least size.
+    # args are placeholder constructor arguments; acquire() resets them.
+    def reserve(self, size, *args):
+        while self.allocated < size:
+            self.free.append(self.cls(*args))
+            self.allocated += 1
+
+    # ---------- ACQUIRE / RELEASE ---------- #
+    # Return an object set up with args, reused if one is free.
+    def acquire(self, *args):
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+        else:
+            obj = self.cls(*args)
+            self.allocated += 1
+
+        self.live += 1
+        if self.live > self.peak:
+            self.peak = self.live
+        return obj
+
+    # Take an object back. It must not be used again until acquired.
+    def release(self, obj):
+        self.live -= 1
+        self.free.append(obj)
+
+    # Remove items[index] from an active list and release it. The last
+    # item is moved into its place, so the list order is not kept.
+    def release_at(self, items, index):
+        obj = items[index]
+        last = items.pop()
+        if index < len(items):
+            items[index] = last
+        self.release(obj)
+
+    # Release every object in an active list and empty it.
+    def release_all(self, items):
+        for obj in items:
+            self.release(obj)
+        items.clear()
+
+    # ---------- TELEMETRY ---------- #
+    # Start measuring the peak again from the current live count.
+    def reset_peak(self):
+        self.peak = self.live
+
+    # Counters as a dict, e.g. for benchmark results.
+    def stats(self):
+        return {
+            "live": self.live,
+            "peak": self.peak,
+            "allocated": self.allocated,
+            "free": len(self.free),
+        }
@@ -1,85 +1,78 @@
 """
 This file creates the PowerUp and BlueBlast objects for the game.
-It loads their images, moves them on the screen,
+It gets their images from the shared cache, moves them on the screen,
 and checks when they should be removed.
 """
 
 import pygame
 import os
+import assets
 from common import ROOT_PATH, SCREEN_HEIGHT
 
+particles_path = os.path.join(ROOT_PATH, "media", "graphics", "Particles")
+
+# Image file for each power up type
+POWERUP_IMAGES = {
+    "blast": "blast.png",
+    "small_paddle": "small paddle.png",
+    "triple_ball": "Tripleball.png",
+    "big_paddle": "big paddle.png",
+    "slow": "slow.png",
+    "shield": "shield.png",
+    "reverse": "reverse.png",
+    "fireball": "fireball.png",
+}
+
+BLUE_BLAST_IMAGE = "blue-blast.png"
+BLUE_BLAST_SIZE = (20, 40)
+
+
+# Size of a power up icon on screen
+def powerup_size(powerup_type):
+    # Triple ball size update
+    if powerup_type == "triple_ball":
+        return 60, 60
+    return 30, 30
+
+
+# ---------- IMAGE LOADING ---------- #
+# Load every power up and blast image into the shared cache ahead of time.
+def preload_images():
+    assets.preload(
+        [(os.path.join(particles_path, file), powerup_size(kind))
+         for kind, file in POWERUP_IMAGES.items()]
+        + [(os.path.join(particles_path, BLUE_BLAST_IMAGE), BLUE_BLAST_SIZE)]
+    )
+
+
 # ---------- POWERUP CLASS ---------- #
 # Power up object that falls toward the player.
 class PowerUp:
     # ---------- SETUP ---------- #
     def __init__(self, x, y, powerup_type="blast"):
+        self.velocity_y = 4
+        self.rect = pygame.Rect(x, y, 0, 0)
+        self.reset(x, y, powerup_type)
+
+    # Place the power up at (x, y) as the given type. Pooled power ups
+    # are reused through this.
+    def reset(self, x, y, powerup_type="blast"):
         self.x = x
         self.y = y
-        self.velocity_y = 4
+        self.prev_pos = None  # a reused power up must not slide in from its old spot
         self.type = powerup_type  # "blast", "small_paddle", "triple_ball", "big_paddle", "fireball"
 
-        # Triple ball size update
-        if powerup_type == "triple_ball":
-            self.width = 60
-            self.height = 60
-        else:
-            self.width = 30
-            self.height = 30
+        self.width, self.height = powerup_size(powerup_type)
 
-        # Load power up image
+        # Shared power up image
         self.image = None
-        try:
-            if powerup_type == "blast":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "blast.png"
-                    )
-                )
-            elif powerup_type == "small_paddle":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "small paddle.png"
-                    )
-                )
-            elif powerup_type == "triple_ball":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "Tripleball.png"
-                    )
-                )
-            elif powerup_type == "big_paddle":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "big paddle.png"
-                    )
-                )
-            elif powerup_type == "slow":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "slow.png"
-                    )
-                )
-
-            elif powerup_type == "shield":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "shield.png"
-                    )
-                )
-
-            elif powerup_type == "reverse":
-                img = pygame.image.load(
-                    os.path.join(
-                        ROOT_PATH, "media", "graphics", "Particles", "reverse.png"
-                    )
-                )
-            elif powerup_type == "fireball":
-                img = pygame.image.load(os.path.join(ROOT_PATH, "media", "graphics", "Particles", "fireball.png"))
-                
-            self.image = pygame.transform.scale(img, (self.width, self.height))
-
-        except Exception as e:
-            print(f"Warning: Could not load {powerup_type} image - {e}")
+        if powerup_type in POWERUP_IMAGES:
+            self.image = assets.load_image(
+                os.path.join(particles_path, POWERUP_IMAGES[powerup_type]),
+                (self.width, self.height)
+            )
+
+        if self.image is None:
             self.debug_color = {
                 "blast": (0, 150, 255),
                 "small_paddle": (255, 165, 0),
@@ -88,7 +81,7 @@ class PowerUp:
                 "fireball": (255, 100, 0)
             }.get(powerup_type, (0, 100, 255))
 
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+        self.rect.update(x, y, self.width, self.height)
 
     # ---------- MOVEMENT ---------- #
     # Move the power up downward.
@@ -98,12 +91,12 @@ class PowerUp:
         self.rect.y = self.y
 
     # ---------- DRAW ---------- #
-    # Draw the power up on the screen.
+    # Draw the power up on the screen and return the area it covers.
     def draw(self, screen):
         if self.image:
-            screen.blit(self.image, (self.x, self.y))
+            return screen.blit(self.image, (self.x, self.y))
         else:
-            pygame.draw.rect(
+            return pygame.draw.rect(
                 screen,
                 getattr(self, "debug_color", (0, 100, 255)),
                 (self.x, self.y, self.width, self.height),
@@ -120,30 +113,22 @@ class PowerUp:
 class BlueBlast:
     # ---------- SETUP ---------- #
     def __init__(self, x, y):
-        self.width = 20
-        self.height = 40
-        self.x = x
-        self.y = y
+        self.width, self.height = BLUE_BLAST_SIZE
         self.velocity_y = -8
 
-        self.image = None
-        try:
-            img = pygame.image.load(
-                os.path.join(
-                    ROOT_PATH,
-                    "media",
-                    "graphics",
-                    "Particles",
-                    "blue-blast.png",
-                )
-            )
-            self.image = pygame.transform.scale(
-                img, (self.width, self.height)
-            )
-        except Exception as e:
-            print(f"Warning: Could not load blue-blast.png - {e}")
+        self.image = assets.load_image(
+            os.path.join(particles_path, BLUE_BLAST_IMAGE), BLUE_BLAST_SIZE
+        )
+
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.reset(x, y)
 
-        self.rect = pygame.Rect(self.x, self.y, self.width, self.height)
+    # Place the blast at (x, y). Pooled blasts are reused through this.
+    def reset(self, x, y):
+        self.x = x
+        self.y = y
+        self.prev_pos = None  # not interpolated until its first step
+        self.rect.update(x, y, self.width, self.height)
 
     # ---------- MOVEMENT ---------- #
     # Move the blast upward.
@@ -153,12 +138,12 @@ class BlueBlast:
         self.rect.y = self.y
 
     # ---------- DRAW ---------- #
-    # Draw the blast on the screen.
+    # Draw the blast on the screen and return the area it covers.
     def draw(self, screen):
         if self.image:
-            screen.blit(self.image, (self.x, self.y))
+            return screen.blit(self.image, (self.x, self.y))
         else:
-            pygame.draw.rect(
+            return pygame.draw.rect(
                 screen, (0, 150, 255),
                 (self.x, self.y, self.width, self.height)
             )
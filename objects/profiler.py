@@ -0,0 +1,182 @@
+"""
+This file creates the FrameProfiler used to find where frame time goes.
+Named sections of the game loop are timed with perf_counter_ns. Time spent
+in a section nested inside another counts only for the inner one, so the
+sections of a frame add up to the whole frame. The last few seconds of
+frames are kept for rolling p50/p95/p99 numbers and an on-screen bar
+graph, and the whole run can be written out as a CSV or JSON trace.
+"""
+
+import csv
+import json
+from time import perf_counter_ns
+
+import numpy as np
+import pygame
+
+# Percentiles shown and saved for each section
+PERCENTILES = (50, 95, 99)
+SUMMARY_EVERY = 30  # frames between updates of the on-screen numbers
+
+# Bar graph colors, one per section (reused if there are more sections)
+BAR_COLORS = [
+    (0, 255, 255), (255, 105, 180), (255, 255, 0), (0, 255, 0),
+    (255, 128, 0), (180, 0, 255), (80, 160, 255), (255, 80, 80),
+    (200, 200, 200), (160, 255, 160),
+]
+
+
+# ---------- FRAME PROFILER CLASS ---------- #
+# Times named sections of every frame. Does nothing unless enabled.
+class FrameProfiler:
+    # sections: names in the order they are graphed.
+    # window: how many recent frames the percentiles are taken over.
+    def __init__(self, sections, window=600, enabled=False):
+        self.names = list(sections)
+        self.window = window
+        self.enabled = enabled
+
+        self.indexes = {name: i for i, name in enumerate(self.names)}
+        self.stack = []  # (section index, start ns) of the open sections
+        self.current = [0] * len(self.names)  # ns per section, this frame
+
+        self.recent = np.zeros((window, len(self.names)), dtype=np.int64)
+        self.count = 0    # frames recorded since reset()
+        self.trace = []   # every recorded frame, for save()
+
+        self.summary_cache = None
+        self.overlay = None  # rendered rows for overlay_summary
+        self.overlay_summary = None
+
+    # ---------- SECTIONS ---------- #
+    # Start timing the named section (sections can be nested).
+    def begin(self, name):
+        if self.enabled:
+            self.stack.append((self.indexes[name], perf_counter_ns()))
+
+    # Stop timing the section started last.
+    def end(self):
+        if not self.enabled or not self.stack:
+            return
+        index, start = self.stack.pop()
+        elapsed = perf_counter_ns() - start
+        self.current[index] += elapsed
+
+        # The enclosing section only keeps the time outside this one
+        if self.stack:
+            self.current[self.stack[-1][0]] -= elapsed
+
+    # ---------- FRAMES ---------- #
+    # Clear the per-section totals for a new frame.
+    def begin_frame(self):
+        if not self.enabled:
+            return
+        self.stack.clear()
+        for i in range(len(self.current)):
+            self.current[i] = 0
+
+    # Store the finished frame's section times.
+    def end_frame(self):
+        if not self.enabled:
+            return
+        self.recent[self.count % self.window] = self.current
+        self.trace.append(tuple(self.current))
+        self.count += 1
+        if self.count % SUMMARY_EVERY == 0:
+            self.summary_cache = None
+
+    # Forget every recorded frame.
+    def reset(self):
+        self.recent[:] = 0
+        self.count = 0
+        self.trace = []
+        self.summary_cache = None
+
+    # ---------- RESULTS ---------- #
+    # Return {section: {"p50": ms, "p95": ms, "p99": ms}} over the
+    # window, or over every recorded frame if whole_run is True.
+    def summary(self, whole_run=False):
+        if whole_run:
+            frames = np.array(self.trace, dtype=np.int64).reshape(-1, len(self.names))
+        elif self.summary_cache is not None:
+            return self.summary_cache
+        else:
+            frames = self.recent[:min(self.count, self.window)]
+
+        result = {}
+        for i, name in enumerate(self.names):
+            if len(frames):
+                values = np.percentile(frames[:, i], PERCENTILES) / 1e6
+            else:
+                values = [0.0] * len(PERCENTILES)
+            result[name] = {f"p{p}": float(v) for p, v in zip(PERCENTILES, values)}
+
+        if not whole_run:
+            self.summary_cache = result
+        return result
+
+    # Draw a row per section at (x, y): name, p50/p95/p99 in ms, and a
+    # bar (p50 solid, out to p95 as an outline). Returns the area drawn.
+    def draw(self, screen, font, x, y, ms_scale=20, bar_width=240):
+        summary = self.summary()
+
+        # Only re-render the rows when the numbers change
+        if self.overlay is None or self.overlay_summary is not summary:
+            self.overlay = self.render_overlay(summary, font, ms_scale, bar_width)
+            self.overlay_summary = summary
+
+        return screen.blit(self.overlay, (x, y))
+
+    # Build the overlay surface for one summary.
+    def render_overlay(self, summary, font, ms_scale, bar_width):
+        padding = 6
+        row_height = font.get_height() + 2
+        numbers_x = padding + max(font.size(name)[0] for name in self.names) + 8
+        bar_x = numbers_x + font.size("00.00 00.00 00.00 ")[0]
+        bar_h = max(2, row_height - 6)
+
+        overlay = pygame.Surface(
+            (bar_x + bar_width + padding, len(self.names) * row_height + padding * 2),
+            pygame.SRCALPHA
+        )
+        overlay.fill((0, 0, 0, 160))
+
+        for i, name in enumerate(self.names):
+            color = BAR_COLORS[i % len(BAR_COLORS)]
+            row_y = padding + i * row_height
+            stats = summary[name]
+
+            overlay.blit(font.render(name, True, color), (padding, row_y))
+            numbers = f"{stats['p50']:.2f} {stats['p95']:.2f} {stats['p99']:.2f}"
+            overlay.blit(font.render(numbers, True, color), (numbers_x, row_y))
+
+            p50 = min(bar_width, int(stats["p50"] * ms_scale))
+            p95 = min(bar_width, int(stats["p95"] * ms_scale))
+            if p95 > 0:
+                pygame.draw.rect(overlay, color, (bar_x, row_y + 2, p95, bar_h), 1)
+            if p50 > 0:
+                pygame.draw.rect(overlay, color, (bar_x, row_y + 2, p50, bar_h))
+
+        return overlay
+
+    # ---------- FILES ---------- #
+    # Write the run to path: a CSV of every frame (ns per section), or,
+    # for a .json path, the percentiles plus the per-frame trace.
+    def save(self, path):
+        try:
+            if path.endswith(".json"):
+                with open(path, "w") as f:
+                    json.dump({
+                        "sections": self.names,
+                        "frames": len(self.trace),
+                        "summary_ms": self.summary(whole_run=True),
+                        "trace_ns": self.trace,
+                    }, f)
+            else:
+                with open(path, "w", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(["frame"] + [f"{name}_ns" for name in self.names])
+                    for frame, row in enumerate(self.trace):
+                        writer.writerow((frame,) + row)
+        except OSError as e:
+            print(f"Warning: Could not save profile to {path} - {e}")
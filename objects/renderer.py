@@ -0,0 +1,126 @@
+"""
+This file creates the PlayfieldRenderer used by the breakout scene.
+The background, bricks and level label live on a static layer that is
+only redrawn where a brick breaks or cracks. Each frame only the areas
+under moving things (balls, paddle, drops, particles, HUD) are restored
+from that layer, redrawn, and sent to the display.
+"""
+
+import pygame
+
+
+# Merge areas that overlap or are less than gap pixels apart, so many
+# small rects (e.g. one per particle) become a few larger ones. Rects
+# far from each other stay separate.
+def merge_rects(rects, gap):
+    merged = []
+    for rect in rects:
+        rect = rect.copy()
+        while True:
+            near = rect.inflate(gap * 2, gap * 2).collidelist(merged)
+            if near < 0:
+                break
+            rect.union_ip(merged.pop(near))
+        merged.append(rect)
+    return merged
+
+
+# ---------- PLAYFIELD RENDERER CLASS ---------- #
+# Dirty-rectangle renderer for one screen.
+class PlayfieldRenderer:
+    # Above this share of the screen, one full flip is cheaper than many rects
+    FULL_UPDATE_RATIO = 0.5
+
+    # Rects in one list closer than this are merged into one area
+    MERGE_GAP = 8
+
+    # draw_static(surface, world, area) draws the static layer.
+    # area is None for everything, or a Rect that needs redrawing.
+    def __init__(self, screen, draw_static):
+        self.screen = screen
+        self.draw_static = draw_static
+        self.static = screen.copy()
+        self.screen_rect = screen.get_rect()
+        self.screen_area = self.screen_rect.width * self.screen_rect.height
+
+        self.world = None
+        self.blocks = None
+
+        self.full_redraw = True
+        self.pending = []     # static layer areas waiting to be redrawn
+        self.last_rects = []  # sprite areas drawn last frame
+        self.rects = []       # sprite areas drawn this frame
+
+    # ---------- STATIC LAYER ---------- #
+    # Redraw the whole static layer (new level or new world).
+    def rebuild(self, world):
+        self.world = world
+        self.blocks = world.blocks
+        self.draw_static(self.static, world, None)
+        self.pending.clear()
+        self.full_redraw = True
+
+    # True if the static layer was built for a different world or level.
+    def is_stale(self, world):
+        return self.world is not world or self.blocks is not world.blocks
+
+    # Queue part of the static layer for redrawing (brick broke or cracked).
+    def invalidate(self, rect):
+        self.pending.append(pygame.Rect(rect))
+
+    # Something else drew over the screen (pause, messages), so the
+    # next frame has to be restored and presented in full.
+    def invalidate_all(self):
+        self.full_redraw = True
+
+    # ---------- FRAME ---------- #
+    # Restore the areas sprites covered last frame and apply brick changes.
+    def begin_frame(self):
+        screen = self.screen
+        static = self.static
+
+        for area in self.pending:
+            static.set_clip(area)
+            self.draw_static(static, self.world, area)
+        static.set_clip(None)
+
+        if self.full_redraw:
+            screen.blit(static, (0, 0))
+        else:
+            for area in self.last_rects:
+                screen.blit(static, area, area)
+            for area in self.pending:
+                screen.blit(static, area, area)
+                self.rects.append(area)
+
+        self.pending.clear()
+
+    # Record an area drawn this frame. Accepts a Rect, a list of Rects or None.
+    # Nearby rects in a list are merged first.
+    def mark(self, area):
+        if area is None:
+            return
+        if isinstance(area, list):
+            if len(area) > 1:
+                area = merge_rects(area, self.MERGE_GAP)
+            for rect in area:
+                self.mark(rect)
+            return
+
+        area = self.screen_rect.clip(area)
+        if area.width and area.height:
+            self.rects.append(area)
+
+    # Send this frame to the display: only the changed areas if that's cheaper.
+    def present(self):
+        changed = self.last_rects + self.rects
+        area = sum(rect.width * rect.height for rect in changed)
+
+        if self.full_redraw or area > self.screen_area * self.FULL_UPDATE_RATIO:
+            pygame.display.flip()
+        else:
+            pygame.display.update(changed)
+
+        self.last_rects = self.rects
+        self.rects = []
+        self.full_redraw = False
@@ -0,0 +1,125 @@
+"""
+This file creates the InputRecorder used to record and replay games.
+It stores the session seed, the starting level and the input of every
+simulation step in a small binary file. Steps with the same input are
+stored once with a repeat count, so a whole game is only a few KB.
+Replaying the inputs with the same seed plays out the exact same run.
+"""
+
+import struct
+
+# ---------- FILE FORMAT ---------- #
+# Header: magic, version, seed, level, lives, flags
+HEADER = struct.Struct("<4sBQBBB")
+MAGIC = b"BKRP"
+VERSION = 2  # 2: drops picked by alias tables
+
+# One run of identical steps: repeat count, input bits (+ mouse x if set)
+RUN = struct.Struct("<HB")
+MOUSE = struct.Struct("<H")
+MAX_RUN = 0xFFFF
+
+# Input bits
+LEFT = 1
+RIGHT = 2
+LAUNCH = 4
+HAS_MOUSE = 8
+
+# Header flags
+TUTORIAL = 1
+COUNTDOWN = 2
+
+
+# ---------- INPUT RECORDER CLASS ---------- #
+class InputRecorder:
+    # Set up an empty recording for a game started with these settings.
+    def __init__(self, seed, level, lives=3, tutorial=False, countdown=False):
+        self.seed = seed
+        self.level = level
+        self.lives = lives
+        self.tutorial = tutorial
+        self.countdown = countdown
+        self.runs = []  # [count, bits, mouse_x]
+
+    def __len__(self):
+        return sum(run[0] for run in self.runs)
+
+    # ---------- RECORDING ---------- #
+    # Add the input dict passed to one step() call.
+    def record(self, inputs):
+        bits = 0
+        if inputs["left"]:
+            bits |= LEFT
+        if inputs["right"]:
+            bits |= RIGHT
+        if inputs["launch"]:
+            bits |= LAUNCH
+
+        mouse_x = inputs["mouse_x"]
+        if mouse_x is not None:
+            bits |= HAS_MOUSE
+            mouse_x = min(max(int(mouse_x), 0), 0xFFFF)
+
+        last = self.runs[-1] if self.runs else None
+        if last and last[1] == bits and last[2] == mouse_x and last[0] < MAX_RUN:
+            last[0] += 1
+        else:
+            self.runs.append([1, bits, mouse_x])
+
+    # ---------- PLAYBACK ---------- #
+    # Yield one input dict per recorded step.
+    def inputs(self):
+        for count, bits, mouse_x in self.runs:
+            for _ in range(count):
+                yield {
+                    "left": bool(bits & LEFT),
+                    "right": bool(bits & RIGHT),
+                    "launch": bool(bits & LAUNCH),
+                    "mouse_x": mouse_x,
+                }
+
+    # ---------- FILES ---------- #
+    # Write the recording to path.
+    def save(self, path):
+        flags = (TUTORIAL if self.tutorial else 0) | (COUNTDOWN if self.countdown else 0)
+        parts = [HEADER.pack(MAGIC, VERSION, self.seed, self.level, self.lives, flags)]
+
+        for count, bits, mouse_x in self.runs:
+            parts.append(RUN.pack(count, bits))
+            if bits & HAS_MOUSE:
+                parts.append(MOUSE.pack(mouse_x))
+
+        with open(path, "wb") as f:
+            f.write(b"".join(parts))
+
+    # Read a recording written by save(). Raises ValueError if it isn't one.
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if len(data) < HEADER.size:
+            raise ValueError(f"{path} is not a replay file")
+
+        magic, version, seed, level, lives, flags = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay file")
+
+        recorder = cls(seed, level, lives, bool(flags & TUTORIAL), bool(flags & COUNTDOWN))
+
+        offset = HEADER.size
+        try:
+            while offset < len(data):
+                count, bits = RUN.unpack_from(data, offset)
+                offset += RUN.size
+
+                mouse_x = None
+                if bits & HAS_MOUSE:
+                    (mouse_x,) = MOUSE.unpack_from(data, offset)
+                    offset += MOUSE.size
+
+                recorder.runs.append([count, bits, mouse_x])
+        except struct.error:
+            raise ValueError(f"{path} is cut off")
+
+        return recorder
@@ -6,6 +6,8 @@ and draws the score display on the screen.
 
 import pygame
 import os
+import assets
+import leaderboard
 from common import SCREEN_WIDTH, SCREEN_HEIGHT, ROOT_PATH
 
 
@@ -20,13 +22,13 @@ def crop_surface(surface):
 class ScoreBoard:
     # ---------- SETUP ---------- #
     # Create the scoreboard and load font, score values, and heart image.
-    def __init__(self, screen):
+    # With use_leaderboard=False (headless games) the leaderboard database
+    # is never opened: the high score starts at 0 and nothing is saved.
+    def __init__(self, screen, use_leaderboard=True):
         self.screen = screen
+        self.use_leaderboard = use_leaderboard
 
-        font_path = os.path.join(
-            ROOT_PATH, "media", "graphics", "font", "Pixeboy.ttf"
-        )
-        self.font = pygame.font.Font(font_path, 40)
+        self.font = assets.load_font(40)
 
         self.score = 0
         self.high_score = 0
@@ -43,6 +45,11 @@ class ScoreBoard:
         self._high_surface = None
         self._best_time_surface = None
 
+        # Labels never change
+        self._label_high = self.font.render("HIGH:", True, (255, 255, 255))
+        self._label_best = self.font.render("BEST TIME:", True, (255, 255, 255))
+        self._label_lives = self.font.render("LIVES:", True, (255, 80, 80))
+
         heart_path = os.path.join(
             ROOT_PATH, "media", "graphics", "items", "heart.png"
         )
@@ -64,36 +71,14 @@ class ScoreBoard:
         self.score = 0
         self.lives = 3
 
-    # ---------- FILE HANDLING ---------- #
-    # Load high score and best time from storage.
+    # ---------- LEADERBOARD ---------- #
+    # Load the all-time high score and its time from the leaderboard.
     def load_high_score(self):
-        file_path = "records.txt"
-
-        if not os.path.exists(file_path):
-            with open(file_path, "w") as f:
-                f.write("0\n0.0")
-
-        with open(file_path, "r") as f:
-            lines = f.readlines()
+        if self.use_leaderboard:
+            self.high_score, self.best_time = leaderboard.best()
 
-            if len(lines) >= 1:
-                try:
-                    self.high_score = int(lines[0].strip())
-                except ValueError:
-                    self.high_score = 0
-
-            if len(lines) >= 2:
-                try:
-                    self.best_time = float(lines[1].strip())
-                except ValueError:
-                    self.best_time = 0.0
-
-    # Save scores to text files for today and all-time history.
+    # Log this game on the leaderboard and update the high score shown.
     def save_high_score(self, current_time=None, initials="YOU"):
-        today_file = "today_scores.txt"
-        alltime_file = "records_alltime.txt"
-        records_file = "records.txt"
-
         initials = (initials or "").strip().upper()
         if initials == "":
             initials = "AAA"
@@ -101,13 +86,8 @@ class ScoreBoard:
         if current_time is None:
             current_time = 0.0
 
-        line = f"{initials} {self.score} {current_time:.2f}\n"
-
-        with open(today_file, "a", encoding="utf8") as f:
-            f.write(line)
-
-        with open(alltime_file, "a", encoding="utf8") as f:
-            f.write(line)
+        if self.use_leaderboard:
+            leaderboard.add_score(initials, self.score, round(current_time, 2))
 
         if self.score > self.high_score:
             self.high_score = self.score
@@ -116,13 +96,12 @@ class ScoreBoard:
             if self.best_time == 0 or current_time < self.best_time:
                 self.best_time = current_time
 
-        with open(records_file, "w", encoding="utf8") as f:
-            f.write(f"{self.high_score}\n{self.best_time}")
-
     # ---------- DRAW HUD ---------- #
     # Draw score, high score, best time, and hearts on the screen.
+    # Returns the list of areas drawn (for dirty-rect updates).
     def draw(self):
         margin = 65
+        drawn = []
 
         # Update cached score surface
         if self._last_score != self.score:
@@ -151,28 +130,28 @@ class ScoreBoard:
         left_x = 10
         top_y = 65
 
-        label_high = self.font.render("HIGH:", True, (255, 255, 255))
-        self.screen.blit(label_high, (left_x, top_y))
+        label_high = self._label_high
+        drawn.append(self.screen.blit(label_high, (left_x, top_y)))
 
-        self.screen.blit(
+        drawn.append(self.screen.blit(
             self._high_surface,
             (left_x + label_high.get_width() + 10, top_y),
-        )
+        ))
 
-        label_best = self.font.render("BEST TIME:", True, (255, 255, 255))
+        label_best = self._label_best
         best_start_x = (
             left_x
             + label_high.get_width()
             + self._high_surface.get_width()
             + 25
         )
-        self.screen.blit(label_best, (best_start_x, top_y))
+        drawn.append(self.screen.blit(label_best, (best_start_x, top_y)))
 
         if self._best_time_surface:
-            self.screen.blit(
+            drawn.append(self.screen.blit(
                 self._best_time_surface,
                 (best_start_x + label_best.get_width() + 10, top_y),
-            )
+            ))
 
         # Score (bottom left)
         score_y = (
@@ -180,16 +159,16 @@ class ScoreBoard:
             - margin
             - self._score_surface.get_height()
         )
-        self.screen.blit(self._score_surface, (margin, score_y))
+        drawn.append(self.screen.blit(self._score_surface, (margin, score_y)))
 
         # Lives and hearts (bottom right)
-        lives_label = self.font.render("LIVES:", True, (255, 80, 80))
+        lives_label = self._label_lives
 
         fixed_right_margin = 220
         base_x = SCREEN_WIDTH - fixed_right_margin
         base_y = SCREEN_HEIGHT - 90
 
-        self.screen.blit(lives_label, (base_x, base_y))
+        drawn.append(self.screen.blit(lives_label, (base_x, base_y)))
 
         heart_spacing = 8
         heart_w, heart_h = self.heart_img.get_size()
@@ -198,10 +177,12 @@ class ScoreBoard:
         hearts_y = base_y + (lives_label.get_height() - heart_h) // 2
 
         for i in range(self.lives):
-            self.screen.blit(
+            drawn.append(self.screen.blit(
                 self.heart_img,
                 (
                     hearts_start_x + i * (heart_w + heart_spacing),
                     hearts_y,
                 ),
-            )
\ No newline at end of file
+            ))
+
+        return drawn
\ No newline at end of file
@@ -4,20 +4,21 @@ It supports stopwatch and countdown modes,
 updates the time, and draws the timer on the screen.
 """
 
-import pygame
-import os
 import time
-import scenes.breakout as breakout
-from common import ROOT_PATH
+import assets
 
 
 # ---------- TIMER CLASS ---------- #
 class Timer:
     # ---------- SETUP ---------- #
-    def __init__(self, screen, mode="stopwatch", countdown_time=60):
+    # clock returns the current time in seconds. The game passes its
+    # simulation clock, so the timer matches the physics no matter how
+    # fast frames are drawn; by default it is the wall clock.
+    def __init__(self, screen, mode="stopwatch", countdown_time=60, clock=None):
         self.screen = screen
         self.mode = mode
         self.countdown_time = countdown_time
+        self.clock = clock or time.monotonic
         self.start_time = None
         self.elapsed_time = 0
         self.paused = True
@@ -25,30 +26,32 @@ class Timer:
         self.text_color = (255, 255, 255)
 
     # ---------- FONT ---------- #
-    # Load the custom game font.
+    # Get the custom game font (shared, loaded once per size).
     def load_custom_font(self, size):
-        font_path = os.path.join(
-            ROOT_PATH, "media", "graphics", "font", "Pixeboy.ttf"
-        )
-        return pygame.font.Font(font_path, size)
+        return assets.load_font(size)
+
+    # ---------- CLOCK ---------- #
+    # Current time in seconds, from the clock given at setup.
+    def now(self):
+        return self.clock()
 
     # ---------- CONTROLS ---------- #
     # Start the timer.
     def start(self):
         self.paused = False
-        self.start_time = time.time()
+        self.start_time = self.now()
 
     # Pause the timer.
     def pause(self):
         if not self.paused:
             self.paused = True
-            self.elapsed_time += time.time() - self.start_time
+            self.elapsed_time += self.now() - self.start_time
 
     # Resume the timer.
     def resume(self):
         if self.paused:
             self.paused = False
-            self.start_time = time.time()
+            self.start_time = self.now()
 
     # Reset the timer.
     def reset(self):
@@ -62,24 +65,24 @@ class Timer:
         if self.mode == "stopwatch":
             total = self.elapsed_time
             if not self.paused:
-                total += time.time() - self.start_time
+                total += self.now() - self.start_time
             return total
         else:
             total = self.countdown_time - self.elapsed_time
             if not self.paused:
-                total -= time.time() - self.start_time
+                total -= self.now() - self.start_time
             return max(total, 0)
 
-    # Update timer and stop the game when countdown reaches zero.
+    # Update timer and stop it when the countdown reaches zero.
+    # (The game checks get_time() itself to end the level.)
     def update(self):
         if self.mode == "countdown" and not self.paused:
             remaining = self.get_time()
             if remaining <= 0:
                 self.pause()
-                breakout.running = False
 
     # ---------- DRAW ---------- #
-    # Draw the timer in the top-right corner.
+    # Draw the timer in the top-right corner and return the area it covers.
     def draw(self):
         seconds = int(self.get_time())
         minutes = seconds // 60
@@ -89,4 +92,4 @@ class Timer:
         text_surface = self.font.render(time_text, True, self.text_color)
 
         text_rect = text_surface.get_rect(topright=(1165, 60))
-        self.screen.blit(text_surface, text_rect)
\ No newline at end of file
+        return self.screen.blit(text_surface, text_rect)
\ No newline at end of file
@@ -0,0 +1,73 @@
+"""
+This file holds the random number streams used during a game.
+Each subsystem (drops, fireball targeting, particles, fireball trails)
+gets its own stream, all derived from one session seed. The same seed
+and the same inputs always play out the same run, and extra particles
+on screen can't change which power-ups drop.
+"""
+
+import random
+import zlib
+import numpy as np
+
+# ---------- STATE ----------
+_seed = 0
+_streams = {}     # name -> random.Random
+_np_streams = {}  # name -> numpy Generator
+
+
+def _python_seed(name):
+    return f"{_seed}:{name}"
+
+
+def _numpy_seed(name):
+    return np.random.SeedSequence([_seed, zlib.crc32(name.encode())])
+
+
+# ---------- SEEDING ----------
+def seed(value=None):
+    """
+    Start a new session seed (a fresh random one if value is None) and
+    reset every stream to it. Streams are reseeded in place, so modules
+    can keep the objects returned by stream() and np_stream().
+    Returns the seed.
+    """
+    global _seed
+
+    if value is None:
+        value = random.SystemRandom().getrandbits(32)
+    _seed = int(value)
+
+    for name, stream_rng in _streams.items():
+        stream_rng.seed(_python_seed(name))
+    for name, generator in _np_streams.items():
+        generator.bit_generator.state = np.random.PCG64(_numpy_seed(name)).state
+
+    return _seed
+
+
+def current_seed():
+    """Return the seed of the current session."""
+    return _seed
+
+
+# ---------- STREAMS ----------
+def stream(name):
+    """Return the random.Random stream for a subsystem."""
+    stream_rng = _streams.get(name)
+    if stream_rng is None:
+        stream_rng = random.Random(_python_seed(name))
+        _streams[name] = stream_rng
+    return stream_rng
+
+
+def np_stream(name):
+    """Return the NumPy Generator stream for a subsystem."""
+    generator = _np_streams.get(name)
+    if generator is None:
+        generator = np.random.Generator(np.random.PCG64(_numpy_seed(name)))
+        _np_streams[name] = generator
+    return generator
+
+
+seed()
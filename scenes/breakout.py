@@ -16,38 +16,51 @@ This file controls:
 # 3. Game Setup
 # 4. Game Flow
 # 5. Core Game Loop
-# 6. Movement & Physics
-# 7. Collision & Drops
-# 8. Powerups
-# 9. UI & Drawing
-# 10. Game State
+# 6. Simulation Step
+# 7. Movement & Physics
+# 8. Collision & Drops
+# 9. Powerups
+# 10. UI & Drawing
+# 11. Game State
+# 12. Headless Simulation
 
 
 # ================= Imports =================
 
 # --- Standard Library ---
 import os
-import json
-import random
+from contextlib import contextmanager
 
 # --- Third Party ---
 import pygame
 from pygame.mixer import Sound
 
 # --- Game Shared Data ---
+import assets
+import rng
+import settings
 from common import (
     BLACK, WHITE, RED, COLORS,
     SCREEN_WIDTH, SCREEN_HEIGHT,
-    ROOT_PATH
+    ROOT_PATH,
+    music, boss_music
 )
 
 # --- Game Objects ---
-from objects.block import Block
+from objects.compiled_level import CompiledLevel
+from objects.ball import BallList
 from objects.scoreboard import ScoreBoard
 from objects.timer import Timer
-from objects.particle import Particle, ExplosionManager, Fireball
-from objects.coin import Coin
-from objects.powerup import PowerUp, BlueBlast
+from objects.particle import ParticleSystem, ExplosionManager, Fireball
+from objects.particle import preload_images as preload_fireball_images
+from objects.coin import Coin, preload_images as preload_coin_images
+from objects.powerup import PowerUp, BlueBlast, preload_images as preload_powerup_images
+from objects.renderer import PlayfieldRenderer
+from objects.collision import sweep_circle_rect
+from objects.replay import InputRecorder
+from objects.profiler import FrameProfiler
+from objects.drop_sampler import DropSampler
+from objects.pool import ObjectPool
 
 # --- Game Scenes ---
 from scenes.win_lose import end_screen
@@ -55,7 +68,8 @@ from scenes.pause_overlay import pause_overlay
 from scenes.levels import (
     get_level_count,
     get_level_pattern,
-    get_level_settings
+    get_level_settings,
+    get_drop_table
 )
 
 # ================= Settings & Globals =================
@@ -63,7 +77,25 @@ from scenes.levels import (
 # --- Screen + Layout ---
 WALL_PADDING = 30
 WALL_TOP_PADDING = 120
+WALL_BOTTOM = SCREEN_HEIGHT - 150
 BRICKS_TOP = 140
+compiled_levels = {}  # (level, countdown debug) -> CompiledLevel
+
+# Wall rect controls ball boundaries
+WALL_RECT = pygame.Rect(
+    WALL_PADDING,
+    WALL_TOP_PADDING,
+    SCREEN_WIDTH - WALL_PADDING * 2,
+    WALL_BOTTOM - WALL_TOP_PADDING
+)
+
+# --- Simulation ---
+FRAME_MS = 1000 / 60  # one simulation step, in milliseconds
+sim_time = 0  # simulation clock (ms), advanced once per step
+MAX_STEPS_PER_FRAME = 5  # after a longer hitch the game slows down instead of jumping
+DEFAULT_MAX_FPS = 144  # render cap unless config.json sets "max_fps"
+accumulator = 0  # real time (ms) not yet simulated
+queued_launch = False  # launch pressed on a frame that ran no step
 
 # --- Paddle + Ball Settings ---
 BAR_WIDTH = 200
@@ -74,6 +106,8 @@ big_paddle_width = 280
 
 ball_radius = 0
 ball_max_velocity_x = 0
+MAX_BOUNCES = 8  # most surfaces one ball can bounce off in a single frame
+sweep_path = pygame.Rect(0, 0, 0, 0)  # area a ball crosses this step (reused)
 
 # --- Powerups ---
 blast_active = False
@@ -101,7 +135,7 @@ reverse_timer = 0
 reverse_duration = 5000
 reverse_on_screen = False
 
-balls = []
+balls = BallList()
 ball_image = None
 last_hit_ball = None  # remembers last ball that touched paddle for triple-ball logic
 ball_position = None
@@ -110,41 +144,23 @@ ball_velocity = None
 # --- Fireball ---
 fireball_active = False
 fireball_timer = 0
+last_fireball_shot = 0  # sim_time of the last auto-fired fireball
 fireball_duration = 300  # 5 seconds
 max_active_fireballs = 3  # Maximum fireballs shooting at once
 
 # --- Debug + Tutorial ---
 debug_countdown_mode = False
 
-# ---- Load config ----
-config_path = "config.json"
-
-# Load configuration file if it exists
-if os.path.exists(config_path):
-    try:
-        with open(config_path, "r") as f:
-            cfg = json.load(f)
-    except:
-        cfg = {}
-else:
-    cfg = {}
-
-# Default config values
-cfg.setdefault("sound_volume", 5)
-cfg.setdefault("music_volume", 5)
-cfg.setdefault("tutorial_enabled", True)
-
-# Tutorial state
-tutorial_active = cfg["tutorial_enabled"]
+# Tutorial state (settings are read from memory, see settings.py)
+tutorial_active = settings.get_bool("tutorial_enabled", True)
 tutorial_timer = 0
 tutorial_phase = "move"
 
 # --- Assets + Timers ---
-pixel_font_path = os.path.join(ROOT_PATH, 'media', 'graphics', 'font', 'Pixeboy.ttf')
 font = None
 
 clock = pygame.time.Clock()
-delta_time = 0  # frame timing
+delta_time = 0  # real time of the last frame (ms)
 
 pause_requested = False
 win = None
@@ -153,6 +169,23 @@ level_timer = None
 
 show_fps = False  # FPS toggle
 
+# --- Asset Files ---
+AUDIO_PATH = os.path.join(ROOT_PATH, "media", "audio")
+SOUND_FILES = {
+    "wall": os.path.join(AUDIO_PATH, "media_audio_wall-hit.wav"),
+    "paddle": os.path.join(AUDIO_PATH, "media_audio_paddle-hit.wav"),
+    "brick": os.path.join(AUDIO_PATH, "media_audio_brick-hit.ogg"),
+    "lose_life": os.path.join(AUDIO_PATH, "media_audio_lose-lives.wav"),
+    "coin": os.path.join(AUDIO_PATH, "media_audio_collect_coin.ogg"),
+    "blast_shoot": os.path.join(AUDIO_PATH, "media_audio_blast_shoot.wav"),
+    "fireball_moving": os.path.join(AUDIO_PATH, "media_audio_fireball.ogg"),
+    "fireball_explosion": os.path.join(AUDIO_PATH, "media_audio_explosion.mp3"),
+    "pause": os.path.join(AUDIO_PATH, "pause.wav"),
+    "unpause": os.path.join(AUDIO_PATH, "unpause.wav"),
+}
+PADDLE_IMAGE = os.path.join(ROOT_PATH, "media", "graphics", "paddle", "paddle.png")
+BACKGROUND_IMAGE = os.path.join(ROOT_PATH, "media", "graphics", "background", "back-black-wall-border.png")
+
 # Sound placeholders
 wall_sound = None
 paddle_sound = None
@@ -169,25 +202,43 @@ unpause_sound = None
 paddle_image: pygame.Surface | None = None
 background = None
 
+# Paddle sprites by (tint, width), pre-tinted and pre-scaled in load_assets
+paddle_sprites = {}
+PADDLE_WIDTH_STEP = 2  # widths are rounded to this many pixels
+PADDLE_TINTS = {
+    "normal": None,
+    "reverse": (255, 0, 0),
+    "small": (255, 40, 40),
+    "big": (40, 140, 255),
+}
+
+# Tutorial prompts per phase: list of (surface, position), built once
+tutorial_assets = {}
+
+# Dirty-rect renderer for the playfield (created on the first frame drawn)
+playfield = None
+
+# --- Replays ---
+REPLAY_PATH = "last_run.replay"  # inputs of the last game played
+recorder = None  # InputRecorder for the game in progress
+
+# --- Frame Profiler ---
+# Turned on by "show_profiler" in config.json: replaces the FPS text
+# with per-section timings and writes PROFILE_PATH after each game
+PROFILE_SECTIONS = ("input", "physics", "collision", "drops", "particles",
+                    "blasts", "fireballs", "render", "hud", "present")
+PROFILE_PATH = "frame_profile.csv"
+profiler = FrameProfiler(PROFILE_SECTIONS)
+
 # Paddle movement values
 bar_x = 0
 bar_y = 0
+bar_width = original_paddle_width  # animated width, eases toward the power-up size
 speed = 0
 
 pygame.mixer.init()
 
 
-# --- Central Volume Reader ---
-def current_volume():
-    """Always read fresh sound volume (0.0 – 1.0) from config.json."""
-    try:
-        with open("config.json","r") as f:
-            c = json.load(f)
-            val = c.get("sound_volume", 5)
-            return max(0, min(5, val)) / 5.0
-    except:
-        return 1.0
-
 # Slow Time multiplier
 def slow_factor():
     if not slow_active:
@@ -195,30 +246,46 @@ def slow_factor():
     return 0.5
 
 # --- Drop Rates ---
-DROP_TABLE = {
-    "coin": 0.20,
-    "triple_ball": 0.10,
-    "blast": 0.10,
-    "fireball": 0.15,
-    "small_paddle": 0.05,
-    "big_paddle": 0.10,
-    "slow": 0.05,
-    "shield": 0.05,
-    "reverse": 0.05,
-    "nothing": 0.15
+# The tables live in scenes/levels.py next to LEVEL_SETTINGS; each
+# level's table is compiled into a DropSampler once, at level load
+drop_samplers = {}  # level -> DropSampler
+
+# --- Broken Bricks ---
+BRICK_POINTS = 50
+# What a brick looks like when it breaks, by what broke it
+BRICK_EFFECTS = {
+    "ball": "sparks",
+    "blast": "sparks",
+    "fireball": "explosion",
 }
 
+# --- Random Streams (reseeded by rng.seed() at the start of each game) ---
+drop_rng = rng.stream("drops")
+fireball_rng = rng.stream("fireball_targets")
+
+# --- Object Pools (pre-sized in load_assets, grown if they run out) ---
+# Falling items and projectiles are reused instead of built per drop/shot
+COIN_POOL_SIZE = 16
+POWERUP_POOL_SIZE = 16
+BLAST_POOL_SIZE = 16
+FIREBALL_POOL_SIZE = 8
+coin_pool = ObjectPool(Coin)
+powerup_pool = ObjectPool(PowerUp)
+blast_pool = ObjectPool(BlueBlast)
+fireball_pool = ObjectPool(Fireball)
+
 # ================= Game Setup =================
 
 def init(character_image=None):
     """Setup all initial game values and reset paddle/ball."""
     global bar_x, bar_y, speed, ball_radius, ball_position, \
-        ball_velocity, ball_max_velocity_x, clock, delta_time, pause_requested, win, balls, font
+        ball_velocity, ball_max_velocity_x, clock, delta_time, pause_requested, win, balls, font, \
+        sim_time, accumulator, queued_launch
 
-    font = pygame.font.Font(pixel_font_path, 36)
+    font = assets.load_font(36)
 
     # Reset ball list every new game
-    balls = []
+    balls.clear()
 
     # Paddle placement
     bar_x = (SCREEN_WIDTH - BAR_WIDTH) // 2
@@ -247,6 +314,9 @@ def init(character_image=None):
 
     clock = pygame.time.Clock()
     delta_time = 0
+    sim_time = 0
+    accumulator = 0
+    queued_launch = False
     pause_requested = False
     win = None
 
@@ -256,20 +326,7 @@ def init(character_image=None):
 # ---------- Volume Helper ----------
 def apply_sound_volumes():
     """Update volume levels for all loaded sound effects."""
-    global cfg
-
-    try:
-        with open(config_path, "r") as f:
-            cfg = json.load(f)
-    except:
-        cfg = {"sound_volume": 5}
-    try:
-        level = int(cfg.get("sound_volume", 5))
-    except:
-        level = 5
-
-    level = max(0, min(5, level))
-    vol = level / 5.0
+    vol = settings.sfx_volume()
 
     try:
         # Set volume for each sound if loaded
@@ -292,6 +349,10 @@ def apply_sound_volumes():
     except:
         pass
 
+
+# Re-apply effect volumes whenever the setting changes
+settings.subscribe("sound_volume", lambda level: apply_sound_volumes())
+
 # --- Assets ---
 def load_assets():
     """Load images, sounds, and apply initial volume."""
@@ -300,90 +361,54 @@ def load_assets():
     global fireball_moving_sound, fireball_explosion_sound
     global paddle_image, background
 
-    vol = current_volume()  # always read volume fresh from config
-
-    try:
-        # Brick + wall + paddle impacts
-        wall_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_wall-hit.wav')
-        )
-        wall_sound.set_volume(vol)
-        
-        paddle_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_paddle-hit.wav')
-        )
-        paddle_sound.set_volume(vol)
-        
-        brick_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_brick-hit.ogg')
-        )
-        brick_sound.set_volume(vol)
-        
-        lose_life_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_lose-lives.wav')
-        )
-        lose_life_sound.set_volume(vol)
-
-        # Coin + blast
-        coin_sound = Sound(
-            os.path.join(ROOT_PATH, "media", "audio", "media_audio_collect_coin.ogg")
-        )
-        coin_sound.set_volume(vol)
-        
-        blast_shoot_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_blast_shoot.wav')
-        )
-        blast_shoot_sound.set_volume(vol)
-        
-        # Fireball sounds
-        fireball_moving_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_fireball.ogg')
-        )
-        fireball_moving_sound.set_volume(vol)
-        
-        fireball_explosion_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, 'media', 'audio', 'media_audio_explosion.mp3')
-        )
-        fireball_explosion_sound.set_volume(vol)
-        
-        # Pause sounds
-        pause_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, "media", "audio", "pause.wav")
-        )
-        pause_sound.set_volume(vol)
-        
-        unpause_sound = pygame.mixer.Sound(
-            os.path.join(ROOT_PATH, "media", "audio", "unpause.wav")
-        )
-        unpause_sound.set_volume(vol)
-        
-    except FileNotFoundError:
-        print("Warning: Could not load one or more audio files.")
+    # Sounds come from the shared cache (usually filled by the startup loader)
+    wall_sound = assets.load_sound(SOUND_FILES["wall"])
+    paddle_sound = assets.load_sound(SOUND_FILES["paddle"])
+    brick_sound = assets.load_sound(SOUND_FILES["brick"])
+    lose_life_sound = assets.load_sound(SOUND_FILES["lose_life"])
+    coin_sound = assets.load_sound(SOUND_FILES["coin"])
+    blast_shoot_sound = assets.load_sound(SOUND_FILES["blast_shoot"])
+    fireball_moving_sound = assets.load_sound(SOUND_FILES["fireball_moving"])
+    fireball_explosion_sound = assets.load_sound(SOUND_FILES["fireball_explosion"])
+    pause_sound = assets.load_sound(SOUND_FILES["pause"])
+    unpause_sound = assets.load_sound(SOUND_FILES["unpause"])
 
     # Load paddle sprite
-    try:
-        paddle_image = pygame.image.load(
-            os.path.join(ROOT_PATH, 'media', 'graphics', 'paddle', 'paddle.png')
-        ).convert_alpha()
-        paddle_image = pygame.transform.scale(paddle_image, (BAR_WIDTH, BAR_HEIGHT))
-    except FileNotFoundError:
-        print("Warning: Could not load paddle image")
+    paddle_image = assets.load_image(PADDLE_IMAGE, (BAR_WIDTH, BAR_HEIGHT))
+    if paddle_image is None:
         paddle_image = pygame.Surface((BAR_WIDTH, BAR_HEIGHT))
         paddle_image.fill((255, 255, 255))
 
-    # Load background image
-    try:
-        background = pygame.image.load(
-            os.path.join(ROOT_PATH, 'media', 'graphics', 'background', 'back-black-wall-border.png')
-        )
-        background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    except FileNotFoundError:
-        background = None
-        print("Warning: Could not load background. Using plain black.")
+    build_paddle_sprites()
+
+    # Load background image (plain black if missing)
+    background = assets.load_image(BACKGROUND_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
+
+    # Drop and projectile images, so nothing is read from disk mid-level
+    preload_coin_images()
+    preload_powerup_images()
+    preload_fireball_images()
+
+    # Build the pooled objects now, with their images already cached
+    coin_pool.reserve(COIN_POOL_SIZE, 0, 0)
+    powerup_pool.reserve(POWERUP_POOL_SIZE, 0, 0)
+    blast_pool.reserve(BLAST_POOL_SIZE, 0, 0)
+    fireball_pool.reserve(FIREBALL_POOL_SIZE, 0, 0, 0, -1)
+
+    load_tutorial_assets()
 
     apply_sound_volumes()
 
 
+def startup_assets():
+    """(images, sounds) used by load_assets(), for the startup loader."""
+    images = [
+        (PADDLE_IMAGE, (BAR_WIDTH, BAR_HEIGHT)),
+        (BACKGROUND_IMAGE, (SCREEN_WIDTH, SCREEN_HEIGHT), False),
+    ]
+    return images, list(SOUND_FILES.values())
+
+
 # ================= Game Flow =================
 
 # --- Public Entry Point ---
@@ -395,24 +420,20 @@ def play(screen, debug_mode="", character_image=None):
 # --- Main Controller ---
 def main_controller(screen, debug_mode="", character_image=None):
     """Handles level flow, debug modes, transitions, and win/lose state."""
-    global tutorial_active, tutorial_timer, tutorial_phase, cfg, game_timer, level_timer
+    global tutorial_active, tutorial_timer, tutorial_phase, game_timer, level_timer
     global paddle_state, paddle_state_timer
     global slow_timer, reverse_timer
 
     init(character_image)
 
     # ---- Mouse visibility based on config ----
-    mouse_on = cfg.get("mouse_enabled", False)
+    mouse_on = settings.get_bool("mouse_enabled")
     pygame.mouse.set_visible(mouse_on)
 
     tutorial_timer = 0
     tutorial_phase = "move"
 
-    # Always reload config fresh at start of game
-    with open(config_path, "r") as f:
-        cfg = json.load(f)
-
-    tutorial_active = cfg.get("tutorial_enabled", True)
+    tutorial_active = settings.get_bool("tutorial_enabled", True)
 
     # Default level
     level = 1
@@ -436,7 +457,10 @@ def main_controller(screen, debug_mode="", character_image=None):
 
     # FPS toggle: on for debug or if enabled in settings
     global show_fps
-    show_fps = debug_mode is not False or cfg.get("show_fps", False)
+    show_fps = debug_mode is not False or settings.get_bool("show_fps")
+
+    profiler.enabled = settings.get_bool("show_profiler")
+    profiler.reset()
 
     global debug_countdown_mode
 
@@ -453,25 +477,20 @@ def main_controller(screen, debug_mode="", character_image=None):
         max_levels = 0
         scoreboard.lives = 1
         debug_countdown_mode = True
-        level_timer = Timer(screen, mode="countdown", countdown_time=10)
+        level_timer = Timer(screen, mode="countdown", countdown_time=10, clock=sim_clock)
         pygame.display.set_caption("Breakout Game [COUNTDOWN]")
 
     # --- Timer setup based on level definition ---
-    settings = get_level_settings(level)
-
     # Stopwatch timer always starts new game
-    game_timer = Timer(screen, mode="stopwatch")
+    game_timer = Timer(screen, mode="stopwatch", clock=sim_clock)
 
     # Boss/level-specific countdown timers
-    if settings["timer"] == "countdown":
-        level_timer = Timer(screen, mode="countdown", countdown_time=settings.get("time_limit", 60))
-    else:
-        level_timer = None
+    level_timer = make_level_timer(screen, level)
 
     # Override countdown for debug mode
     if debug_mode == "countdown":
         pygame.display.set_caption("Breakout Game [COUNTDOWN]")
-        level_timer = Timer(screen, mode="countdown", countdown_time=10)
+        level_timer = Timer(screen, mode="countdown", countdown_time=10, clock=sim_clock)
         level = 0
         max_levels = 0
 
@@ -479,19 +498,15 @@ def main_controller(screen, debug_mode="", character_image=None):
     blocks = define_blocks(screen, level)
     draw_bricks(screen, blocks)
 
-    # Active effects
-    particles = []
-    coins = []
-    powerups = []
-    blasts = []
-    fireballs = []
-    explosion_manager = ExplosionManager()
+    # Everything on the playfield for this level
+    world = World(scoreboard, blocks, level)
+    reset_all_effects(world)
 
     # Apply tutorial state unless in debug
     if debug_mode:
         tutorial_active = False
     else:
-        tutorial_active = cfg.get("tutorial_enabled", True)
+        tutorial_active = settings.get_bool("tutorial_enabled", True)
 
     tutorial_timer = 0
     tutorial_phase = "move"
@@ -502,15 +517,17 @@ def main_controller(screen, debug_mode="", character_image=None):
     blast_timer = 0
     fireball_active = False
     fireball_timer = 0
+
+    # New random seed for this game, and record its inputs for replays
+    global recorder
+    recorder = InputRecorder(rng.seed(), level, scoreboard.lives,
+                             tutorial_active, debug_mode == "countdown")
+
+    reset_frame_clock()
     running = True
     while running:
         # Game loop returns status such as "running", "level_complete", etc.
-        status = game_loop(
-            screen, scoreboard, game_timer,
-            blocks, debug_mode, level,
-            particles, coins, powerups, blasts,
-            blast_duration, cfg, explosion_manager
-        )
+        status = game_loop(screen, world, debug_mode)
 
         if status == "running":
             continue
@@ -523,9 +540,8 @@ def main_controller(screen, debug_mode="", character_image=None):
 
         elif status == "level_complete":
             # Stop boss music only when exiting level 5
-            from common import boss_music, gameplay_music
             if level == 5:
-                boss_music.stop()
+                music.stop()
 
             # Debug one-block mode → instant win
             if debug_mode == "one_block":
@@ -550,7 +566,7 @@ def main_controller(screen, debug_mode="", character_image=None):
                     running = False
                 else:
                     # Prepare next level
-                    reset_all_effects(blasts, coins, powerups, particles)
+                    reset_all_effects(world)
 
                     # Reset active power-up states
                     blast_active = False
@@ -559,30 +575,32 @@ def main_controller(screen, debug_mode="", character_image=None):
                     paddle_state_timer = 0
                     fireball_active = False
                     fireball_timer = 0
-                    if hasattr(game_loop, "fireballs"):
-                        game_loop.fireballs.clear()
 
                     slow_timer = 0
                     reverse_timer = 0
 
-                    blocks = define_blocks(screen, level)
+                    world.blocks = define_blocks(screen, level)
+                    world.level = level
+                    world.drops = drop_sampler(level)
 
                     # Configure new level timer
-                    settings = get_level_settings(level)
-                    if settings["timer"] == "countdown":
-                        level_timer = Timer(screen, mode="countdown", countdown_time=settings.get("time_limit", 60))
-                    else:
-                        level_timer = None
+                    level_timer = make_level_timer(screen, level)
 
                     # Level 5 → boss intro + boss music
                     if level == 5:
                         show_boss_intro(screen)
 
-                        from common import menu_music, gameplay_music, boss_music, apply_music_volume
-                        gameplay_music.stop()
-                        menu_music.stop()
-                        boss_music.play(loops=-1)
-                        apply_music_volume(cfg.get("music_volume", 5))
+                        music.play(boss_music)
+
+                    # Don't simulate the time spent on the level messages
+                    reset_frame_clock()
+
+    save_replay()
+    if profiler.enabled:
+        profiler.save(PROFILE_PATH)
+
+    # The game is over: its leftover drops and shots go back to the pools
+    release_pooled(world)
 
     # After loop ends → show win/lose screen
     replay = False
@@ -593,113 +611,426 @@ def main_controller(screen, debug_mode="", character_image=None):
     return replay
 
 
+def sim_clock():
+    """Seconds of simulated gameplay: the clock every game Timer runs on."""
+    return sim_time / 1000
+
+
+def make_level_timer(screen, level):
+    """Countdown Timer for levels that have a time limit, otherwise None."""
+    level_settings = get_level_settings(level)
+    if level_settings["timer"] == "countdown":
+        return Timer(screen, mode="countdown", countdown_time=level_settings.get("time_limit", 60),
+                     clock=sim_clock)
+    return None
+
+
+def save_replay():
+    """Write the inputs of the game just played to REPLAY_PATH."""
+    if recorder is None or len(recorder) == 0:
+        return
+    try:
+        recorder.save(REPLAY_PATH)
+    except OSError as e:
+        print(f"Warning: Could not save replay - {e}")
+
+
 # ================= Core Game Loop =================
+# The interactive path: read the keyboard/mouse, run as many fixed
+# simulation steps as real time calls for, then draw the result blended
+# between the last two steps. All gameplay rules live in step().
+
+def game_loop(screen, world, debug_mode):
+    """Main per-frame loop: input → step() at a fixed rate → draw → present."""
+    global pause_requested, delta_time, tutorial_phase, accumulator, queued_launch
+
+    show_fps = (debug_mode is not False) or settings.get_bool("show_fps")
+
+    # Real time since the last frame, capped so a long hitch can't
+    # turn into a burst of catch-up steps
+    delta_time = clock.tick(settings.get_int("max_fps", DEFAULT_MAX_FPS, 30, 360))
+    accumulator = min(accumulator + delta_time, FRAME_MS * MAX_STEPS_PER_FRAME)
+    profiler.begin_frame()
+
+    # Start the next music track once the last one has faded out
+    music.update()
+
+    # Input: returns None if user quits
+    profiler.begin("input")
+    inputs = read_input()
+    profiler.end()
+    if inputs is None:
+        return "quit"
 
-def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
-              particles, coins, powerups, blasts, blast_duration, cfg, explosion_manager):
-    """Main per-frame loop: handles physics, drawing, timers, drops, input."""
-    global ball_position, pause_requested, delta_time, blast_active, blast_timer
-    global level_timer, ball_image
-    global fireball_active, fireball_timer
-    global paddle_state, paddle_state_timer
-    global slow_active, slow_timer, slow_ramp, slow_on_screen
-    global shield_active, shield_rect, shield_on_screen
-    global reverse_active, reverse_timer, reverse_on_screen
+    # A launch press must reach a step even if this frame runs none
+    inputs["launch"] = inputs["launch"] or queued_launch
+    queued_launch = False
+
+    status = "running"
+    profiler.begin("physics")
+    while accumulator >= FRAME_MS:
+        remember_positions(world)
+        if recorder is not None:
+            recorder.record(inputs)
+        status = step(world, inputs)
+        accumulator -= FRAME_MS
+        inputs["launch"] = False  # one press launches once
+
+        if status != "running":
+            break
+    else:
+        queued_launch = inputs["launch"]
+    profiler.end()
+
+    if status == "quit":
+        return "quit"
+
+    # How far real time has moved past the last step (0..1)
+    alpha = accumulator / FRAME_MS if status == "running" else 1.0
+    profiler.begin("render")
+    with interpolated(world, alpha):
+        draw_frame(screen, world)
+    profiler.end()
+
+    # Ball lost but lives remain → show message before the relaunch
+    if status == "life_lost":
+        show_lives_left(screen, world.scoreboard)
+        playfield.invalidate_all()
+        reset_frame_clock()
+        return "running"
+
+    if status != "running":
+        return status
+
+    # ---------- PAUSE ----------
+    if pause_requested:
+        if isinstance(game_timer, Timer):
+            game_timer.pause()
+        if isinstance(level_timer, Timer):
+            level_timer.pause()
 
-    show_fps = (debug_mode is not False) or cfg.get("show_fps", False)
+        paused = pause_game(screen)
+        pause_requested = False
+        playfield.invalidate_all()
+        reset_frame_clock()
 
-    # Draw environment
-    walls = draw_wall(screen)
-    bar = draw_bar(screen)
-    draw_level(screen, level)
+        if not paused:
+            return "quit"
+
+        # Resume timers after unpausing
+        if isinstance(game_timer, Timer):
+            game_timer.resume()
+        if isinstance(level_timer, Timer):
+            level_timer.resume()
+
+    # ---------- FPS / PROFILER DISPLAY ----------
+    profiler.begin("hud")
+    if profiler.enabled:
+        playfield.mark(profiler.draw(screen, profiler_font(), WALL_PADDING + 10, WALL_TOP_PADDING + 10))
+    elif show_fps:
+        fps = int(clock.get_fps())
+        fps_text = font.render(f"FPS: {fps}", True, (255, 255, 0))
+        fps_rect = fps_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
+        playfield.mark(screen.blit(fps_text, fps_rect))
+    profiler.end()
+
+    profiler.begin("present")
+    playfield.present()
+    profiler.end()
+    profiler.end_frame()
+
+    return "running"
+
+
+def profiler_font():
+    """Small font for the profiler rows."""
+    return assets.load_font(16, path=None)
+
+
+def reset_frame_clock():
+    """Forget time spent outside gameplay (pause, messages, level changes)."""
+    global accumulator, queued_launch
+    clock.tick()
+    accumulator = 0
+    queued_launch = False
+
+
+def remember_positions(world):
+    """Store where everything is before a step, for interpolated drawing."""
+    for b in balls:
+        b.remember()
+
+    for group in (world.coins, world.powerups, world.blasts, world.fireballs):
+        for obj in group:
+            obj.prev_pos = (obj.x, obj.y)
+
+    world.prev_bar = (bar_x, bar_width)
+
+
+@contextmanager
+def interpolated(world, alpha):
+    """
+    Temporarily move everything to alpha (0..1) of the way from its
+    position before the last step to its current one, then put it back.
+    Things created during the last step have no old position and stay put.
+    """
+    global bar_x, bar_width
+
+    if alpha >= 1.0:
+        yield
+        return
+
+    saved_balls = []
+    for b in balls:
+        if b.has_prev:
+            saved_balls.append((b, b.pos))
+            b.pos = b.prev.lerp(b.pos, alpha)
+
+    saved_objs = []
+    for group in (world.coins, world.powerups, world.blasts, world.fireballs):
+        for obj in group:
+            prev = getattr(obj, "prev_pos", None)
+            if prev is not None:
+                saved_objs.append((obj, obj.x, obj.y))
+                obj.x = prev[0] + (obj.x - prev[0]) * alpha
+                obj.y = prev[1] + (obj.y - prev[1]) * alpha
+
+    saved_bar = (bar_x, bar_width)
+    prev_bar = getattr(world, "prev_bar", None)
+    if prev_bar is not None:
+        bar_x = prev_bar[0] + (bar_x - prev_bar[0]) * alpha
+        bar_width = prev_bar[1] + (bar_width - prev_bar[1]) * alpha
+
+    try:
+        yield
+    finally:
+        for b, pos in saved_balls:
+            b.pos = pos
+        for obj, x, y in saved_objs:
+            obj.x = x
+            obj.y = y
+        bar_x, bar_width = saved_bar
+
+
+def draw_frame(screen, world):
+    """
+    Draw the current simulation state. Changes nothing in the game.
+    Only areas that changed are redrawn; playfield.present() shows them.
+    """
+    global playfield
+
+    if playfield is None or playfield.screen is not screen:
+        playfield = PlayfieldRenderer(screen, draw_static_layer)
+
+    # Background, bricks and level label only change on a new level
+    # or where a brick broke or cracked
+    if playfield.is_stale(world):
+        playfield.rebuild(world)
+    for rect in world.blocks.take_changes():
+        playfield.invalidate(rect)
+
+    playfield.begin_frame()
+    mark = playfield.mark
+
+    mark(draw_bar(screen))
 
     # Draw all active balls
     for b in balls:
         # Use character skin if provided
         if ball_image:
-            screen.blit(ball_image, (int(b["pos"].x) - ball_radius,
-                                     int(b["pos"].y) - ball_radius))
+            mark(screen.blit(ball_image, (int(b.pos.x) - ball_radius,
+                                          int(b.pos.y) - ball_radius)))
         else:
-            pygame.draw.circle(screen, WHITE,
-                               (int(b["pos"].x), int(b["pos"].y)),
-                               ball_radius)
+            mark(pygame.draw.circle(screen, WHITE,
+                                    (int(b.pos.x), int(b.pos.y)),
+                                    ball_radius))
 
-    scoreboard.draw()
+    profiler.begin("hud")
+    mark(world.scoreboard.draw())
 
     # ---------- TIMER DISPLAY ----------
     if isinstance(level_timer, Timer):
-        level_timer.draw()
-    elif isinstance(game_timer_ref, Timer):
-        game_timer_ref.draw()
+        mark(level_timer.draw())
+    elif isinstance(game_timer, Timer):
+        mark(game_timer.draw())
 
-        # If first ball not launched yet → reset positions each frame
-    if not balls:
-        reset_all_effects(blasts, coins, powerups, particles)
+    if tutorial_active:
+        mark(show_tutorial_phase(screen, tutorial_phase))
+    profiler.end()
 
-        # Safety: make sure balls[0] exists
-    if not balls:
-        return "quit"
+    if shield_active and shield_rect:
+        mark(pygame.draw.rect(screen, (0, 180, 255), shield_rect))
 
-        # Input: returns False if user quits
-    if not handle_input(bar, balls[0]):
-        return "quit"
+    mark(world.particles.draw(screen))
 
-    # Draw all bricks
-    draw_bricks(screen, blocks)
+    for coin in world.coins:
+        mark(coin.draw(screen))
 
-    # Apply collisions → score gain
-    scoreboard.score += detect_collision(blocks, particles, coins, powerups, scoreboard)
+    for powerup in world.powerups:
+        mark(powerup.draw(screen))
 
-    # ---------- Tutorial Logic ----------
+    for blast in world.blasts:
+        mark(blast.draw(screen))
+
+    for fireball in world.fireballs:
+        mark(fireball.draw(screen))
+
+    mark(world.explosion_manager.draw(screen))
+
+    # Waiting for launch
+    if balls and balls[0].vel.length() == 0 and not tutorial_active:
+        msg = font.render("PRESS [SPACE] TO BEGIN", True, (255, 255, 0))
+        mark(screen.blit(
+            msg,
+            (SCREEN_WIDTH // 2 - msg.get_width() // 2, SCREEN_HEIGHT // 2)
+        ))
+
+
+def draw_static_layer(surface, world, area=None):
+    """Draw the background, level label and bricks (only those in area, if given)."""
+    if area is None:
+        draw_wall(surface)
+        draw_level(surface, world.level)
+        draw_bricks(surface, world.blocks)
+        return
+
+    if background:
+        surface.blit(background, area, area)
+    else:
+        surface.fill(BLACK, area)
+    draw_level(surface, world.level)
+    draw_bricks(surface, world.blocks.query(area))
+
+
+# ================= Simulation Step =================
+# One fixed frame of gameplay. No drawing, no display flip and no clock
+# throttling happen here, so the same code runs both the interactive game
+# and headless simulations (see simulate()).
+
+class BrickDestroyed:
+    """A brick broken this step; process_brick_events() runs its effects."""
+
+    __slots__ = ("block", "source")
+
+    def __init__(self, block, source):
+        self.block = block
+        self.source = source  # "ball", "blast" or "fireball"
+
+
+class World:
+    """Everything on the playfield for the level being played."""
+
+    def __init__(self, scoreboard, blocks, level):
+        self.scoreboard = scoreboard
+        self.blocks = blocks
+        self.level = level
+        self.drops = drop_sampler(level)
+
+        # Active effects
+        self.particles = ParticleSystem()
+        self.coins = []
+        self.powerups = []
+        self.blasts = []
+        self.fireballs = []
+        self.explosion_manager = ExplosionManager()
+        self.brick_events = []  # BrickDestroyed events not yet processed
+
+        self.frame = 0  # steps taken on this world
+
+
+def make_inputs(left=False, right=False, launch=False, mouse_x=None):
+    """Build the per-frame input dict that step() consumes."""
+    return {"left": left, "right": right, "launch": launch, "mouse_x": mouse_x}
+
+
+def step(world, inputs):
+    """
+    Advance the game by one frame.
+
+    Returns "running", "life_lost", "level_complete", "game_over" or "quit".
+    """
+    global sim_time, blast_active, blast_timer
+    global fireball_active, fireball_timer, last_fireball_shot
+    global paddle_state, paddle_state_timer
+    global slow_active, slow_timer, slow_ramp, slow_on_screen
+    global shield_active, shield_rect, shield_on_screen
+    global reverse_active, reverse_timer, reverse_on_screen
     global tutorial_active, tutorial_timer, tutorial_phase
 
+    blocks = world.blocks
+    particles = world.particles
+    coins = world.coins
+    powerups = world.powerups
+    blasts = world.blasts
+    fireballs = world.fireballs
+    scoreboard = world.scoreboard
+
+    world.frame += 1
+    sim_time += FRAME_MS
+
+    bar = update_bar()
+
+    # If first ball not launched yet → reset positions each frame
+    if not balls:
+        reset_all_effects(world)
+
+    # Safety: make sure balls[0] exists
+    if not balls:
+        return "quit"
+
+    apply_input(bar, balls[0], inputs)
+
+    # ---------- Tutorial Logic ----------
     if tutorial_active:
-        tutorial_timer += delta_time
+        tutorial_timer += FRAME_MS
 
         # Cycle through tutorial phases based on time
         if tutorial_timer < 2500:
             tutorial_phase = "move"
-            show_tutorial_phase(screen, tutorial_phase)
         elif tutorial_timer < 5000:
             tutorial_phase = "pause"
-            show_tutorial_phase(screen, tutorial_phase)
         elif tutorial_timer < 7500:
             tutorial_phase = "launch"
-            show_tutorial_phase(screen, tutorial_phase)
         else:
             tutorial_active = False  # hide tutorial
 
-    if shield_active and shield_rect:
-        pygame.draw.rect(screen, (0, 180, 255), shield_rect)
-
     # ---------- PARTICLES ----------
-    for particle in particles[:]:
-        particle.update()
-        particle.draw(screen)
-        if particle.is_dead():
-            particles.remove(particle)
+    profiler.begin("particles")
+    particles.update()
+    profiler.end()
 
     # ---------- COINS ----------
-    for coin in coins[:]:
+    profiler.begin("drops")
+    # Removed items are swapped with the last one, so i only moves on
+    # when the item at i stays
+    i = 0
+    while i < len(coins):
+        coin = coins[i]
         coin.y += coin.velocity_y * slow_ramp
         coin.rect.y = coin.y
-        coin.draw(screen)
         if coin.is_off_screen():
-            coins.remove(coin)
+            coin_pool.release_at(coins, i)
+        else:
+            i += 1
 
     # Detect paddle → coin collection
-    for coin in coins[:]:
+    i = 0
+    while i < len(coins):
+        coin = coins[i]
         if coin.rect.bottom >= bar.top and coin.rect.colliderect(bar):
             scoreboard.add_points(50)
-            coins.remove(coin)
+            coin_pool.release_at(coins, i)
             if isinstance(coin_sound, Sound):
                 coin_sound.play()
+        else:
+            i += 1
 
     # ---------- POWERUPS ----------
-    for powerup in powerups[:]:
+    i = 0
+    while i < len(powerups):
+        powerup = powerups[i]
         powerup.y += powerup.velocity_y * slow_ramp
         powerup.rect.y = powerup.y
-        powerup.draw(screen)
         if powerup.is_off_screen():
             if powerup.type == "slow":
                 slow_on_screen = False
@@ -708,13 +1039,15 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
             elif powerup.type == "reverse":
                 reverse_on_screen = False
 
-            powerups.remove(powerup)
+            powerup_pool.release_at(powerups, i)
+        else:
+            i += 1
 
     # Paddle collects a falling powerup
-    for powerup in powerups[:]:
+    i = 0
+    while i < len(powerups):
+        powerup = powerups[i]
         if bar.colliderect(powerup.rect):
-            powerups.remove(powerup)
-
             # Activate effect based on type
             if powerup.type == "blast":
                 # Turn off paddle size powerups when getting blast
@@ -722,7 +1055,7 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
                 paddle_state_timer = 0
                 fireball_active = False  # Stop new fireballs (existing ones continue)
                 fireball_timer = 0
-                
+
                 blast_active = True
                 blast_timer = blast_duration
 
@@ -734,39 +1067,38 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
                 blast_timer = 0
                 fireball_active = False
                 fireball_timer = 0
-                
+
                 paddle_state = "small"
                 paddle_state_timer = paddle_power_duration
-                
+
             elif powerup.type == "big_paddle":
                 blast_active = False
                 blast_timer = 0
                 fireball_active = False
                 fireball_timer = 0
-                
+
                 paddle_state = "big"
                 paddle_state_timer = paddle_power_duration
-                
+
             elif powerup.type == "fireball":
                 # Turn off other paddle powerups when getting fireball
                 blast_active = False
                 blast_timer = 0
                 paddle_state = "normal"
                 paddle_state_timer = 0
-                
+
                 fireball_active = True
                 fireball_timer = fireball_duration
 
                 if fireball_moving_sound:
                     fireball_moving_sound.play()
 
-
             elif powerup.type == "triple_ball":
                 # Triple ball doesn't turn off other powerups
                 spawn_triple_ball()
             elif powerup.type == "slow":
                 slow_active = True
-                slow_timer = pygame.time.get_ticks()
+                slow_timer = sim_time
                 slow_ramp = 1.0
                 slow_on_screen = False
             elif powerup.type == "shield":
@@ -780,22 +1112,29 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
                 )
             elif powerup.type == "reverse":
                 reverse_active = True
-                reverse_timer = pygame.time.get_ticks()
+                reverse_timer = sim_time
                 reverse_on_screen = False
 
             if coin_sound:
                 coin_sound.play()
 
+            powerup_pool.release_at(powerups, i)
+        else:
+            i += 1
+
+    profiler.end()
+
     # ---------- BLAST AUTO-FIRE ----------
+    profiler.begin("blasts")
     if blast_active and blast_timer > 0:
         blast_timer -= 1
 
         # Fire alternating blasts every 10 frames
         if blast_timer % 10 == 0:
             if blast_timer % 20 == 0:
-                blasts.append(BlueBlast(bar.left + 2, bar.top - 20))   # left shot
+                blasts.append(blast_pool.acquire(bar.left + 2, bar.top - 20))   # left shot
             else:
-                blasts.append(BlueBlast(bar.right - 22, bar.top - 20))  # right shot
+                blasts.append(blast_pool.acquire(bar.right - 22, bar.top - 20))  # right shot
 
             if isinstance(blast_shoot_sound, Sound):
                 blast_shoot_sound.play()
@@ -803,32 +1142,25 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
         # Disable blast when timer expires
         if blast_timer <= 0:
             blast_active = False
-            
+    profiler.end()
+
     # Auto-shoot fireballs when active (shoots 1 at a time)
+    profiler.begin("fireballs")
     if fireball_active and fireball_timer > 0:
         # Shoot 1 fireball every 30 frames (0.5 seconds)
         # Check BEFORE decrementing so first shot happens immediately
-        if not hasattr(game_loop, "last_fireball_shot"):
-            game_loop.last_fireball_shot = 0
+        if blocks and sim_time - last_fireball_shot >= 500:
+            last_fireball_shot = sim_time
 
-        now = pygame.time.get_ticks()
+            targeted_brick = fireball_rng.choice(blocks)
 
-        if blocks and now - game_loop.last_fireball_shot >= 500:
-            game_loop.last_fireball_shot = now
-
-            targeted_brick = random.choice(blocks)
-
-            new_fireball = Fireball(
+            new_fireball = fireball_pool.acquire(
                 bar.centerx,
                 bar.top - 40,
                 targeted_brick.rect.centerx,
                 targeted_brick.rect.centery
             )
-
-            if not hasattr(game_loop, 'fireballs'):
-                game_loop.fireballs = []
-
-            game_loop.fireballs.append(new_fireball)
+            fireballs.append(new_fireball)
 
             if fireball_moving_sound:
                 fireball_moving_sound.play()
@@ -837,150 +1169,69 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
 
         if fireball_timer <= 0:
             fireball_active = False
-            
-    # Handle paddle state timer (for small and big paddle)
-    if paddle_state != "normal":
-        paddle_state_timer -= 1
-        if paddle_state_timer <= 0:
-            paddle_state = "normal"
+    profiler.end()
 
     # ---------- PADDLE SIZE TIMER ----------
+    # Small / big paddle: counts down once per step
     if paddle_state != "normal":
         paddle_state_timer -= 1
         if paddle_state_timer <= 0:
             paddle_state = "normal"
 
     # ---------- BLAST PROJECTILES ----------
-    for blast in blasts[:]:
+    profiler.begin("blasts")
+    i = 0
+    while i < len(blasts):
+        blast = blasts[i]
         blast.update()
-        blast.draw(screen)
         if blast.is_off_screen():
-            blasts.remove(blast)
+            blast_pool.release_at(blasts, i)
+        else:
+            i += 1
 
     # Blasts hitting bricks
-    for blast in blasts[:]:
-        for block in blocks:
-            if block.rect.colliderect(blast.rect):
-                destroyed = block.hit()
-
-                if destroyed:
-                    # Brick breaks → particles + drop roll
-                    for _ in range(15):
-                        particles.append(Particle(block.rect.centerx,
-                                                  block.rect.centery,
-                                                  block.color))
-
-                    drop = choose_drop()
-
-                    if drop == "coin":
-                        coins.append(Coin(block.rect.centerx - 15, block.rect.centery))
-                    elif drop == "blast":
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "blast"))
-                    elif drop == "triple_ball":
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "triple_ball"))
-                    elif drop == "small_paddle":
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "small_paddle"))
-                    elif drop == "big_paddle":
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "big_paddle"))
-                    elif drop == "slow" and not slow_on_screen and not slow_active:
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "slow"))
-                        slow_on_screen = True
-                    elif drop == "shield" and not shield_on_screen and not shield_active:
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "shield"))
-                        shield_on_screen = True
-                    elif drop == "reverse":
-                        powerups.append(PowerUp(block.rect.centerx - 15,
-                                                block.rect.centery, "reverse"))
-
-                    elif drop == "fireball":
-                        powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "fireball"))
-
-                    blocks.remove(block)
-                    scoreboard.add_points(50)
-
-                    if isinstance(brick_sound, Sound):
-                        brick_sound.play()
-
-                blasts.remove(blast)
-                break  # stop checking other blocks for this blast
-
-    # Update and draw fireballs
-    if hasattr(game_loop, 'fireballs'):
-        for fireball in game_loop.fireballs[:]:
-            fireball.update()
-            fireball.draw(screen)
-            if not fireball.active:
-                game_loop.fireballs.remove(fireball)
+    i = 0
+    while i < len(blasts):
+        block = blocks.first_hit(blasts[i].rect)
+        if block is not None:
+            damage_brick(world, block, "blast")
+            blast_pool.release_at(blasts, i)
+        else:
+            i += 1
+
+    profiler.end()
+
+    # Update fireballs
+    profiler.begin("fireballs")
+    i = 0
+    while i < len(fireballs):
+        fireball = fireballs[i]
+        fireball.update()
+        if not fireball.active:
+            fireball_pool.release_at(fireballs, i)
+        else:
+            i += 1
 
     # Check if fireballs hit bricks
-    if hasattr(game_loop, 'fireballs'):
-        for fireball in game_loop.fireballs[:]:
-            fireball_rect = fireball.rect
-            for block in blocks[:]:
-                if block.rect.colliderect(fireball_rect):
-                    destroyed = block.hit()
-
-                    if destroyed:
-                        # Create EXPLOSION!
-                        explosion_manager.create_explosion(
-                            block.rect.centerx,
-                            block.rect.centery,
-                            block.color
-                        )
-
-                        # Force immediate visual update this frame
-                        explosion_manager.update()
-                        explosion_manager.draw(screen)
-
-                        # Play explosion sound
-                        if fireball_explosion_sound:
-                            fireball_explosion_sound.play()
-
-                        # Use drop table
-                        drop = choose_drop()
-
-                        if drop == "coin":
-                            coins.append(Coin(block.rect.centerx - 15, block.rect.centery))
-                        elif drop == "blast":
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "blast"))
-                        elif drop == "triple_ball":
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "triple_ball"))
-                        elif drop == "small_paddle":
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "small_paddle"))
-                        elif drop == "big_paddle":
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "big_paddle"))
-                        elif drop == "slow" and not slow_on_screen and not slow_active:
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "slow"))
-                            slow_on_screen = True
-                        elif drop == "shield" and not shield_on_screen and not shield_active:
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "shield"))
-                            shield_on_screen = True
-                        elif drop == "reverse":
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "reverse"))    
-                        elif drop == "fireball":
-                            powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "fireball"))
-                        
-                        blocks.remove(block)
-                        scoreboard.add_points(50)
-                        
-                        if isinstance(brick_sound, Sound):
-                            brick_sound.play()
-                    
-                    # Fireball explodes on contact
-                    game_loop.fireballs.remove(fireball)
-                    break
+    i = 0
+    while i < len(fireballs):
+        block = blocks.first_hit(fireballs[i].rect)
+        if block is not None:
+            damage_brick(world, block, "fireball")
+
+            # Fireball explodes on contact
+            fireball_pool.release_at(fireballs, i)
+        else:
+            i += 1
+    profiler.end()
 
     # Update explosion particles
-    explosion_manager.update()
-    explosion_manager.draw(screen)
+    profiler.begin("particles")
+    world.explosion_manager.update()
+    profiler.end()
 
     if len(blocks) == 0:
+        process_brick_events(world)
         if isinstance(game_timer, Timer):
             game_timer.pause()
         if isinstance(level_timer, Timer):
@@ -988,10 +1239,22 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
         return "level_complete"
 
     # ---------- BALL MOVEMENT ----------
-    if not move_ball(screen, walls, bar, balls):
+    # Balls break bricks the moment they touch them
+    def on_brick_hit(block):
+        damage_brick(world, block, "ball")
+
+    profiler.begin("collision")
+    balls_left = move_ball(WALL_RECT, bar, balls, blocks, on_brick_hit)
+    profiler.end()
+
+    # Effects, drops and points for every brick broken this step
+    process_brick_events(world)
+
+    if not balls_left:
         # Ball lost → update scoreboard & life handling
-        if not update_scoreboard(screen, scoreboard, game_timer_ref, blasts, coins, powerups, particles):
+        if not lose_life(world):
             return "game_over"
+        return "life_lost"
 
     # ---------- COUNTDOWN TIMER END ----------
     if level_timer and level_timer.get_time() <= 0:
@@ -1003,25 +1266,6 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
         set_win(False)
         return "game_over"
 
-    # ---------- PAUSE ----------
-    if pause_requested:
-        if isinstance(game_timer, Timer):
-            game_timer.pause()
-        if isinstance(level_timer, Timer):
-            level_timer.pause()
-
-        paused = pause_game(screen)
-        pause_requested = False
-
-        if not paused:
-            return "quit"
-
-        # Resume timers after unpausing
-        if isinstance(game_timer, Timer):
-            game_timer.resume()
-        if isinstance(level_timer, Timer):
-            level_timer.resume()
-
     # ---------- TIMER UPDATES ----------
     if isinstance(game_timer, Timer):
         game_timer.update()
@@ -1030,7 +1274,7 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
 
     # ---------- Slow Time timing logic ----------
     if slow_active:
-        elapsed = pygame.time.get_ticks() - slow_timer
+        elapsed = sim_time - slow_timer
 
         if elapsed < 1000:
             slow_ramp = max(0.5, 1.0 - (elapsed / 2000))
@@ -1042,96 +1286,57 @@ def game_loop(screen, scoreboard, game_timer_ref, blocks, debug_mode, level,
                 slow_active = False
                 slow_ramp = 1.0
 
-    if reverse_active and pygame.time.get_ticks() - reverse_timer > reverse_duration:
+    if reverse_active and sim_time - reverse_timer > reverse_duration:
         reverse_active = False
 
-    # ---------- FPS DISPLAY ----------
-    if show_fps:
-        fps = int(clock.get_fps())
-        fps_text = font.render(f"FPS: {fps}", True, (255, 255, 0))
-        fps_rect = fps_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 40))
-        screen.blit(fps_text, fps_rect)
-
-    pygame.display.flip()
-
-    delta_time = clock.tick(60)
     return "running"
 
 
 def define_blocks(screen, level, wall_padding=WALL_PADDING):
-    """Define the brick layout for the current level."""
+    """Define the brick layout for the current level as a BrickGrid."""
     global debug_countdown_mode
 
-    blocks = []
-    block_width, block_height = 60, 25
-    block_space = 10
-
-    # ----- DEBUG MODE -----
-    if level == 0:
-        cols = 16
-        row = [0] * cols
-
-        if debug_countdown_mode:
-            row[cols//2 - 1] = 1
-            row[cols//2] = 1
-        else:
-            row[cols//2] = 1
-
-        layout = [row]
-    else:
-        layout = get_level_pattern(level)
-
-    if not layout:
-        return blocks
+    # Each layout is compiled once; later starts only rebuild the bricks
+    key = (level, debug_countdown_mode if level == 0 else False)
+    compiled = compiled_levels.get(key)
 
-    rows = len(layout)
-    cols = len(layout[0])
+    if compiled is None:
+        # ----- DEBUG MODE -----
+        if level == 0:
+            cols = 16
+            row = [0] * cols
 
-    total_blocks_width = cols * block_width + (cols - 1) * block_space
-    left_offset = (SCREEN_WIDTH - total_blocks_width) // 2
-
-    # ----- PLACE BLOCKS -----
-    for row_index, row in enumerate(layout):
-        for col_index, cell in enumerate(row):
-
-            if cell == 0:
-                continue
-
-            block_x = left_offset + col_index * (block_width + block_space)
-            block_y = BRICKS_TOP + (block_height * row_index) + (block_space * row_index)
-
-            # normal number mode
-            if isinstance(cell, int):
-                block_type = cell
-                color = COLORS[row_index % len(COLORS)]
-
-            # tuple mode (type, color)
-            elif isinstance(cell, (tuple, list)):
-                block_type = cell[0]
-                color_index = cell[1] % len(COLORS)
-                color = COLORS[color_index]
+            if debug_countdown_mode:
+                row[cols//2 - 1] = 1
+                row[cols//2] = 1
             else:
-                continue
+                row[cols//2] = 1
 
-            # square block center shift
-            if block_type == 2:
-                block_x += (block_width - 35) // 2
-                block_y += (block_height - 35) // 2
+            layout = [row]
+        else:
+            layout = get_level_pattern(level)
 
-            blocks.append(Block(block_x, block_y, color, block_type))
+        # A level given as a file name is read from its JSON file
+        if isinstance(layout, str):
+            path = os.path.join(ROOT_PATH, layout)
+            compiled = CompiledLevel.from_file(path, SCREEN_WIDTH, BRICKS_TOP)
+        else:
+            compiled = CompiledLevel(layout, SCREEN_WIDTH, BRICKS_TOP)
+        compiled_levels[key] = compiled
 
-    return blocks
+    return compiled.build_grid()
 
 
-def handle_input(bar, main_ball):
-    """Keyboard + mouse handling, launch logic, paddle movement."""
-    global pause_requested, bar_x, tutorial_active, reverse_active
+def read_input():
+    """Collect this frame's keyboard + mouse state. Returns None if the window closes."""
+    global pause_requested
 
-    mouse_enabled = cfg.get("mouse_enabled", False)
+    mouse_enabled = settings.get_bool("mouse_enabled")
+    inputs = make_inputs()
 
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
-            return False
+            return None
 
         # ---------- KEYBOARD ----------
         if event.type == pygame.KEYDOWN:
@@ -1139,142 +1344,106 @@ def handle_input(bar, main_ball):
             # Pause
             if event.key == pygame.K_ESCAPE:
                 if isinstance(pause_sound, Sound):
-                    pause_sound.set_volume(current_volume())
+                    pause_sound.set_volume(settings.sfx_volume())
                     pause_sound.play()
                 pause_requested = True
-                return True
-
-            # Tutorial: SPACE ends tutorial and launches
-            if tutorial_active and event.key == pygame.K_SPACE:
-                tutorial_active = False
-
-                balls[0]["vel"].x = get_x_angle(bar, balls[0])
-                balls[0]["vel"].y = -5
-
-                if isinstance(game_timer, Timer):
-                    if game_timer.start_time is None:
-                        game_timer.start()
-                    else:
-                        game_timer.resume()
+                return inputs
 
-                if isinstance(level_timer, Timer):
-                    if level_timer.start_time is None:
-                        level_timer.start()
-                    else:
-                        level_timer.resume()
-
-                return True
-
-            # Normal launch
-            if event.key == pygame.K_SPACE and main_ball["vel"].length() == 0 and not tutorial_active:
-                bar_center = bar.centerx
-                ball_center = main_ball["pos"].x
-
-                # Center correction
-                if abs(ball_center - bar_center) < 3:
-                    main_ball["pos"].x = bar_center
+            # SPACE launches (or ends the tutorial)
+            if event.key == pygame.K_SPACE:
+                inputs["launch"] = True
 
-                main_ball["vel"].x = get_x_angle(bar, main_ball)
-                if abs(main_ball["vel"].x) < 0.5:
-                    main_ball["vel"].x = 0
+        # ---------- MOUSE CLICK LAUNCH ----------
+        if mouse_enabled and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            inputs["launch"] = True
 
-                main_ball["vel"].y = -6
+    # ---------- PADDLE MOVEMENT ----------
+    keys = pygame.key.get_pressed()
+    inputs["left"] = bool(keys[pygame.K_LEFT] or keys[pygame.K_a])
+    inputs["right"] = bool(keys[pygame.K_RIGHT] or keys[pygame.K_d])
 
-                if isinstance(game_timer, Timer):
-                    if game_timer.start_time is None:
-                        game_timer.start()
-                    else:
-                        game_timer.resume()
+    # ---------- MOUSE MOVEMENT ----------
+    if mouse_enabled:
+        inputs["mouse_x"] = pygame.mouse.get_pos()[0]
 
-                if isinstance(level_timer, Timer):
-                    if level_timer.start_time is None:
-                        level_timer.start()
-                    else:
-                        level_timer.resume()
+    return inputs
 
-                return True
 
-        # ---------- MOUSE CLICK LAUNCH ----------
-        if mouse_enabled and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-
-            # Tutorial click launch
-            if tutorial_active:
-                tutorial_active = False
+def start_timers():
+    """Start (first launch) or resume (after a lost life) the game timers."""
+    if isinstance(game_timer, Timer):
+        if game_timer.start_time is None:
+            game_timer.start()
+        else:
+            game_timer.resume()
 
-                balls[0]["vel"].x = get_x_angle(bar, balls[0])
-                balls[0]["vel"].y = -5
+    if isinstance(level_timer, Timer):
+        if level_timer.start_time is None:
+            level_timer.start()
+        else:
+            level_timer.resume()
 
-                if isinstance(game_timer, Timer):
-                    if game_timer.start_time is None:
-                        game_timer.start()
-                    else:
-                        game_timer.resume()
 
-                if isinstance(level_timer, Timer):
-                    if level_timer.start_time is None:
-                        level_timer.start()
-                    else:
-                        level_timer.resume()
+def apply_input(bar, main_ball, inputs):
+    """Launch logic and paddle movement for one frame of input."""
+    global bar_x, tutorial_active, reverse_active
 
-                return True
+    if inputs["launch"]:
+        # Tutorial: launch ends the tutorial
+        if tutorial_active:
+            tutorial_active = False
 
-            # Normal mouse launch
-            if main_ball["vel"].length() == 0:
-                bar_center = bar.centerx
-                ball_center = main_ball["pos"].x
+            main_ball.vel.x = get_x_angle(bar, main_ball)
+            main_ball.vel.y = -5
 
-                if abs(ball_center - bar_center) < 3:
-                    main_ball["pos"].x = bar_center
+            start_timers()
+            return
 
-                main_ball["vel"].x = get_x_angle(bar, main_ball)
-                if abs(main_ball["vel"].x) < 0.5:
-                    main_ball["vel"].x = 0
+        # Normal launch
+        if main_ball.vel.length() == 0:
+            bar_center = bar.centerx
+            ball_center = main_ball.pos.x
 
-                main_ball["vel"].y = -6
+            # Center correction
+            if abs(ball_center - bar_center) < 3:
+                main_ball.pos.x = bar_center
 
-                if isinstance(game_timer, Timer):
-                    if game_timer.start_time is None:
-                        game_timer.start()
-                    else:
-                        game_timer.resume()
+            main_ball.vel.x = get_x_angle(bar, main_ball)
+            if abs(main_ball.vel.x) < 0.5:
+                main_ball.vel.x = 0
 
-                if isinstance(level_timer, Timer):
-                    if level_timer.start_time is None:
-                        level_timer.start()
-                    else:
-                        level_timer.resume()
+            main_ball.vel.y = -6
 
-                return True
+            start_timers()
+            return
 
     # ---------- PADDLE MOVEMENT ----------
-    keys = pygame.key.get_pressed()
-    paddle_width = int(getattr(draw_bar, "width", BAR_WIDTH))
+    paddle_width = int(bar_width)
 
     # Movement BEFORE launch
-    if main_ball["vel"].length() == 0:
-        ball_x = main_ball["pos"].x
+    if main_ball.vel.length() == 0:
+        ball_x = main_ball.pos.x
         left_limit = int(ball_x - (paddle_width - ball_radius * 2))
         right_limit = int(ball_x - ball_radius * 2)
 
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if inputs["left"]:
             bar_x = max(bar_x - speed, left_limit)
 
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        if inputs["right"]:
             bar_x = min(bar_x + speed, right_limit)
 
     else:
         # Movement AFTER launch
         edge_adjust = 8
-        current_width = int(getattr(draw_bar, "width", BAR_WIDTH))
 
         min_x = WALL_PADDING - edge_adjust
-        max_x = SCREEN_WIDTH - WALL_PADDING - current_width + edge_adjust
+        max_x = SCREEN_WIDTH - WALL_PADDING - paddle_width + edge_adjust
 
-        move_left = keys[pygame.K_LEFT] or keys[pygame.K_a]
-        move_right = keys[pygame.K_RIGHT] or keys[pygame.K_d]
+        move_left = inputs["left"]
+        move_right = inputs["right"]
 
         if reverse_active:
-            if pygame.time.get_ticks() - reverse_timer > reverse_duration:
+            if sim_time - reverse_timer > reverse_duration:
                 reverse_active = False
             else:
                 move_left, move_right = move_right, move_left
@@ -1285,18 +1454,17 @@ def handle_input(bar, main_ball):
             bar_x = min(bar_x + speed, max_x)
 
     # ---------- MOUSE MOVEMENT ----------
-    if mouse_enabled:
-        mx = pygame.mouse.get_pos()[0]
+    if inputs["mouse_x"] is not None:
+        mx = inputs["mouse_x"]
 
-        if reverse_active and main_ball["vel"].length() != 0:
+        if reverse_active and main_ball.vel.length() != 0:
             mx = SCREEN_WIDTH - mx
 
         target_x = mx - (paddle_width // 2)
-        current_width = int(getattr(draw_bar, "width", BAR_WIDTH))
 
         # Pre-launch limits
-        if main_ball["vel"].length() == 0:
-            ball_x = main_ball["pos"].x
+        if main_ball.vel.length() == 0:
+            ball_x = main_ball.pos.x
             left_limit = int(ball_x - (paddle_width - ball_radius * 2))
             right_limit = int(ball_x - ball_radius * 2)
             target_x = max(left_limit, min(target_x, right_limit))
@@ -1304,7 +1472,7 @@ def handle_input(bar, main_ball):
             # Wall limits
             target_x = max(
                 WALL_PADDING,
-                min(target_x, SCREEN_WIDTH - WALL_PADDING - current_width)
+                min(target_x, SCREEN_WIDTH - WALL_PADDING - paddle_width)
             )
         # Smooth mouse movement
         screen_distance = (SCREEN_WIDTH - WALL_PADDING * 2 - paddle_width)
@@ -1316,100 +1484,149 @@ def handle_input(bar, main_ball):
         elif bar_x > target_x:
             bar_x = max(bar_x - max_step, target_x)
 
-    return True
-
 
 # ================= Movement & Physics =================
 # Handles ball movement, wall bouncing, and paddle collisions.
-def move_ball(screen, walls, bar, balls_list):
-    global shield_active, shield_rect, slow_ramp, shield_used
-    if balls_list[0]["vel"].length() == 0:
-        if not tutorial_active:
-            msg = font.render("PRESS [SPACE] TO BEGIN", True, (255, 255, 0))
-            screen.blit(
-                msg,
-                (SCREEN_WIDTH // 2 - msg.get_width() // 2, SCREEN_HEIGHT // 2)
-            )
+def move_ball(walls, bar, balls_list, blocks=None, on_brick_hit=None):
+    global last_hit_ball
+
+    if balls_list[0].vel.length() == 0:
         return True
 
     # --- After launch: move each active ball ---
-    for b in balls_list[:]:
-        steps = 3
-        for _ in range(steps):
-            b["pos"] += (b["vel"] * slow_ramp) / steps
-
-        wall_check_multi(b, walls)
-        paddle_check_multi(b, bar)
-
-        if shield_active:
-            ball_box = pygame.Rect(
-                b["pos"].x - ball_radius,
-                b["pos"].y - ball_radius,
-                ball_radius * 2,
-                ball_radius * 2
-            )
-
-            if shield_rect and shield_rect.colliderect(ball_box):
-                b["vel"].y *= -1
-                b["pos"].y = shield_rect.top - ball_radius - 1
-                shield_active = False
-                shield_used = True
+    for b in balls_list:
+        sweep_ball(b, walls, bar, blocks, on_brick_hit)
 
-        if b["pos"].y - ball_radius > SCREEN_HEIGHT:
-            balls_list.remove(b)
+    # Drop balls that fell off the bottom (they go back to the free list)
+    if balls_list.remove_below(SCREEN_HEIGHT, ball_radius):
+        if last_hit_ball not in balls_list:
+            last_hit_ball = None
 
     return len(balls_list) > 0
 
 
-def wall_check_multi(ball, walls):
-    hit_wall = False
+def sweep_ball(ball, walls, bar, blocks, on_brick_hit):
+    """
+    Move one ball through this frame. Every wall, paddle, shield or brick
+    it touches on the way is handled in the order it happens, so fast
+    balls bounce correctly instead of passing through things.
+    """
+    global shield_active, shield_used
+
+    pos = ball.pos
+    vel = ball.vel
+    remaining = 1.0  # share of this frame's move still to do
+
+    for _ in range(MAX_BOUNCES):
+        dx = vel.x * slow_ramp * remaining
+        dy = vel.y * slow_ramp * remaining
+        if dx == 0 and dy == 0:
+            return
+
+        hit = first_contact(pos.x, pos.y, dx, dy, walls, bar, blocks)
+        if hit is None:
+            pos.x += dx
+            pos.y += dy
+            return
+
+        t, (nx, ny), kind, target = hit
+        pos.x += dx * t
+        pos.y += dy * t
+        remaining *= 1 - t
+
+        if kind == "wall":
+            bounce(vel, nx, ny)
+            if isinstance(wall_sound, Sound):
+                wall_sound.play()
+
+        elif kind == "paddle":
+            paddle_bounce(ball, bar)
+
+        elif kind == "shield":
+            vel.y = -abs(vel.y)
+            pos.y = min(pos.y, target.top - ball_radius - 1)
+            shield_active = False
+            shield_used = True
+
+        else:
+            bounce(vel, nx, ny)
+            if on_brick_hit:
+                on_brick_hit(target)
+
+
+def first_contact(x, y, dx, dy, walls, bar, blocks):
+    """Earliest thing the ball touches while moving by (dx, dy): (t, normal, kind, target) or None."""
+    best = None
+
+    # Walls: left, right and top edges of the play area
+    if dx < 0 and x + dx <= walls.left + ball_radius:
+        best = (max(0.0, (walls.left + ball_radius - x) / dx), (1.0, 0.0), "wall", None)
+    elif dx > 0 and x + dx >= walls.right - ball_radius:
+        best = (max(0.0, (walls.right - ball_radius - x) / dx), (-1.0, 0.0), "wall", None)
+
+    if dy < 0 and y + dy <= walls.top + ball_radius:
+        t = max(0.0, (walls.top + ball_radius - y) / dy)
+        if best is None or t < best[0]:
+            best = (t, (0.0, 1.0), "wall", None)
+
+    # Paddle and shield only catch balls coming down
+    if dy > 0:
+        hit = sweep_circle_rect(x, y, dx, dy, ball_radius, bar)
+        if hit and (best is None or hit[0] < best[0]):
+            best = (hit[0], hit[1], "paddle", bar)
+
+        if shield_active and shield_rect:
+            hit = sweep_circle_rect(x, y, dx, dy, ball_radius, shield_rect)
+            if hit and (best is None or hit[0] < best[0]):
+                best = (hit[0], hit[1], "shield", shield_rect)
+
+    # Bricks anywhere along the path
+    if blocks:
+        path = sweep_path  # reused so sweeping allocates no Rect
+        path.update(
+            min(x, x + dx) - ball_radius,
+            min(y, y + dy) - ball_radius,
+            abs(dx) + ball_radius * 2 + 1,
+            abs(dy) + ball_radius * 2 + 1
+        )
+        for block in blocks.query(path):
+            hit = sweep_circle_rect(x, y, dx, dy, ball_radius, block.rect)
+            if hit and (best is None or hit[0] < best[0]):
+                best = (hit[0], hit[1], "brick", block)
 
-    if ball["pos"].x - ball_radius <= walls.left:
-        ball["vel"].x *= -1
-        ball["pos"].x = walls.left + ball_radius
-        hit_wall = True
-    elif ball["pos"].x + ball_radius >= walls.right:
-        ball["vel"].x *= -1
-        ball["pos"].x = walls.right - ball_radius
-        hit_wall = True
+    return best
 
-    if ball["pos"].y - ball_radius <= walls.top:
-        ball["vel"].y *= -1
-        ball["pos"].y = walls.top + ball_radius
-        hit_wall = True
 
-    if hit_wall and isinstance(wall_sound, Sound):
-        wall_sound.play()
+def bounce(vel, nx, ny):
+    """Send the ball away from a surface with normal (nx, ny), flipping only x or only y."""
+    if abs(nx) > abs(ny):
+        vel.x = abs(vel.x) if nx > 0 else -abs(vel.x)
+    else:
+        vel.y = abs(vel.y) if ny > 0 else -abs(vel.y)
 
 
 # ---------- Paddle Collision ----------
-def paddle_check_multi(ball, bar):
+def paddle_bounce(ball, bar):
     global last_hit_ball
 
-    ball_rect = pygame.Rect(
-        ball["pos"].x - ball_radius,
-        ball["pos"].y - ball_radius,
-        ball_radius * 2,
-        ball_radius * 2
-    )
+    ball.vel.x = get_x_angle(bar, ball)
 
-    if bar.colliderect(ball_rect) and ball["vel"].y > 0:
-        ball["vel"].x = get_x_angle(bar, ball)
+    if abs(ball.vel.x) < 0.2:
+        ball.vel.x = 0
 
-        if abs(ball["vel"].x) < 0.2:
-            ball["vel"].x = 0
+    ball.vel.y = -abs(ball.vel.y)
 
-        ball["vel"].y *= -1
-        ball["pos"].y = bar.top - ball_radius - 1
+    # Paddle moved into the ball: lift it back on top
+    ball.pos.y = min(ball.pos.y, bar.top - ball_radius - 1)
 
-        if isinstance(paddle_sound, Sound):
-            paddle_sound.play()
+    if isinstance(paddle_sound, Sound):
+        paddle_sound.play()
 
-        last_hit_ball = ball
+    last_hit_ball = ball
 
 
-def get_x_angle(bar, ball_dict):
-    ball_center_x = ball_dict["pos"].x
+def get_x_angle(bar, ball):
+    ball_center_x = ball.pos.x
     bar_center_x = bar.centerx
     offset = ball_center_x - bar_center_x
     ratio = ball_max_velocity_x / (bar.width / 2)
@@ -1417,93 +1634,94 @@ def get_x_angle(bar, ball_dict):
 
 
 # ================= Collision & Drops =================
-def detect_collision(blocks, particles, coins, powerups, scoreboard):
-    global balls, blast_active
-    global slow_on_screen, slow_active
-    global shield_on_screen, shield_active
-    global reverse_active, reverse_on_screen
-
-    score_increase = 0
-
-    for ball in balls[:]:
-        ball_rect = pygame.Rect(
-            ball["pos"].x - ball_radius,
-            ball["pos"].y - ball_radius,
-            ball_radius*2,
-            ball_radius*2
-        )
-        block_index = ball_rect.collidelist(blocks)
-
-        if block_index != -1:
-            block = blocks[block_index]
-
-            # ---- COLLISION ANGLE CALCULATION ----
-            if abs(ball_rect.bottom - block.rect.top) < 8 and ball["vel"].y > 0:
-                ball["vel"].y *= -1
-            elif abs(ball_rect.top - block.rect.bottom) < 8 and ball["vel"].y < 0:
-                ball["vel"].y *= -1
-            elif abs(ball_rect.right - block.rect.left) < 8 and ball["vel"].x > 0:
-                ball["vel"].x *= -1
-            elif abs(ball_rect.left - block.rect.right) < 8 and ball["vel"].x < 0:
-                ball["vel"].x *= -1
-            else:
-                ball["vel"].y *= -1
+def damage_brick(world, block, source):
+    """
+    Hit block once on behalf of source ("ball", "blast" or "fireball").
+    A brick that breaks leaves the grid right away, so nothing else can
+    hit it, and a BrickDestroyed event queues up its effects.
+    """
+    if world.blocks.hit(block):
+        world.blocks.remove(block)
+        world.brick_events.append(BrickDestroyed(block, source))
+
+
+def process_brick_events(world):
+    """
+    Run the effects of every brick broken this step in one pass: sparks
+    or explosions, drops, points, and each sound at most once.
+    """
+    events = world.brick_events
+    if not events:
+        return
+
+    sparks = []
+    sparks_colors = []
+    exploded = False
+
+    # damage_brick() takes a broken brick off the grid at once, so each
+    # brick shows up here only once
+    for event in events:
+        block = event.block
+        x, y = block.rect.center
+        if BRICK_EFFECTS[event.source] == "explosion":
+            world.explosion_manager.create_explosion(x, y, block.color)
+            exploded = True
+        else:
+            sparks.append((x, y))
+            sparks_colors.append(block.color)
 
-            destroyed = block.hit()
+        spawn_drop(world, choose_drop(world), x, y)
+        world.scoreboard.add_points(BRICK_POINTS)
 
-            if destroyed:
-                for _ in range(15):
-                    particles.append(
-                        Particle(block.rect.centerx, block.rect.centery, block.color)
-                    )
+    events.clear()
 
-                drop = choose_drop()
+    if sparks:
+        world.particles.emit_sparks_many(sparks, sparks_colors)
 
-                if drop == "coin":
-                    coins.append(Coin(block.rect.centerx - 15, block.rect.centery))
-                elif drop == "blast":
-                    powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "blast"))
-                elif drop == "triple_ball":
-                    powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "triple_ball"))
-                elif drop == "small_paddle":
-                    powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "small_paddle"))
-                elif drop == "big_paddle":
-                    powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "big_paddle"))
-                elif drop == "slow" and not slow_on_screen and not slow_active:
-                    powerups.append(PowerUp(block.rect.centerx - 15,
-                    block.rect.centery, "slow"))
-                    slow_on_screen = True
-                elif drop == "shield" and not shield_on_screen and not shield_active:
-                    powerups.append(PowerUp(block.rect.centerx - 15,
-                  block.rect.centery, "shield"))
-                    shield_on_screen = True
-                elif drop == "reverse":
-                    powerups.append(PowerUp(block.rect.centerx - 15,
-                    block.rect.centery, "reverse"))
-                elif drop == "fireball":
-                    powerups.append(PowerUp(block.rect.centerx - 15, block.rect.centery, "fireball"))
+    # One of each sound per step, however many bricks broke
+    if exploded and isinstance(fireball_explosion_sound, Sound):
+        fireball_explosion_sound.play()
+    if isinstance(brick_sound, Sound):
+        brick_sound.play()
 
-                # remove block after effects
-                blocks.remove(block)
 
-                if isinstance(brick_sound, Sound):
-                    brick_sound.play()
+def spawn_drop(world, drop, x, y):
+    """Drop the item rolled for a brick broken at (x, y)."""
+    global slow_on_screen, shield_on_screen
 
-                score_increase += 50
+    if drop == "nothing":
+        return
+
+    if drop == "coin":
+        world.coins.append(coin_pool.acquire(x - 15, y))
+        return
 
-    return score_increase
+    # Only one slow / shield can be falling or active at a time
+    if drop == "slow":
+        if slow_on_screen or slow_active:
+            return
+        slow_on_screen = True
+    elif drop == "shield":
+        if shield_on_screen or shield_active:
+            return
+        shield_on_screen = True
 
+    # Every other drop is the power-up of the same name
+    world.powerups.append(powerup_pool.acquire(x - 15, y, drop))
 
-def choose_drop():
-    roll = random.random()
-    total = 0
 
-    for item, chance in DROP_TABLE.items():
-        total += chance
-        if roll < total:
-            return item
+def drop_sampler(level):
+    """The compiled drop table for a level (built once)."""
+    sampler = drop_samplers.get(level)
+    if sampler is None:
+        sampler = DropSampler(get_drop_table(level))
+        drop_samplers[level] = sampler
+    return sampler
 
-    return "nothing"
+
+def choose_drop(world):
+    """Roll what a broken brick drops, from the level's drop table."""
+    return world.drops.pick(drop_rng)
 
 
 # ================= Powerups =================
@@ -1518,18 +1736,11 @@ def spawn_triple_ball():
     else:
         base = balls[0]
 
-    new_velocity = abs(base["vel"].x or 3)
-
-    left_pos = base["pos"].copy()
-    right_pos = base["pos"].copy()
-
-    left_pos.x -= 25
-    right_pos.x += 25
+    new_velocity = abs(base.vel.x or 3)
+    x, y = base.pos
 
-    balls.append({"pos": left_pos,
-                  "vel": pygame.Vector2(-new_velocity, -5)})
-    balls.append({"pos": right_pos,
-                  "vel": pygame.Vector2(new_velocity, -5)})
+    balls.spawn(x - 25, y, -new_velocity, -5)
+    balls.spawn(x + 25, y, new_velocity, -5)
 
 
 # ================= UI & Drawing =================
@@ -1543,20 +1754,18 @@ def draw_wall(screen):
     else:
         screen.fill(BLACK)
 
-    wall_bottom = SCREEN_HEIGHT - 150
+    return WALL_RECT
 
-    # Wall rect controls ball boundaries
-    return pygame.Rect(
-        WALL_PADDING,
-        WALL_TOP_PADDING,
-        SCREEN_WIDTH - WALL_PADDING * 2,
-        wall_bottom - WALL_TOP_PADDING
-    )
 
+# ---------- Paddle ----------
+def get_bar():
+    """Current paddle rect."""
+    return pygame.Rect(bar_x, bar_y, bar_width, BAR_HEIGHT)
 
-# ---------- Draw Paddle ----------
-def draw_bar(screen):
-    global bar_x, paddle_state
+
+def update_bar():
+    """Ease the paddle width toward its power-up size and return the paddle rect."""
+    global bar_x, bar_width
 
     # Pick target size based on power-up
     if paddle_state == "small":
@@ -1567,48 +1776,65 @@ def draw_bar(screen):
         target_width = original_paddle_width
 
     # Smooth width transition
-    current_width = getattr(draw_bar, "width", original_paddle_width)
-    current_width += (target_width - current_width) * 0.10
-    draw_bar.width = current_width
+    new_width = bar_width + (target_width - bar_width) * 0.10
 
     # Keep paddle centered when width changes
-    old_width = getattr(draw_bar, "stored_width", original_paddle_width)
-    width_change = current_width - old_width
-    bar_x -= width_change / 2
-    draw_bar.stored_width = current_width
+    bar_x -= (new_width - bar_width) / 2
+    bar_width = new_width
+
+    return get_bar()
+
+
+def build_paddle_sprites():
+    """Tint the paddle once per power-up color and scale it to every width it can ease through."""
+    paddle_sprites.clear()
+    if not paddle_image:
+        return
+
+    low = min(small_paddle_width, original_paddle_width)
+    high = max(big_paddle_width, original_paddle_width)
+
+    for tint in PADDLE_TINTS:
+        for width in range(low, high + 1, PADDLE_WIDTH_STEP):
+            paddle_sprite(tint, width)
+
+
+def paddle_sprite(tint, width):
+    """Cached paddle image with the given tint, scaled to width (rounded to PADDLE_WIDTH_STEP)."""
+    width = max(PADDLE_WIDTH_STEP, int(round(width / PADDLE_WIDTH_STEP)) * PADDLE_WIDTH_STEP)
+    key = (tint, width)
+
+    sprite = paddle_sprites.get(key)
+    if sprite is None:
+        sprite = paddle_image
+        color = PADDLE_TINTS[tint]
+        if color:
+            sprite = paddle_image.copy()
+            sprite.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
+            sprite.fill(color, special_flags=pygame.BLEND_RGB_ADD)
+        sprite = pygame.transform.scale(sprite, (width, BAR_HEIGHT))
+        paddle_sprites[key] = sprite
+
+    return sprite
+
 
-    bar = pygame.Rect(bar_x, bar_y, current_width, BAR_HEIGHT)
+def draw_bar(screen):
+    bar = get_bar()
     image_y_offset = -11
 
     # Color-tint paddle during size power-ups
-    state = paddle_state
-
-    if reverse_active and paddle_image:
-        tinted = paddle_image.copy()
-        tinted.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
-        tinted.fill((255, 0, 0), special_flags=pygame.BLEND_RGB_ADD)
-        current_img = tinted
-
-    elif paddle_state in ("small", "big") and paddle_image:
-        tinted = paddle_image.copy()
-        tinted.fill((0, 0, 0), special_flags=pygame.BLEND_RGB_MULT)
-        if paddle_state == "small":
-            tinted.fill((255, 40, 40), special_flags=pygame.BLEND_RGB_ADD)
-        else:
-            tinted.fill((40, 140, 255), special_flags=pygame.BLEND_RGB_ADD)
-        current_img = tinted
-
+    if reverse_active:
+        tint = "reverse"
+    elif paddle_state in ("small", "big"):
+        tint = paddle_state
     else:
-        current_img = paddle_image
+        tint = "normal"
 
-    # Draw paddle image or fallback rectangle
-    if current_img:
-        scaled_paddle = pygame.transform.scale(current_img, (int(current_width), BAR_HEIGHT))
-        screen.blit(scaled_paddle, (bar_x, bar_y + image_y_offset))
+    # Draw paddle image or fallback rectangle (returns the area drawn)
+    if paddle_image:
+        return screen.blit(paddle_sprite(tint, bar_width), (bar_x, bar_y + image_y_offset))
     else:
-        pygame.draw.rect(screen, RED, bar)
-
-    return bar
+        return pygame.draw.rect(screen, RED, bar)
 
 
 # ---------- Block Drawing ----------
@@ -1629,49 +1855,55 @@ def draw_level(screen, level):
 
 
 # ---------- Tutorial Phase ----------
-def show_tutorial_phase(screen, phase):
-    tutorial_path = os.path.join(ROOT_PATH, "media", "graphics", "tutorial")
-
-    # Load icons used in tutorial prompts
-    arrow_img = pygame.image.load(os.path.join(tutorial_path, "arrow_keys.png"))
-    wasd_img = pygame.image.load(os.path.join(tutorial_path, "wasd_keys.png"))
-    esc_img = pygame.image.load(os.path.join(tutorial_path, "Esc Key.png"))
-    space_img = pygame.image.load(os.path.join(tutorial_path, "Space Bar.png"))
-
-    arrow_img = pygame.transform.scale(arrow_img, (140, 140))
-    wasd_img = pygame.transform.scale(wasd_img, (140, 140))
-    esc_img = pygame.transform.scale(esc_img, (140, 140))
-    space_img = pygame.transform.scale(space_img, (260, 80))
-
-    font = pygame.font.Font(pixel_font_path, 42)
-    label_font = pygame.font.Font(pixel_font_path, 28)
-
-    # Movement tutorial
-    if phase == "move":
-        arrow_pos = (SCREEN_WIDTH // 2 - 180, 290)
-        wasd_pos = (SCREEN_WIDTH // 2 + 40, 290)
-
-        screen.blit(arrow_img, arrow_pos)
-        screen.blit(wasd_img, wasd_pos)
-
-        text = font.render("Use ARROW KEYS or A/D to move", True, WHITE)
-        screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 460))
+def load_tutorial_assets():
+    """Scale the tutorial icons and render the tutorial text once."""
+    global tutorial_assets
+    if tutorial_assets:
+        return
 
-    # Pause tutorial
-    if phase == "pause":
-        esc_pos = (SCREEN_WIDTH // 2 - 70, 290)
-        screen.blit(esc_img, esc_pos)
+    tutorial_path = os.path.join(ROOT_PATH, "media", "graphics", "tutorial")
 
-        text = font.render("Press ESC to pause the game", True, WHITE)
-        screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 460))
+    # Icons used in tutorial prompts
+    arrow_img = assets.load_image(os.path.join(tutorial_path, "arrow_keys.png"), (140, 140))
+    wasd_img = assets.load_image(os.path.join(tutorial_path, "wasd_keys.png"), (140, 140))
+    esc_img = assets.load_image(os.path.join(tutorial_path, "Esc Key.png"), (140, 140))
+    space_img = assets.load_image(os.path.join(tutorial_path, "Space Bar.png"), (260, 80))
+
+    text_font = assets.load_font(42)
+
+    # Prompt text centered under the icons
+    def prompt(message):
+        text = text_font.render(message, True, WHITE)
+        return text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 460)
+
+    phases = {
+        # Movement tutorial
+        "move": [
+            (arrow_img, (SCREEN_WIDTH // 2 - 180, 290)),
+            (wasd_img, (SCREEN_WIDTH // 2 + 40, 290)),
+            prompt("Use ARROW KEYS or A/D to move"),
+        ],
+        # Pause tutorial
+        "pause": [
+            (esc_img, (SCREEN_WIDTH // 2 - 70, 290)),
+            prompt("Press ESC to pause the game"),
+        ],
+        # Launch tutorial
+        "launch": [
+            (space_img, (SCREEN_WIDTH // 2 - 130, 320)),
+            prompt("Press SPACE to launch the ball"),
+        ],
+    }
+
+    # Skip any icon that failed to load
+    tutorial_assets = {
+        phase: [(surface, pos) for surface, pos in items if surface is not None]
+        for phase, items in phases.items()
+    }
 
-    # Launch tutorial
-    if phase == "launch":
-        space_pos = (SCREEN_WIDTH // 2 - 130, 320)
-        screen.blit(space_img, space_pos)
 
-        text = font.render("Press SPACE to launch the ball", True, WHITE)
-        screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 460))
+def show_tutorial_phase(screen, phase):
+    return [screen.blit(surface, pos) for surface, pos in tutorial_assets.get(phase, [])]
 
 
 def show_level_complete(screen, level):
@@ -1684,8 +1916,8 @@ def show_level_complete(screen, level):
 
 
 def show_boss_intro(screen):
-    big_font = pygame.font.Font(pixel_font_path, 76)
-    small_font = pygame.font.Font(pixel_font_path, 36)
+    big_font = assets.load_font(76)
+    small_font = assets.load_font(36)
 
     lines = [
         "FINAL LEVEL!",
@@ -1718,10 +1950,35 @@ def show_boss_intro(screen):
 # ================= Game State =================
 # Life loss, respawn, and game over handling.
 
+# ---------- Object Pools ----------
+def release_pooled(world):
+    """Hand the world's falling items and projectiles back to their pools."""
+    coin_pool.release_all(world.coins)
+    powerup_pool.release_all(world.powerups)
+    blast_pool.release_all(world.blasts)
+    fireball_pool.release_all(world.fireballs)
+
+
+def reset_pool_peaks():
+    """Start measuring every pool's peak again (e.g. per benchmark case)."""
+    for pool in (coin_pool, powerup_pool, blast_pool, fireball_pool):
+        pool.reset_peak()
+
+
+def pool_stats():
+    """Live / peak / allocated counters of every object pool, by pool."""
+    return {
+        "coins": coin_pool.stats(),
+        "powerups": powerup_pool.stats(),
+        "blasts": blast_pool.stats(),
+        "fireballs": fireball_pool.stats(),
+    }
+
+
 # ---------- Reset All Effects ----------
-def reset_all_effects(blasts, coins, powerups, particles):
+def reset_all_effects(world):
     """Master reset: ball, paddle, power-ups, and falling items."""
-    global balls, bar_x
+    global balls, bar_x, bar_width, last_fireball_shot
     global blast_active, blast_timer
     global paddle_state, paddle_state_timer
     global last_hit_ball
@@ -1754,43 +2011,28 @@ def reset_all_effects(blasts, coins, powerups, particles):
     fireball_active = False
     fireball_timer = 0
 
-    if hasattr(game_loop, "fireballs"):
-        game_loop.fireballs.clear()
-
-    if hasattr(game_loop, "last_blast_shot"):
-        game_loop.last_blast_shot = 0
-
-    if hasattr(game_loop, "last_fireball_shot"):
-        game_loop.last_fireball_shot = 0
+    last_fireball_shot = 0
 
     # Reset paddle visuals
-    draw_bar.width = original_paddle_width
-    draw_bar.stored_width = original_paddle_width
+    bar_width = original_paddle_width
 
     # Reset paddle position
     bar_x = (SCREEN_WIDTH - original_paddle_width) // 2
 
     # Reset ball list
-    balls = [
-        {
-            "pos": pygame.Vector2(SCREEN_WIDTH // 2, bar_y - ball_radius - 4),
-            "vel": pygame.Vector2(0, 0)
-        }
-    ]
+    balls.clear()
+    balls.spawn(SCREEN_WIDTH // 2, bar_y - ball_radius - 4)
 
     # Clear falling objects
-    blasts.clear()
-    coins.clear()
-    powerups.clear()
-    particles.clear()
+    release_pooled(world)
+    world.particles.clear()
 
 
-def update_scoreboard(screen, scoreboard, timer, blasts, coins, powerups, particles):
-    global ball_position, ball_velocity, bar_x
-    global blast_active, blast_timer
-    global paddle_state, paddle_state_timer
-    global slow_timer, reverse_timer
-    global fireball_active, fireball_timer
+def lose_life(world):
+    """Take a life after the last ball is lost. Returns False on game over."""
+    global last_hit_ball
+    scoreboard = world.scoreboard
+
     # Player loses one life
     scoreboard.lose_life()
     if isinstance(lose_life_sound, Sound):
@@ -1804,30 +2046,23 @@ def update_scoreboard(screen, scoreboard, timer, blasts, coins, powerups, partic
 
     # If player still has lives, reset ball and paddle
     if scoreboard.lives > 0:
-        global last_hit_ball
         last_hit_ball = None
-
-        reset_all_effects(blasts, coins, powerups, particles)
-
-        if hasattr(game_loop, "fireballs"):
-            game_loop.fireballs.clear()
-
-        message = font.render(f"Lives Left: {scoreboard.lives}", True, WHITE)
-        screen.blit(message, (SCREEN_WIDTH // 2 - message.get_width() // 2, SCREEN_HEIGHT // 2))
-        pygame.display.flip()
-        pygame.time.wait(1000)
+        reset_all_effects(world)
         return True
 
     # No lives left → game over
-    if isinstance(game_timer, Timer):
-        game_timer.pause()
-    if isinstance(level_timer, Timer):
-        level_timer.pause()
-
     set_win(False)
     return False
 
 
+def show_lives_left(screen, scoreboard):
+    """Brief 'Lives Left' message after losing a ball."""
+    message = font.render(f"Lives Left: {scoreboard.lives}", True, WHITE)
+    screen.blit(message, (SCREEN_WIDTH // 2 - message.get_width() // 2, SCREEN_HEIGHT // 2))
+    pygame.display.flip()
+    pygame.time.wait(1000)
+
+
 def set_win(state=True):
     global win
     win = state
@@ -1849,6 +2084,147 @@ def pause_game(screen):
 
     if choice == "resume":
         if isinstance(unpause_sound, Sound):
-            unpause_sound.set_volume(current_volume())
+            unpause_sound.set_volume(settings.sfx_volume())
             unpause_sound.play()
         return True
+
+
+# ================= Headless Simulation =================
+# Run levels without a window or frame limiter, e.g. for CI and balance
+# sweeps. Uses the same step() as the interactive game.
+
+def init_headless(character_image=None):
+    """Prepare the module for simulation without a visible window."""
+    # Images are still converted once at load time, so a display must exist.
+    # With SDL_VIDEODRIVER=dummy this never opens a window.
+    if pygame.display.get_surface() is None:
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+
+    init(character_image)
+
+
+def new_world(level, lives=3):
+    """
+    Build a fresh World for the given level (0 = one-block debug level).
+    Also starts a new headless game: the simulation clock and every other
+    per-game global go back to their start values, so the same seed and
+    inputs play out the same way however many games ran before.
+    """
+    global sim_time, accumulator, queued_launch, pause_requested, win
+    global tutorial_active, tutorial_timer, tutorial_phase, game_timer, level_timer
+
+    sim_time = 0
+    accumulator = 0
+    queued_launch = False
+    pause_requested = False
+    win = None
+
+    # Wall-clock timers and the timed tutorial don't apply off-screen
+    tutorial_active = False
+    tutorial_timer = 0
+    tutorial_phase = "move"
+    game_timer = None
+    level_timer = None
+
+    # Headless games don't read or write the real leaderboard
+    scoreboard = ScoreBoard(pygame.display.get_surface(), use_leaderboard=False)
+    scoreboard.lives = lives
+
+    world = World(scoreboard, define_blocks(None, level), level)
+    reset_all_effects(world)
+    return world
+
+
+def bot_inputs(world):
+    """Simple autopilot: launch, then keep the paddle under the lowest ball."""
+    if not balls:
+        return make_inputs()
+
+    if balls[0].vel.length() == 0:
+        return make_inputs(launch=True)
+
+    # Hit off-center, drifting over time, so the ball never settles into a loop
+    offset = bar_width / 5 * ((world.frame // 300) % 5 - 2) / 2
+    target = max(balls, key=lambda b: b.pos.y).pos.x + offset
+    center = bar_x + bar_width / 2
+    return make_inputs(left=target < center - speed, right=target > center + speed)
+
+
+def simulate(level=1, max_frames=36000, input_fn=bot_inputs, lives=3, seed=None):
+    """
+    Play one level headless as fast as possible.
+
+    input_fn(world) is called once per frame and returns make_inputs(...).
+    seed fixes the random streams (a fresh seed is used if None).
+    Returns (status, world) where status is the last step() result, or
+    "timeout" if max_frames ran out first.
+    """
+    global debug_countdown_mode
+
+    if font is None:
+        init_headless()
+
+    rng.seed(seed)
+    debug_countdown_mode = False  # level 0 is the one-block level here
+    world = new_world(level, lives)
+
+    status = "running"
+    for _ in range(max_frames):
+        status = step(world, input_fn(world))
+        if status not in ("running", "life_lost"):
+            return status, world
+
+    return "timeout", world
+
+
+def replay_run(path=REPLAY_PATH):
+    """
+    Play back a recorded game headless as fast as possible, with the
+    same seed, levels and inputs, so it ends exactly like the original.
+
+    Returns (status, world): "win" if the last level was cleared,
+    "game_over", or the last step() result if the inputs ran out first
+    (the player quit). Raises ValueError if path isn't a replay file.
+    """
+    global tutorial_active, game_timer, level_timer, debug_countdown_mode
+
+    recording = InputRecorder.load(path)
+
+    init_headless()
+    rng.seed(recording.seed)
+
+    level = recording.level
+    max_levels = 0 if level == 0 else get_level_count()
+
+    debug_countdown_mode = recording.countdown
+    world = new_world(level, recording.lives)
+
+    tutorial_active = recording.tutorial
+
+    # Timers count simulated time, so they run out at the same step
+    game_timer = Timer(None, mode="stopwatch", clock=sim_clock)
+    if recording.countdown:
+        level_timer = Timer(None, mode="countdown", countdown_time=10, clock=sim_clock)
+    else:
+        level_timer = make_level_timer(None, level)
+
+    status = "running"
+    for inputs in recording.inputs():
+        status = step(world, inputs)
+
+        if status == "level_complete":
+            level += 1
+            if level > max_levels:
+                return "win", world
+
+            reset_all_effects(world)
+            world.blocks = define_blocks(None, level)
+            world.level = level
+            world.drops = drop_sampler(level)
+            level_timer = make_level_timer(None, level)
+
+        elif status in ("game_over", "quit"):
+            return status, world
+
+    return status, world
@@ -30,6 +30,9 @@ You can mix both styles in the same level.
 
 Notes:
     - Each level must be a list of rows.
+    - A level can also live in a JSON file of rows, with [type, color]
+      lists in place of tuples. Put the file's path (from the game
+      folder) in LEVEL_LAYOUTS instead of the rows.
 """
 
 # ---------- LEVEL 1 ----------
@@ -90,13 +93,31 @@ LEVEL_LAYOUTS = [
 ]
 # Settings for each level
 LEVEL_SETTINGS = [
-    {"timer": "stopwatch"},                        # Level 1
-    {"timer": "stopwatch"},                        # Level 2
-    {"timer": "stopwatch"},                        # Level 3
-    {"timer": "stopwatch"},                        # Level 4
-    {"timer": "countdown", "time_limit": 60}       # Level 5 (Final boss)
+    {"timer": "stopwatch", "drops": "standard"},                        # Level 1
+    {"timer": "stopwatch", "drops": "standard"},                        # Level 2
+    {"timer": "stopwatch", "drops": "standard"},                        # Level 3
+    {"timer": "stopwatch", "drops": "standard"},                        # Level 4
+    {"timer": "countdown", "time_limit": 60, "drops": "standard"}       # Level 5 (Final boss)
 ]
 
+# ---------- DROP TABLES ----------
+# What a broken brick drops, picked by each level's "drops" setting.
+# Chances are relative, so a table doesn't have to add up to 1.
+DROP_TABLES = {
+    "standard": {
+        "coin": 0.20,
+        "triple_ball": 0.10,
+        "blast": 0.10,
+        "fireball": 0.15,
+        "small_paddle": 0.05,
+        "big_paddle": 0.10,
+        "slow": 0.05,
+        "shield": 0.05,
+        "reverse": 0.05,
+        "nothing": 0.15
+    },
+}
+
 
 # ---------- LEVEL HELPERS ----------
 # Return how many levels exist.
@@ -119,4 +140,9 @@ def get_level_settings(level_number):
         level_number = 1
     if level_number > len(LEVEL_SETTINGS):
         level_number = len(LEVEL_SETTINGS)
-    return LEVEL_SETTINGS[level_number - 1]
\ No newline at end of file
+    return LEVEL_SETTINGS[level_number - 1]
+
+
+# Return the drop table (item -> chance) for a given level number.
+def get_drop_table(level_number):
+    return DROP_TABLES[get_level_settings(level_number).get("drops", "standard")]
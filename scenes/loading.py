@@ -1,15 +1,17 @@
 """
 This file draws the loading screen for the game.
-It shows a pixel-style progress bar, loading text, and percent numbers.
+It shows a pixel-style progress bar, loading text, and percent numbers
+that follow the real progress of the startup asset loader.
 """
 
 import pygame
-import os
-from common import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, ROOT_PATH
+import assets
+from common import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, music
 
 
-# Draw the loading screen while the game starts.
-def show_loading_screen(screen, font):
+# Draw the loading screen until the loader has finished.
+# loader is an assets.BackgroundLoader (None shows a full bar once).
+def show_loading_screen(screen, font, loader=None):
     WHITE_COLOR = (255, 255, 255)  # White for all text and shapes
 
     BAR_WIDTH = 600  # Width of main bar
@@ -18,86 +20,97 @@ def show_loading_screen(screen, font):
     BAR_Y = SCREEN_HEIGHT // 2 + 60
 
     # Try to load pixel-style font
-    pixel_font_path = os.path.join(
-        ROOT_PATH,
-        'media',
-        'graphics',
-        'font',
-        'Pixeboy.ttf'
-    )
-
     try:
-        pixel_font_large = pygame.font.Font(pixel_font_path, 72)
-        pixel_font_small = pygame.font.Font(pixel_font_path, 48)
+        pixel_font_large = assets.load_font(72)
+        pixel_font_small = assets.load_font(48)
     except:
         # Use default font if pixel font fails
-        pixel_font_large = pygame.font.Font(None, 72)
-        pixel_font_small = pygame.font.Font(None, 48)
+        pixel_font_large = assets.load_font(72, path=None)
+        pixel_font_small = assets.load_font(48, path=None)
 
-    # Go from 0% to 100%
-    for progress in range(101):
-        screen.fill(BLACK)
+    # ---------- STATIC PARTS (drawn once) ----------
+    frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)).convert()
+    frame.fill(BLACK)
 
-        # ---------- LOADING TEXT ----------
-        loading_text = pixel_font_large.render("LOADING...", True, WHITE_COLOR)
-        loading_rect = loading_text.get_rect(
-            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)
+    # Loading text
+    loading_text = pixel_font_large.render("LOADING...", True, WHITE_COLOR)
+    loading_rect = loading_text.get_rect(
+        center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 20)
+    )
+    frame.blit(loading_text, loading_rect)
+
+    # Pixel border
+    border_thickness = 8
+    pixel_size = 10  # pixel block size for border look
+
+    # Top border
+    for x in range(BAR_X, BAR_X + BAR_WIDTH, pixel_size):
+        pygame.draw.rect(frame, WHITE_COLOR, (x, BAR_Y, pixel_size, border_thickness))
+
+    # Bottom border
+    for x in range(BAR_X, BAR_X + BAR_WIDTH, pixel_size):
+        pygame.draw.rect(
+            frame,
+            WHITE_COLOR,
+            (x, BAR_Y + BAR_HEIGHT - border_thickness, pixel_size, border_thickness)
         )
-        screen.blit(loading_text, loading_rect)
-
-        # ---------- PIXEL BORDER ----------
-        border_thickness = 8
-        pixel_size = 10  # pixel block size for border look
-
-        # Top border
-        for x in range(BAR_X, BAR_X + BAR_WIDTH, pixel_size):
-            pygame.draw.rect(screen, WHITE_COLOR, (x, BAR_Y, pixel_size, border_thickness))
-
-        # Bottom border
-        for x in range(BAR_X, BAR_X + BAR_WIDTH, pixel_size):
-            pygame.draw.rect(
-                screen,
-                WHITE_COLOR,
-                (x, BAR_Y + BAR_HEIGHT - border_thickness, pixel_size, border_thickness)
-            )
-
-        # Left border
-        for y in range(BAR_Y, BAR_Y + BAR_HEIGHT, pixel_size):
-            pygame.draw.rect(screen, WHITE_COLOR, (BAR_X, y, border_thickness, pixel_size))
-
-        # Right border
-        for y in range(BAR_Y, BAR_Y + BAR_HEIGHT, pixel_size):
-            pygame.draw.rect(
-                screen,
-                WHITE_COLOR,
-                (BAR_X + BAR_WIDTH - border_thickness, y, border_thickness, pixel_size)
-            )
 
-        # ---------- PROGRESS BAR FILL ----------
-        max_blocks = 20  # total blocks inside the bar
-        blocks_to_show = int((progress / 100) * max_blocks)
+    # Left border
+    for y in range(BAR_Y, BAR_Y + BAR_HEIGHT, pixel_size):
+        pygame.draw.rect(frame, WHITE_COLOR, (BAR_X, y, border_thickness, pixel_size))
+
+    # Right border
+    for y in range(BAR_Y, BAR_Y + BAR_HEIGHT, pixel_size):
+        pygame.draw.rect(
+            frame,
+            WHITE_COLOR,
+            (BAR_X + BAR_WIDTH - border_thickness, y, border_thickness, pixel_size)
+        )
+
+    # Block layout inside the bar
+    max_blocks = 20  # total blocks inside the bar
+    padding = 10  # space between border and blocks
+    gap_size = 10  # space between each block
 
-        if blocks_to_show > 0:
-            padding = 10  # space between border and blocks
-            gap_size = 10  # space between each block
+    total_gap_space = gap_size * (max_blocks - 1)
+    available_width = BAR_WIDTH - (border_thickness * 2) - (padding * 2) - total_gap_space
 
-            # Calculate free width for blocks
-            total_gap_space = gap_size * (max_blocks - 1)
-            available_width = BAR_WIDTH - (border_thickness * 2) - (padding * 2) - total_gap_space
+    block_width = available_width // max_blocks
+    block_height = BAR_HEIGHT - (border_thickness * 2) - (padding * 2)
 
-            block_width = available_width // max_blocks
-            block_height = BAR_HEIGHT - (border_thickness * 2) - (padding * 2)
+    clock = pygame.time.Clock()
 
-            # Draw each filled block
-            for i in range(blocks_to_show):
-                block_x = BAR_X + border_thickness + padding + (i * (block_width + gap_size))
-                block_y = BAR_Y + border_thickness + padding
-                pygame.draw.rect(screen, WHITE_COLOR, (block_x, block_y, block_width, block_height))
+    while True:
+        # Finish whatever the worker threads have decoded so far
+        if loader is None:
+            progress, done = 100, True
+        else:
+            progress = int(loader.poll() * 100)
+            done = loader.finished()
+
+        # Keep the window responsive while waiting
+        pygame.event.pump()
+
+        screen.blit(frame, (0, 0))
+
+        # ---------- PROGRESS BAR FILL ----------
+        blocks_to_show = int((progress / 100) * max_blocks)
+
+        # Draw each filled block
+        for i in range(blocks_to_show):
+            block_x = BAR_X + border_thickness + padding + (i * (block_width + gap_size))
+            block_y = BAR_Y + border_thickness + padding
+            pygame.draw.rect(screen, WHITE_COLOR, (block_x, block_y, block_width, block_height))
 
         # ---------- PERCENTAGE TEXT ----------
         percent_text = pixel_font_small.render(f"{progress}%", True, WHITE_COLOR)
         percent_rect = percent_text.get_rect(center=(SCREEN_WIDTH // 2, BAR_Y + BAR_HEIGHT + 40))
         screen.blit(percent_text, percent_rect)
 
+        music.update()
         pygame.display.flip()
-        pygame.time.wait(10)
\ No newline at end of file
+
+        if done:
+            return
+
+        clock.tick(60)
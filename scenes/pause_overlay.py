@@ -6,35 +6,9 @@ and plays the pause and unpause sounds.
 
 import pygame
 import os
-import json
-from common import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, YELLOW, ROOT_PATH
-
-# ---------- CONFIG ----------
-
-# Path to the game settings file
-config_path = "config.json"
-
-
-def current_sfx_volume():
-    """Read sound volume (0–5) from config.json and return it as 0.0–1.0."""
-    try:
-        with open(config_path, "r") as f:
-            cfg_local = json.load(f)
-
-        level = cfg_local.get("sound_volume", 5)
-
-        # Make sure the value is a number
-        try:
-            level = int(level)
-        except:
-            level = 5
-
-        # Keep volume in range and convert to percent
-        return max(0, min(5, level)) / 5.0
-
-    except:
-        return 1.0  # Default full volume if something goes wrong
-
+import assets
+import settings
+from common import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, YELLOW, ROOT_PATH, music
 
 # ---------- SOUND LOADING ----------
 
@@ -63,10 +37,15 @@ def pause_overlay(snapshot):
     # Get the game's current display surface
     screen = pygame.display.get_surface()
 
-    # Load fonts
-    font_path = os.path.join(ROOT_PATH, 'media', 'graphics', 'font', 'Pixeboy.ttf')
-    font_big = pygame.font.Font(font_path, 120)
-    font_small = pygame.font.Font(font_path, 48)
+    # Shared fonts
+    font_big = assets.load_font(120)
+    font_small = assets.load_font(48)
+
+    # Create the text to display (it never changes while paused)
+    title = font_big.render("PAUSED", True, YELLOW)
+    quit_text = font_small.render("Press Q to Quit", True, (0, 255, 255))
+    or_text = font_small.render("or", True, (0, 255, 255))
+    resume_text = font_small.render("Press Space Bar to Resume", True, (0, 255, 255))
 
     clock = pygame.time.Clock()
 
@@ -74,7 +53,7 @@ def pause_overlay(snapshot):
     screen.blit(snapshot, (0, 0))
 
     # Play pause sound once
-    vol = current_sfx_volume()
+    vol = settings.sfx_volume()
     if pause_sound and vol > 0:
         pause_sound.set_volume(vol)
         pause_sound.play()
@@ -82,12 +61,6 @@ def pause_overlay(snapshot):
     # Pause loop
     while True:
 
-        # Create the text to display
-        title = font_big.render("PAUSED", True, YELLOW)
-        quit_text = font_small.render("Press Q to Quit", True, (0, 255, 255))
-        or_text = font_small.render("or", True, (0, 255, 255))
-        resume_text = font_small.render("Press Space Bar to Resume", True, (0, 255, 255))
-
         # Draw centered text
         screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, SCREEN_HEIGHT // 2 - 150))
         screen.blit(quit_text, (SCREEN_WIDTH // 2 - quit_text.get_width() // 2, SCREEN_HEIGHT // 2 - 30))
@@ -106,7 +79,7 @@ def pause_overlay(snapshot):
 
                 # Resume game
                 if event.key == pygame.K_SPACE:
-                    vol = current_sfx_volume()
+                    vol = settings.sfx_volume()
                     if unpause_sound and vol > 0:
                         unpause_sound.set_volume(vol)
                         unpause_sound.play()
@@ -116,5 +89,6 @@ def pause_overlay(snapshot):
                 if event.key == pygame.K_q:
                     return "menu"
 
+        music.update()
         pygame.display.flip()
         clock.tick(60)
\ No newline at end of file
@@ -7,58 +7,72 @@ to press Enter or Space to begin.
 import pygame
 import os
 import sys
+import assets
 from common import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, RED, YELLOW, ROOT_PATH
 
+# Overlay surfaces as (surface, position), built on first use
+overlay_items = []
 
-# ---------- TUTORIAL OVERLAY ----------
-def show_tutorial_overlay(snapshot):
-    """Display the tutorial overlay and wait for user input."""
 
-    screen = pygame.display.get_surface()
-    clock = pygame.time.Clock()
+# ---------- ASSETS ----------
+def load_overlay_items():
+    """Load the key images and render every overlay line once."""
+    if overlay_items:
+        return overlay_items
 
     # Load pixel fonts
-    font_path = os.path.join(ROOT_PATH, 'media', 'graphics', 'font', 'Pixeboy.ttf')
-    font_big = pygame.font.Font(font_path, 72)
-    font_small = pygame.font.Font(font_path, 36)
+    font_big = assets.load_font(72)
+    font_small = assets.load_font(36)
 
-    # Load key images for tutorial
+    # Key images for tutorial
     tutorial_path = os.path.join(ROOT_PATH, 'media', 'graphics', 'tutorial')
-    arrow_img = pygame.image.load(os.path.join(tutorial_path, 'arrow_keys.png'))
-    wasd_img = pygame.image.load(os.path.join(tutorial_path, 'wasd_keys.png'))
-
-    # Scale tutorial images
-    arrow_img = pygame.transform.scale(arrow_img, (150, 150))
-    wasd_img = pygame.transform.scale(wasd_img, (150, 150))
-
-    # Loop until the player starts the game
-    while True:
+    arrow_img = assets.load_image(os.path.join(tutorial_path, 'arrow_keys.png'), (150, 150))
+    wasd_img = assets.load_image(os.path.join(tutorial_path, 'wasd_keys.png'), (150, 150))
 
-        # Show frozen background behind overlay
-        screen.blit(snapshot, (0, 0))
+    # Centered text line at height y
+    def line(font, text, color, y):
+        surf = font.render(text, True, color)
+        return surf, (SCREEN_WIDTH // 2 - surf.get_width() // 2, y)
 
+    items = [
         # Title text
-        title = font_big.render("HOW TO PLAY", True, YELLOW)
-        screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 60))
+        line(font_big, "HOW TO PLAY", YELLOW, 60),
 
         # Arrow keys
-        screen.blit(arrow_img, (SCREEN_WIDTH // 2 - 220, 180))
-        arrow_text = font_small.render("Use ARROW KEYS to move", True, WHITE)
-        screen.blit(arrow_text, (SCREEN_WIDTH // 2 - arrow_text.get_width() // 2, 340))
+        (arrow_img, (SCREEN_WIDTH // 2 - 220, 180)),
+        line(font_small, "Use ARROW KEYS to move", WHITE, 340),
 
         # WASD keys
-        screen.blit(wasd_img, (SCREEN_WIDTH // 2 + 70, 180))
-        wasd_text = font_small.render("or use A and D keys", True, WHITE)
-        screen.blit(wasd_text, (SCREEN_WIDTH // 2 - wasd_text.get_width() // 2, 340))
+        (wasd_img, (SCREEN_WIDTH // 2 + 70, 180)),
+        line(font_small, "or use A and D keys", WHITE, 340),
 
         # Main instructions
-        space_text = font_small.render("SPACE to launch the ball", True, WHITE)
-        esc_text = font_small.render("ESC to pause the game", True, WHITE)
-        start_text = font_small.render("PRESS ENTER OR SPACE TO BEGIN", True, RED)
+        line(font_small, "SPACE to launch the ball", WHITE, 400),
+        line(font_small, "ESC to pause the game", WHITE, 440),
+        line(font_small, "PRESS ENTER OR SPACE TO BEGIN", RED, 510),
+    ]
+
+    overlay_items.extend(item for item in items if item[0] is not None)
+    return overlay_items
+
+
+# ---------- TUTORIAL OVERLAY ----------
+def show_tutorial_overlay(snapshot):
+    """Display the tutorial overlay and wait for user input."""
+
+    screen = pygame.display.get_surface()
+    clock = pygame.time.Clock()
+
+    items = load_overlay_items()
+
+    # Loop until the player starts the game
+    while True:
+
+        # Show frozen background behind overlay
+        screen.blit(snapshot, (0, 0))
 
-        screen.blit(space_text, (SCREEN_WIDTH // 2 - space_text.get_width() // 2, 400))
-        screen.blit(esc_text, (SCREEN_WIDTH // 2 - esc_text.get_width() // 2, 440))
-        screen.blit(start_text, (SCREEN_WIDTH // 2 - start_text.get_width() // 2, 510))
+        for surface, pos in items:
+            screen.blit(surface, pos)
 
         # Input handling
         for event in pygame.event.get():
@@ -74,4 +88,4 @@ def show_tutorial_overlay(snapshot):
                     return
 
         pygame.display.flip()
-        clock.tick(60)
\ No newline at end of file
+        clock.tick(60)
@@ -7,60 +7,43 @@ button drawing, typewriter text animation, and sound effects.
 import pygame
 import sys
 import os
-import json
+import assets
+import settings
 from common import SCREEN_WIDTH, SCREEN_HEIGHT, BLACK, WHITE, RED, ORANGE, ROOT_PATH
 
 # Initialize Pygame
 pygame.init()
 pygame.mixer.init()
 
-# ---------- SOUND LOADING ----------
-try:
-    game_over_sound = pygame.mixer.Sound(os.path.join(ROOT_PATH, "media", "audio", "media_audio_game_over.wav"))
-    win_sound = pygame.mixer.Sound(os.path.join(ROOT_PATH, "media", "audio", "media_audio_win.wav"))
-    menu_click_sound = pygame.mixer.Sound(os.path.join(ROOT_PATH, "media", "audio", "media_audio_selection_click.wav"))
-except:
-    print("Warning: Could not load game over or menu sounds.")
-    game_over_sound = None
-    win_sound = None
-    menu_click_sound = None
+# ---------- SOUND FILES ----------
+# Loaded through the shared cache when first needed (or by the startup loader)
+GAME_OVER_SOUND = os.path.join(ROOT_PATH, "media", "audio", "media_audio_game_over.wav")
+WIN_SOUND = os.path.join(ROOT_PATH, "media", "audio", "media_audio_win.wav")
+MENU_CLICK_SOUND = os.path.join(ROOT_PATH, "media", "audio", "media_audio_selection_click.wav")
+SOUND_FILES = [GAME_OVER_SOUND, WIN_SOUND, MENU_CLICK_SOUND]
 
 # Colors
 BLUE = (18, 89, 202)
 YELLOW = (254, 175, 54)
 
-# Config file for sound volume
-config_path = "config.json"
-
-
-# ---------- SOUND VOLUME ----------
-def current_sfx_volume():
-    """Read the sound volume from config (0–5) and convert it to a usable value (0.0–1.0)."""
-    try:
-        with open(config_path, "r") as f:
-            cfg_local = json.load(f)
-        level = cfg_local.get("sound_volume", 5)
-        try:
-            level = int(level)
-        except:
-            level = 5
-        return max(0, min(5, level)) / 5.0
-    except:
-        return 1.0
-
 
 # ---------- FONT & GRAPHICS ----------
 def load_custom_font(size, bold=False):
-    """Load the Pixeboy font used throughout the game."""
-    font_path = os.path.join(ROOT_PATH, 'media', 'graphics', 'font', 'Pixeboy.ttf')
-    return pygame.font.Font(font_path, size)
+    """Get the Pixeboy font used throughout the game (shared, loaded once per size)."""
+    return assets.load_font(size)
 
 
 def draw_retro_background(screen):
-    """Draw the pixel retro background grid."""
-    background = pygame.image.load(os.path.join(ROOT_PATH, 'media', 'graphics', 'background', 'back-grid.png'))
-    background = pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
-    screen.blit(background, (0, 0))
+    """Draw the pixel retro background grid (scaled and converted once)."""
+    background = assets.load_image(
+        os.path.join(ROOT_PATH, 'media', 'graphics', 'background', 'back-grid.png'),
+        (SCREEN_WIDTH, SCREEN_HEIGHT),
+        alpha=False
+    )
+    if background:
+        screen.blit(background, (0, 0))
+    else:
+        screen.fill(BLACK)
 
 
 # ---------- UI DRAW FUNCTIONS ----------
@@ -149,27 +132,30 @@ def get_player_initials(screen, score):
     max_letters = 3
     entering_name = True
 
+    # Text that doesn't change while typing
+    score_text = load_custom_font(40).render(f"SCORE: {score}", True, BLUE)
+    title = load_custom_font(90).render("ENTER INITIALS", True, YELLOW)
+    hint = load_custom_font(40).render("Press ENTER when done", True, ORANGE)
+    initials_font = load_custom_font(100)
+    menu_click_sound = assets.load_sound(MENU_CLICK_SOUND)
+
     while entering_name:
 
         draw_retro_background(screen)
 
-        score_text = load_custom_font(40).render(f"SCORE: {score}", True, BLUE)
         screen.blit(score_text, score_text.get_rect(centerx=SCREEN_WIDTH // 2, top=100))
-
-        title = load_custom_font(90).render("ENTER INITIALS", True, YELLOW)
         screen.blit(title, title.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120)))
 
-        initials_display = load_custom_font(100).render(initials or "_", True, WHITE)
+        initials_display = initials_font.render(initials or "_", True, WHITE)
         screen.blit(initials_display, initials_display.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)))
 
-        hint = load_custom_font(40).render("Press ENTER when done", True, ORANGE)
         screen.blit(hint, hint.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120)))
 
         for ev in pygame.event.get():
 
             # Quit window
             if ev.type == pygame.QUIT:
-                vol = current_sfx_volume()
+                vol = settings.sfx_volume()
                 if menu_click_sound and vol > 0:
                     menu_click_sound.set_volume(vol)
                     menu_click_sound.play()
@@ -198,7 +184,10 @@ def end_screen(screen, win=True, score=500):
     pygame.mouse.set_visible(True)
     pygame.display.set_caption("Congratulations!" if win else "Game Over")
 
-    vol = current_sfx_volume()
+    vol = settings.sfx_volume()
+    win_sound = assets.load_sound(WIN_SOUND)
+    game_over_sound = assets.load_sound(GAME_OVER_SOUND)
+    menu_click_sound = assets.load_sound(MENU_CLICK_SOUND)
 
     if win and win_sound and vol > 0:
         win_sound.set_volume(vol)
@@ -228,12 +217,17 @@ def end_screen(screen, win=True, score=500):
     running = True
     initials = ""
 
+    # Text and surfaces reused every frame
+    score_text = load_custom_font(40).render(f"SCORE: {score}", True, BLUE)
+    instruction_text = load_custom_font(48).render("Play Again?", True, WHITE)
+    button_font = load_custom_font(48)
+    button_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+
     while running:
 
         draw_retro_background(screen)
 
         # Score display
-        score_text = load_custom_font(40).render(f"SCORE: {score}", True, BLUE)
         screen.blit(score_text, score_text.get_rect(centerx=SCREEN_WIDTH // 2, top=100))
 
         # Typewriter animation logic
@@ -266,18 +260,15 @@ def end_screen(screen, win=True, score=500):
 
         # Draw YES/NO buttons only after initials entered
         if typewriter_done and initials:
-            instruction_text = load_custom_font(48).render("Play Again?", True, WHITE)
             instruction_text.set_alpha(buttons_alpha)
             screen.blit(instruction_text, instruction_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10)))
 
-            font = load_custom_font(48)
-
             # Separate surface so the buttons can fade in
-            temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            yes_button = draw_button(temp_surface, "YES", font, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100), selected == "YES")
-            no_button = draw_button(temp_surface, "NO", font, (SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 + 100), selected == "NO")
-            temp_surface.set_alpha(buttons_alpha)
-            screen.blit(temp_surface, (0, 0))
+            button_surface.fill((0, 0, 0, 0))
+            yes_button = draw_button(button_surface, "YES", button_font, (SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 + 100), selected == "YES")
+            no_button = draw_button(button_surface, "NO", button_font, (SCREEN_WIDTH // 2 + 100, SCREEN_HEIGHT // 2 + 100), selected == "NO")
+            button_surface.set_alpha(buttons_alpha)
+            screen.blit(button_surface, (0, 0))
 
         # Mouse cursor changes over buttons
         mouse_pos = pygame.mouse.get_pos()
@@ -303,21 +294,21 @@ def end_screen(screen, win=True, score=500):
 
                 elif event.key in [pygame.K_LEFT, pygame.K_a]:
                     selected = "YES"
-                    vol = current_sfx_volume()
+                    vol = settings.sfx_volume()
                     if menu_click_sound and vol > 0:
                         menu_click_sound.set_volume(vol)
                         menu_click_sound.play()
 
                 elif event.key in [pygame.K_RIGHT, pygame.K_d]:
                     selected = "NO"
-                    vol = current_sfx_volume()
+                    vol = settings.sfx_volume()
                     if menu_click_sound and vol > 0:
                         menu_click_sound.set_volume(vol)
                         menu_click_sound.play()
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if yes_button and yes_button.collidepoint(event.pos):
-                    vol = current_sfx_volume()
+                    vol = settings.sfx_volume()
                     if menu_click_sound and vol > 0:
                         menu_click_sound.set_volume(vol)
                         menu_click_sound.play()
@@ -326,7 +317,7 @@ def end_screen(screen, win=True, score=500):
                     return True, initials
 
                 elif no_button and no_button.collidepoint(event.pos):
-                    vol = current_sfx_volume()
+                    vol = settings.sfx_volume()
                     if menu_click_sound and vol > 0:
                         menu_click_sound.set_volume(vol)
                         menu_click_sound.play()
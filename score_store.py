@@ -0,0 +1,188 @@
+"""
+This file holds the binary score stores.
+Every finished game is appended to a data file as one fixed-size record,
+so old scores are never rewritten. A small index file next to it keeps
+the current top 10 in order, so reading the table never reads or sorts
+the whole history. The leaderboard (leaderboard.py) now keeps the scores;
+it reads these stores once, when its database is first created.
+"""
+
+import os
+import bisect
+import heapq
+import struct
+
+# ---------- FILE PATHS ----------
+TODAY_PATH = "scores_today.dat"
+ALLTIME_PATH = "scores_alltime.dat"
+
+# ---------- FILE FORMAT ----------
+# One score: initials (3 letters, zero padded), score, time in seconds
+RECORD = struct.Struct("<3sxId")
+
+# Index header: magic, version, number of records the index covers
+INDEX_HEADER = struct.Struct("<4sBI")
+INDEX_MAGIC = b"BKSI"
+INDEX_VERSION = 1
+
+TOP_N = 10  # scores kept in the index
+
+
+# ---------- RECORDS ----------
+def _pack(initials, score, time):
+    return RECORD.pack(initials.encode("ascii", "replace")[:3], score, time)
+
+
+def _unpack(data, offset=0):
+    initials, score, time = RECORD.unpack_from(data, offset)
+    return initials.rstrip(b"\0").decode("ascii", "replace"), score, time
+
+
+def _sort_key(entry):
+    # Highest score first, then fastest time
+    return -entry[1], entry[2]
+
+
+# ---------- SCORE STORE CLASS ----------
+class ScoreStore:
+    """Append-only score file with a maintained top-N index."""
+
+    def __init__(self, path, legacy_path=None, top_n=TOP_N):
+        self.path = path
+        self.index_path = os.path.splitext(path)[0] + ".idx"
+        self.top_n = top_n
+
+        self.count = 0  # records in the data file
+        self._top = []  # [(sort key, entry)] kept sorted, at most top_n long
+
+        if not os.path.exists(path) and legacy_path and os.path.exists(legacy_path):
+            self._migrate(legacy_path)
+
+        self._open()
+
+    def __len__(self):
+        return self.count
+
+    # ---------- READING ----------
+    def top(self, n=TOP_N):
+        """Return the best n scores as (initials, score, time), best first."""
+        return [entry for _, entry in self._top[:n]]
+
+    def entries(self):
+        """Yield every stored score in the order it was added."""
+        try:
+            with open(self.path, "rb") as f:
+                while True:
+                    data = f.read(RECORD.size * 512)
+                    if not data:
+                        return
+                    for offset in range(0, len(data) - RECORD.size + 1, RECORD.size):
+                        yield _unpack(data, offset)
+        except OSError:
+            return
+
+    # ---------- WRITING ----------
+    def add(self, initials, score, time):
+        """Append one score and update the index."""
+        entry = (initials[:3], int(score), float(time))
+
+        try:
+            with open(self.path, "ab") as f:
+                f.write(_pack(*entry))
+        except OSError as e:
+            print(f"Warning: Could not save score to {self.path} - {e}")
+            return
+
+        self.count += 1
+
+        item = (_sort_key(entry), entry)
+        if len(self._top) < self.top_n or item < self._top[-1]:
+            bisect.insort(self._top, item)
+            del self._top[self.top_n:]
+
+        self._save_index()
+
+    def clear(self):
+        """Remove every score (e.g. today's scores on a new day)."""
+        self.count = 0
+        self._top = []
+        try:
+            open(self.path, "wb").close()
+        except OSError as e:
+            print(f"Warning: Could not clear {self.path} - {e}")
+        self._save_index()
+
+    # ---------- INDEX ----------
+    def _open(self):
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            size = 0
+
+        # A record cut off by a crash mid-write is dropped
+        self.count = size // RECORD.size
+        if size % RECORD.size:
+            try:
+                with open(self.path, "r+b") as f:
+                    f.truncate(self.count * RECORD.size)
+            except OSError:
+                pass
+
+        if not self._load_index():
+            self._rebuild_index()
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            magic, version, count = INDEX_HEADER.unpack_from(data, 0)
+        except (OSError, struct.error):
+            return False
+
+        if magic != INDEX_MAGIC or version != INDEX_VERSION or count != self.count:
+            return False
+
+        entries = [
+            _unpack(data, offset)
+            for offset in range(INDEX_HEADER.size, len(data) - RECORD.size + 1, RECORD.size)
+        ]
+        self._top = [(_sort_key(entry), entry) for entry in entries[:self.top_n]]
+        return True
+
+    def _rebuild_index(self):
+        # One pass over the history, keeping only the best top_n
+        best = heapq.nsmallest(self.top_n, self.entries(), key=_sort_key)
+        self._top = [(_sort_key(entry), entry) for entry in best]
+        self._save_index()
+
+    def _save_index(self):
+        parts = [INDEX_HEADER.pack(INDEX_MAGIC, INDEX_VERSION, self.count)]
+        parts.extend(_pack(*entry) for _, entry in self._top)
+
+        temp_path = self.index_path + ".tmp"
+        try:
+            with open(temp_path, "wb") as f:
+                f.write(b"".join(parts))
+            os.replace(temp_path, self.index_path)
+        except OSError:
+            print(f"Warning: Could not save {self.index_path}")
+
+    # ---------- MIGRATION ----------
+    def _migrate(self, legacy_path):
+        records = []
+        try:
+            with open(legacy_path, "r", encoding="utf8") as f:
+                for line in f:
+                    parts = line.strip().split()
+                    if len(parts) != 3:
+                        continue
+                    try:
+                        records.append(_pack(parts[0].upper()[:3], int(parts[1]), float(parts[2])))
+                    except (ValueError, struct.error):
+                        continue
+
+            with open(self.path, "wb") as f:
+                f.write(b"".join(records))
+        except OSError as e:
+            print(f"Warning: Could not import {legacy_path} - {e}")
+
@@ -0,0 +1,167 @@
+"""
+This file holds the game settings (config.json) in memory.
+The file is read once at startup, every scene reads values from here,
+and changes are written back a moment later in one atomic save.
+Other modules can subscribe to a setting to react when it changes.
+"""
+
+import os
+import json
+import atexit
+import threading
+
+# ---------- FILE PATHS ----------
+CONFIG_PATH = "config.json"
+DEFAULT_CONFIG_PATH = "config.default.json"
+
+# Used if config.default.json is missing too
+FALLBACK_DEFAULTS = {
+    "tutorial_enabled": True,
+    "show_fps": False,
+    "mouse_enabled": False,
+    "last_character": 0,
+    "sound_volume": 3,
+    "music_volume": 3
+}
+
+# Seconds to wait after the last change before writing the file
+SAVE_DELAY = 0.5
+
+# ---------- STATE ----------
+_values = {}
+_subscribers = {}  # key -> list of callbacks taking the new value
+_lock = threading.Lock()
+_save_timer = None
+_dirty = False
+
+
+# ---------- LOADING ----------
+def _read_json(path):
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+def load():
+    """Read config.json (filling missing keys from the defaults) into memory."""
+    defaults = _read_json(DEFAULT_CONFIG_PATH) or FALLBACK_DEFAULTS
+    stored = _read_json(CONFIG_PATH)
+
+    _values.clear()
+    _values.update(defaults)
+    if stored:
+        _values.update(stored)
+
+    # Create the file, or add keys that were missing from it
+    if stored is None or any(key not in stored for key in defaults):
+        schedule_save()
+
+
+# ---------- READING ----------
+def get(key, default=None):
+    """Return the raw value of a setting."""
+    return _values.get(key, default)
+
+
+def get_int(key, default=0, low=None, high=None):
+    """Return a setting as an int, clamped to [low, high] if given."""
+    try:
+        value = int(_values.get(key, default))
+    except (TypeError, ValueError):
+        value = default
+
+    if low is not None:
+        value = max(low, value)
+    if high is not None:
+        value = min(high, value)
+    return value
+
+
+def get_bool(key, default=False):
+    """Return a setting as a bool."""
+    return bool(_values.get(key, default))
+
+
+def sfx_volume():
+    """Sound effect volume (0–5 in the settings menu) as 0.0–1.0."""
+    return get_int("sound_volume", 5, 0, 5) / 5.0
+
+
+def music_level():
+    """Music volume as the 0–5 menu level."""
+    return get_int("music_volume", 5, 0, 5)
+
+
+# ---------- CHANGING ----------
+def set(key, value):
+    """Change a setting, notify its subscribers and schedule a save."""
+    if key in _values and _values[key] == value:
+        return
+
+    _values[key] = value
+    schedule_save()
+
+    for callback in _subscribers.get(key, []):
+        try:
+            callback(value)
+        except Exception as e:
+            print(f"Warning: Setting '{key}' listener failed - {e}")
+
+
+def setdefault(key, value):
+    """Add a setting only if it doesn't exist yet (no notification)."""
+    if key not in _values:
+        _values[key] = value
+        schedule_save()
+    return _values[key]
+
+
+def subscribe(key, callback):
+    """Call callback(new_value) every time key changes."""
+    _subscribers.setdefault(key, []).append(callback)
+
+
+# ---------- SAVING ----------
+def schedule_save():
+    """Save once no further change has happened for SAVE_DELAY seconds."""
+    global _save_timer, _dirty
+
+    with _lock:
+        _dirty = True
+        if _save_timer is not None:
+            _save_timer.cancel()
+        _save_timer = threading.Timer(SAVE_DELAY, flush)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def flush():
+    """Write pending changes now. Writes a temp file and swaps it in."""
+    global _save_timer, _dirty
+
+    with _lock:
+        if _save_timer is not None:
+            _save_timer.cancel()
+            _save_timer = None
+        if not _dirty:
+            return
+        _dirty = False
+        snapshot = dict(_values)
+
+        temp_path = CONFIG_PATH + ".tmp"
+        try:
+            with open(temp_path, "w") as f:
+                json.dump(snapshot, f, indent=2)
+                f.write("\n")
+            os.replace(temp_path, CONFIG_PATH)
+        except OSError:
+            print("Warning: Could not save config.json")
+
+
+# Make sure a pending save isn't lost when the game closes
+atexit.register(flush)
+
+load()
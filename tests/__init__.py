@@ -0,0 +1,4 @@
+"""
+Correctness tests for the game's headless core.
+Run them with "python -m pytest tests".
+"""
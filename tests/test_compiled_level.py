@@ -0,0 +1,60 @@
+"""
+Compiled levels must build the same bricks from LEVEL_LAYOUTS and from
+level files.
+"""
+
+import json
+
+import pytest
+
+from objects.compiled_level import CompiledLevel
+from scenes import breakout
+from scenes.levels import get_level_pattern
+
+WIDTH = 1200
+TOP = 100
+
+
+@pytest.fixture(autouse=True)
+def display():
+    breakout.init_headless()
+
+
+def write_level(tmp_path, layout):
+    path = tmp_path / "level.json"
+    path.write_text(json.dumps(layout), encoding="utf8")
+    return str(path)
+
+
+@pytest.mark.parametrize("level", [1, 3, 5])
+def test_file_matches_layout(tmp_path, level):
+    layout = get_level_pattern(level)
+    compiled = CompiledLevel(layout, WIDTH, TOP)
+    loaded = CompiledLevel.from_file(write_level(tmp_path, layout), WIDTH, TOP)
+
+    for name in ("rows", "cols", "xs", "ys", "types", "colors", "hps"):
+        assert getattr(loaded, name) == getattr(compiled, name)
+
+
+def test_bricks_get_packed_hp():
+    compiled = CompiledLevel([[1, 2, (2, 4), 0]], WIDTH, TOP)
+    grid = compiled.build_grid()
+
+    assert len(compiled.hps) == 3
+    for block, hp in zip(sorted(grid, key=lambda b: b.rect.x), compiled.hps):
+        assert block.hp == block.max_hp == hp
+        assert hp == (2 if block.block_type == 2 else 1)
+
+
+def test_bad_file(tmp_path):
+    with pytest.raises(ValueError):
+        CompiledLevel.from_file(write_level(tmp_path, {"rows": []}), WIDTH, TOP)
+
+
+def test_level_loaded_from_file(tmp_path, monkeypatch):
+    path = write_level(tmp_path, [[0, 1, 1, 0], [(2, 3)] * 4])
+    monkeypatch.setattr(breakout, "get_level_pattern", lambda level: path)
+    monkeypatch.setattr(breakout, "compiled_levels", {})
+
+    blocks = breakout.define_blocks(None, 1)
+    assert len(blocks) == 6
@@ -0,0 +1,73 @@
+"""
+The alias-table drop sampler must match the chances in scenes/levels.py.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from objects.drop_sampler import DropSampler
+from scenes.levels import DROP_TABLES, LEVEL_SETTINGS, get_drop_table
+
+SAMPLES = 200_000
+
+
+@pytest.mark.parametrize("level", range(1, len(LEVEL_SETTINGS) + 1))
+def test_sample_matches_table(level):
+    sampler = DropSampler(get_drop_table(level))
+    names, counts = np.unique(sampler.sample(SAMPLES, np.random.default_rng(1)), return_counts=True)
+
+    drawn = dict(zip(names.tolist(), counts / SAMPLES))
+    for item, chance in sampler.chances.items():
+        assert drawn.get(item, 0.0) == pytest.approx(chance, abs=0.005)
+
+
+def test_pick_matches_table():
+    sampler = DropSampler(get_drop_table(1))
+    rand = random.Random(1)
+    counts = {}
+    for _ in range(SAMPLES):
+        item = sampler.pick(rand)
+        counts[item] = counts.get(item, 0) + 1
+
+    for item, chance in sampler.chances.items():
+        assert counts[item] / SAMPLES == pytest.approx(chance, abs=0.005)
+
+
+def test_zero_chance_never_drops():
+    sampler = DropSampler({"coin": 1.0, "slow": 0.0, "nothing": 3.0})
+    assert "slow" not in sampler.items
+    assert "slow" not in set(sampler.sample(10_000, np.random.default_rng(2)).tolist())
+
+
+def test_bad_tables():
+    with pytest.raises(ValueError):
+        DropSampler({"coin": 0.0})
+    with pytest.raises(ValueError):
+        DropSampler({"coin": 1.0, "nothing": -0.5})
+
+
+# The rates every level played with before drops moved to alias tables
+ORIGINAL_DROP_TABLE = {
+    "coin": 0.20,
+    "triple_ball": 0.10,
+    "blast": 0.10,
+    "fireball": 0.15,
+    "small_paddle": 0.05,
+    "big_paddle": 0.10,
+    "slow": 0.05,
+    "shield": 0.05,
+    "reverse": 0.05,
+    "nothing": 0.15
+}
+
+
+@pytest.mark.parametrize("level", range(1, len(LEVEL_SETTINGS) + 1))
+def test_levels_keep_original_rates(level):
+    assert get_drop_table(level) == ORIGINAL_DROP_TABLE
+
+
+def test_level_tables_exist():
+    for settings in LEVEL_SETTINGS:
+        assert settings.get("drops", "standard") in DROP_TABLES
@@ -0,0 +1,50 @@
+"""
+A new leaderboard database must import the scores kept before it.
+"""
+
+import pytest
+
+import leaderboard
+from score_store import ScoreStore, ALLTIME_PATH, TODAY_PATH
+
+
+@pytest.fixture
+def folder(tmp_path, monkeypatch):
+    # Old score files and the new database all live in the game folder
+    monkeypatch.chdir(tmp_path)
+    leaderboard.close()
+    yield tmp_path
+    leaderboard.close()
+
+
+def test_imports_binary_stores(folder):
+    history = ScoreStore(ALLTIME_PATH)
+    for entry in [("ABC", 900, 41.5), ("XYZ", 1500, 60.25), ("JOE", 900, 30.0)]:
+        history.add(*entry)
+    ScoreStore(TODAY_PATH)
+
+    leaderboard.connect()
+    assert leaderboard.top_scores() == [("XYZ", 1500, 60.25), ("JOE", 900, 30.0), ("ABC", 900, 41.5)]
+
+
+def test_imports_text_files(folder):
+    (folder / leaderboard.LEGACY_ALLTIME_TXT).write_text("abc 900 41.5\nbad line\nXYZ 1500 60.25\n")
+
+    leaderboard.connect()
+    assert leaderboard.top_scores() == [("XYZ", 1500, 60.25), ("ABC", 900, 41.5)]
+
+
+def test_todays_scores_keep_today(folder):
+    # JOE played 900 in 30.0 once before today and once today
+    (folder / leaderboard.LEGACY_ALLTIME_TXT).write_text(
+        "JOE 900 30.0\nABC 500 20.0\nJOE 900 30.0\nXYZ 700 25.0\n"
+    )
+    (folder / leaderboard.LEGACY_TODAY_TXT).write_text("JOE 900 30.0\nXYZ 700 25.0\nNEW 100 9.0\n")
+
+    leaderboard.connect()
+    assert leaderboard.top_scores(day=leaderboard.today()) == [
+        ("JOE", 900, 30.0), ("XYZ", 700, 25.0), ("NEW", 100, 9.0)
+    ]
+    assert leaderboard.top_scores() == [
+        ("JOE", 900, 30.0), ("JOE", 900, 30.0), ("XYZ", 700, 25.0), ("ABC", 500, 20.0), ("NEW", 100, 9.0)
+    ]
@@ -0,0 +1,69 @@
+"""
+Crossfades must start the next track from the game loop, not a thread.
+"""
+
+import threading
+
+import pygame
+import pytest
+
+from common import MusicPlayer
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    # A fake mixer.music and clock, so no sound device is needed
+    state = {"ticks": 0, "busy": False, "started": []}
+
+    def start(player, path, loops, fade_ms):
+        state["started"].append(path)
+        state["busy"] = True
+
+    monkeypatch.setattr(pygame.time, "get_ticks", lambda: state["ticks"])
+    monkeypatch.setattr(pygame.mixer.music, "get_busy", lambda: state["busy"])
+    monkeypatch.setattr(pygame.mixer.music, "fadeout", lambda ms: None)
+    monkeypatch.setattr(pygame.mixer.music, "stop", lambda: None)
+    monkeypatch.setattr(MusicPlayer, "_start", start)
+    return state
+
+
+def test_crossfade_starts_from_update(mixer):
+    player = MusicPlayer()
+    threads = threading.active_count()
+
+    player.play("menu.wav")
+    assert mixer["started"] == ["menu.wav"]
+
+    player.play("game.wav", fade_ms=600)
+    assert threading.active_count() == threads
+
+    mixer["ticks"] = 599
+    player.update()
+    assert mixer["started"] == ["menu.wav"]
+
+    mixer["ticks"] = 600
+    player.update()
+    player.update()
+    assert mixer["started"] == ["menu.wav", "game.wav"]
+
+
+def test_next_track_starts_when_fade_ends_early(mixer):
+    player = MusicPlayer()
+    player.play("menu.wav")
+    player.play("game.wav")
+
+    mixer["busy"] = False
+    player.update()
+    assert mixer["started"] == ["menu.wav", "game.wav"]
+
+
+def test_stop_cancels_waiting_track(mixer):
+    player = MusicPlayer()
+    player.play("menu.wav")
+    player.play("game.wav")
+    player.stop()
+
+    mixer["ticks"] = 10_000
+    player.update()
+    assert mixer["started"] == ["menu.wav"]
+    assert player.current is None
@@ -0,0 +1,61 @@
+"""
+Objects handed out again by the object pools must behave like new ones.
+"""
+
+import pytest
+
+from scenes import breakout
+
+
+@pytest.fixture
+def world():
+    breakout.init_headless()
+    world = breakout.new_world(1)
+    yield world
+    breakout.release_pooled(world)
+
+
+# (pool, world list, old spawn args, new spawn args)
+CASES = [
+    ("coin_pool", "coins", (500, 130), (100, 650)),
+    ("powerup_pool", "powerups", (500, 130, "slow"), (100, 650, "blast")),
+    ("blast_pool", "blasts", (500, 130), (100, 750)),
+    ("fireball_pool", "fireballs", (500, 130, 500, 0), (100, 750, 600, 200)),
+]
+
+
+@pytest.mark.parametrize("pool_name, group, old_args, new_args", CASES,
+                         ids=[case[0] for case in CASES])
+def test_recycled_object_drawn_at_spawn(world, pool_name, group, old_args, new_args):
+    pool = getattr(breakout, pool_name)
+    items = getattr(world, group)
+
+    # First use: it moves for a step, then goes back to the pool
+    old = pool.acquire(*old_args)
+    items.append(old)
+    breakout.remember_positions(world)
+    pool.release_at(items, 0)
+
+    # Reused during the next step: it has no position before that step
+    new = pool.acquire(*new_args)
+    assert new is old
+    items.append(new)
+
+    with breakout.interpolated(world, 0.5):
+        assert (new.x, new.y) == new_args[:2]
+
+
+def test_counters(world):
+    pool = breakout.blast_pool
+    pool.reset_peak()
+    live = pool.live
+
+    shots = [pool.acquire(10, 700) for _ in range(3)]
+    world.blasts.extend(shots)
+    assert pool.live == live + 3
+    assert pool.peak == live + 3
+
+    pool.release_at(world.blasts, 0)
+    assert pool.live == live + 2
+    assert pool.peak == live + 3
+    assert world.blasts == [shots[2], shots[1]]  # swap-remove: last one moves up
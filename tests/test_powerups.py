@@ -0,0 +1,23 @@
+"""
+Power-up effects must last as long as their duration settings say.
+"""
+
+import pytest
+
+from scenes import breakout
+
+
+@pytest.mark.parametrize("state", ["small", "big"])
+def test_paddle_power_lasts_its_duration(state):
+    breakout.init_headless()
+    world = breakout.new_world(1)
+
+    breakout.paddle_state = state
+    breakout.paddle_state_timer = breakout.paddle_power_duration
+
+    steps = 0
+    while breakout.paddle_state != "normal":
+        breakout.step(world, breakout.make_inputs())
+        steps += 1
+
+    assert steps == breakout.paddle_power_duration
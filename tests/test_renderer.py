@@ -0,0 +1,36 @@
+"""
+Particle areas must cover what was drawn, and only nearby ones merge.
+"""
+
+import pygame
+
+from objects.particle import ParticleSystem
+from objects.renderer import merge_rects
+
+
+def test_merge_keeps_far_rects_apart():
+    near = [pygame.Rect(100, 100, 10, 10), pygame.Rect(112, 104, 10, 10), pygame.Rect(125, 100, 5, 5)]
+    far = pygame.Rect(600, 400, 10, 10)
+
+    merged = merge_rects(near + [far], gap=8)
+    assert sorted(map(tuple, merged)) == [(100, 100, 30, 14), tuple(far)]
+
+
+def test_particle_areas_cover_drawing():
+    screen = pygame.Surface((400, 300))
+    particles = ParticleSystem()
+    particles.emit_burst(80, 80, (255, 200, 50), 20)
+    particles.emit_sparks(320, 220, (0, 255, 0), 10)
+    particles.update()
+
+    areas = particles.draw(screen)
+    assert len(areas) == len(particles)
+
+    covered = pygame.Surface(screen.get_size())
+    for area in merge_rects(areas, gap=8):
+        covered.fill((255, 255, 255), area)
+    drawn = pygame.surfarray.array3d(screen).any(axis=2)
+    assert not (drawn & ~pygame.surfarray.array3d(covered).any(axis=2)).any()
+
+    # The burst and the sparks are far apart, so they stay two areas
+    assert len(merge_rects(areas, gap=8)) == 2